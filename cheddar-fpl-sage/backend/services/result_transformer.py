@@ -1793,7 +1793,8 @@ def transform_analysis_results(
 
 def _transform_projection(proj) -> Dict[str, Any]:
     """Transform a CanonicalPlayerProjection to dict."""
-    if hasattr(proj, "__dict__"):
+    # Projections are slotted dataclasses (no __dict__); pass plain dicts through
+    if not isinstance(proj, dict):
         return {
             "player_id": getattr(proj, "player_id", None),
             "name": proj.name,
@@ -251,7 +251,7 @@ def create_package_info(package_dir, timestamp):
     data_info = {}
     summary_path = package_dir / "outputs" / "DATA_SUMMARY.json"
     if summary_path.exists():
-        with open(summary_path, 'r') as f:
+        with open(summary_path, 'r', encoding='utf-8') as f:
             data_summary = json.load(f)
             data_info = data_summary.get('fpl_sage_data_summary', {})
     
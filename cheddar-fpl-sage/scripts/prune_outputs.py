@@ -19,7 +19,7 @@ def load_summary(summary_path: Path):
     if not summary_path.exists():
         return []
     try:
-        return json.loads(summary_path.read_text())
+        return json.loads(summary_path.read_text(encoding="utf-8"))
     except Exception:
         return []
 
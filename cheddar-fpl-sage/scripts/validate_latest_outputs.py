@@ -15,7 +15,7 @@ REQUIRED_FIELDS = {"schema_version", "run_id", "gameweek", "season", "generated_
 
 def load_json(path: Path):
     try:
-        return json.loads(path.read_text())
+        return json.loads(path.read_text(encoding="utf-8"))
     except Exception as exc:
         raise ValueError(f"Invalid JSON in {path}: {exc}") from exc
 
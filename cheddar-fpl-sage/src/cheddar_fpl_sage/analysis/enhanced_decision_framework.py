@@ -5,6 +5,7 @@ Implementation of feedback improvements for sharper analysis output
 """
 
 import logging
+from operator import attrgetter, itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -28,6 +29,10 @@ from .decision_framework import (
 )
 
 
+# Squad slots 12-15 are the bench in FPL picks ordering
+BENCH_PLAYING_POSITIONS = frozenset({12, 13, 14, 15})
+
+
 class ChipType(Enum):
     BENCH_BOOST = "BB"
     TRIPLE_CAPTAIN = "TC"
@@ -52,6 +57,29 @@ class RiskScenario:
     mitigation_action: Optional[str] = None
 
 
+@dataclass(slots=True)
+class ReplacementCandidate:
+    """Transient replacement option built while filtering the projection set"""
+    name: str
+    position: str
+    team: str
+    price: float
+    expected_points: float
+    expected_minutes: float
+    value_score: float  # Points per million
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'position': self.position,
+            'team': self.team,
+            'price': self.price,
+            'expected_points': self.expected_points,
+            'expected_minutes': self.expected_minutes,
+            'value_score': self.value_score,
+        }
+
+
 @dataclass
 class ChipDecisionContext:
     """Context for chip timing decisions"""
@@ -124,6 +152,8 @@ class DecisionOutput:
     recovery_plan: Optional[Dict] = None
     structural_weakness_summary: Optional[Dict] = None
     optimized_xi: Any = None
+    additional_transfer_recommendations: Optional[List[Dict]] = None  # Squad-violation path only
+    post_transfer_state: Optional[Dict] = None  # Squad-violation path only
 
     def __post_init__(self):
         """Derive confidence_label and confidence_summary from confidence_score."""
@@ -185,6 +215,9 @@ class EnhancedDecisionFramework:
             "tc_setup_gameweeks_ahead": 2
         }
         self._window_context: Dict[str, Any] = {}
+        # Replacement searches memoized per projection set (one decision cycle)
+        self._replacement_cache: Dict[Tuple, List[Dict]] = {}
+        self._replacement_cache_source: Optional[CanonicalProjectionSet] = None
 
     def _derive_manager_state(self, team_data: Dict, free_transfers: int = 0) -> Dict[str, Any]:
         """Build rank-aware manager state used by solver and API transparency."""
@@ -1696,6 +1729,8 @@ class EnhancedDecisionFramework:
         
         # Cache projections for later use in candidate generation
         self._cached_projections = projections
+        self._replacement_cache = {}
+        self._replacement_cache_source = projections
         
         # Contract enforcement - validate projections first
         validation_result = validate_projection_set(projections)
@@ -3181,13 +3216,33 @@ class EnhancedDecisionFramework:
         }
         return team_map.get(team_code, f"T{team_code}")
 
+    @staticmethod
+    def _rough_gw_expected(total_points: float) -> float:
+        """Rough single-GW expectation from season total (17-GW average, floor of 4)."""
+        return max(4, total_points / 17) if total_points > 0 else 4
+
+    def _rough_tc_options(self, starters: List[Dict]) -> List[Dict]:
+        """Triple Captain candidates from available starters with rough doubled expectation."""
+        options = []
+        for player in starters:
+            if player.get('status_flag') == 'OUT':
+                continue
+            total_points = player.get('total_points', 0)
+            options.append({
+                'name': player.get('name'),
+                'team': player.get('team'),
+                'expected': self._rough_gw_expected(total_points) * 2,  # Double points
+                'total_points': total_points
+            })
+        return options
+
     def _generate_bb_vs_tc_analysis(self, team_data: Dict) -> str:
         """Generate Bench Boost vs Triple Captain comparison analysis"""
         squad = team_data.get('current_squad', [])
         bench = [p for p in squad if not p.get('is_starter')]
         starters = [p for p in squad if p.get('is_starter')]
         
-        analysis = ""
+        parts = []
         
         # Bench Boost Analysis
         bench_expected = 0
@@ -3210,53 +3265,40 @@ class EnhancedDecisionFramework:
             bench_expected += expected
             bench_players_info.append(f"  • {player.get('name')} ({player.get('team')}) - ~{expected}pts {status}")
         
-        analysis += "🪑 **BENCH BOOST OPTION:**\n"
-        analysis += f"Expected: ~{bench_expected:.0f} points from bench\n"
-        analysis += "\n".join(bench_players_info)
-        analysis += "\n*Use if: All/most bench players are nailed starters*\n\n"
+        parts.append("🪑 **BENCH BOOST OPTION:**\n")
+        parts.append(f"Expected: ~{bench_expected:.0f} points from bench\n")
+        parts.append("\n".join(bench_players_info))
+        parts.append("\n*Use if: All/most bench players are nailed starters*\n\n")
         
         # Triple Captain Analysis  
-        top_captains = []
-        for player in starters:
-            if player.get('status_flag') != 'OUT':
-                total_points = player.get('total_points', 0)
-                price = player.get('current_price', 0)
-                # Rough expected this GW
-                gw_expected = max(4, total_points / 17) if total_points > 0 else 4
-                tc_expected = gw_expected * 2  # Double points
-                top_captains.append({
-                    'name': player.get('name'),
-                    'team': player.get('team'),
-                    'expected': tc_expected,
-                    'total_points': total_points
-                })
+        top_captains = self._rough_tc_options(starters)
         
         # Sort by expected and take top 3
-        top_captains.sort(key=lambda x: x['expected'], reverse=True)
+        top_captains.sort(key=itemgetter('expected'), reverse=True)
         best_tc_expected = top_captains[0]['expected'] if top_captains else 0
         
-        analysis += "⚡ **TRIPLE CAPTAIN OPTION:**\n"
-        analysis += f"Expected: ~{best_tc_expected:.0f} points (double captain score)\n"
+        parts.append("⚡ **TRIPLE CAPTAIN OPTION:**\n")
+        parts.append(f"Expected: ~{best_tc_expected:.0f} points (double captain score)\n")
         for captain in top_captains[:3]:
-            analysis += f"  • {captain['name']} ({captain['team']}) - ~{captain['expected']:.0f}pts\n"
-        analysis += "*Use if: You have a nailed premium with high ceiling*\n\n"
+            parts.append(f"  • {captain['name']} ({captain['team']}) - ~{captain['expected']:.0f}pts\n")
+        parts.append("*Use if: You have a nailed premium with high ceiling*\n\n")
         
         # Recommendation logic
         if bench_expected >= best_tc_expected + 2:
-            analysis += f"💡 **SUGGESTION:** Bench Boost (+{bench_expected - best_tc_expected:.0f}pt advantage)\n"
+            parts.append(f"💡 **SUGGESTION:** Bench Boost (+{bench_expected - best_tc_expected:.0f}pt advantage)\n")
         elif best_tc_expected >= bench_expected + 3:
-            analysis += f"💡 **SUGGESTION:** Triple Captain (+{best_tc_expected - bench_expected:.0f}pt advantage)\n"
+            parts.append(f"💡 **SUGGESTION:** Triple Captain (+{best_tc_expected - bench_expected:.0f}pt advantage)\n")
         else:
-            analysis += "💡 **SUGGESTION:** Close call - consider fixture difficulty & rotation risk\n"
+            parts.append("💡 **SUGGESTION:** Close call - consider fixture difficulty & rotation risk\n")
         
-        return analysis
+        return "".join(parts)
 
     def _generate_bb_analysis(self, team_data: Dict) -> str:
         """Generate Bench Boost only analysis"""
         squad = team_data.get('current_squad', [])
         bench = [p for p in squad if not p.get('is_starter')]
         
-        analysis = "🪑 **BENCH BOOST AVAILABLE:**\n"
+        parts = ["🪑 **BENCH BOOST AVAILABLE:**\n"]
         bench_expected = 0
         
         for player in bench:
@@ -3273,54 +3315,44 @@ class EnhancedDecisionFramework:
                 expected = 4
                 
             bench_expected += expected
-            analysis += f"  • {player.get('name')} ({player.get('team')}) - ~{expected}pts {status}\n"
+            parts.append(f"  • {player.get('name')} ({player.get('team')}) - ~{expected}pts {status}\n")
         
-        analysis += f"Expected total: ~{bench_expected:.0f} points\n"
+        parts.append(f"Expected total: ~{bench_expected:.0f} points\n")
         
         if bench_expected >= 12:
-            analysis += "💡 **Strong bench - BB recommended**\n"
+            parts.append("💡 **Strong bench - BB recommended**\n")
         elif bench_expected >= 8:
-            analysis += "💡 **Decent bench - BB viable**\n"
+            parts.append("💡 **Decent bench - BB viable**\n")
         else:
-            analysis += "💡 **Weak bench - consider saving BB**\n"
+            parts.append("💡 **Weak bench - consider saving BB**\n")
         
-        return analysis
+        return "".join(parts)
 
     def _generate_tc_analysis(self, team_data: Dict) -> str:
         """Generate Triple Captain only analysis"""
         squad = team_data.get('current_squad', [])
         starters = [p for p in squad if p.get('is_starter')]
         
-        analysis = "⚡ **TRIPLE CAPTAIN AVAILABLE:**\n"
+        parts = ["⚡ **TRIPLE CAPTAIN AVAILABLE:**\n"]
         
-        captain_options = []
-        for player in starters:
-            if player.get('status_flag') != 'OUT':
-                total_points = player.get('total_points', 0)
-                gw_expected = max(4, total_points / 17) if total_points > 0 else 4
-                tc_expected = gw_expected * 2
-                captain_options.append({
-                    'name': player.get('name'),
-                    'team': player.get('team'),
-                    'expected': tc_expected
-                })
+        captain_options = self._rough_tc_options(starters)
         
-        captain_options.sort(key=lambda x: x['expected'], reverse=True)
+        captain_options.sort(key=itemgetter('expected'), reverse=True)
         
         for i, captain in enumerate(captain_options[:3]):
             rank = ["🥇", "🥈", "🥉"][i]
-            analysis += f"  {rank} {captain['name']} ({captain['team']}) - ~{captain['expected']:.0f}pts\n"
+            parts.append(f"  {rank} {captain['name']} ({captain['team']}) - ~{captain['expected']:.0f}pts\n")
         
         best_expected = captain_options[0]['expected'] if captain_options else 0
         
         if best_expected >= 16:
-            analysis += "💡 **High ceiling captain - TC recommended**\n"
+            parts.append("💡 **High ceiling captain - TC recommended**\n")
         elif best_expected >= 12:
-            analysis += "💡 **Decent captain - TC viable**\n"
+            parts.append("💡 **Decent captain - TC viable**\n")
         else:
-            analysis += "💡 **Low ceiling - consider saving TC**\n"
+            parts.append("💡 **Low ceiling - consider saving TC**\n")
         
-        return analysis
+        return "".join(parts)
 
     def _validate_squad_composition(self, team_data: Dict) -> List[Dict]:
         """
@@ -3367,47 +3399,120 @@ class EnhancedDecisionFramework:
                 return proj.nextGW_pts
         return 0.0
 
-    def _find_replacement_players(self, projections: CanonicalProjectionSet, player_to_replace: Dict, team_data: Dict) -> List[Dict]:
+    @staticmethod
+    def _build_squad_view(squad: List[Dict]) -> Dict[str, Any]:
+        """
+        Single pass over the squad collecting the lookups used on the urgent path.
+
+        Returns owned names (for replacement filtering) and the player_ids of
+        bench players flagged OUT (for the post-transfer bench count).
+        """
+        names = set()
+        bench_out_ids = []
+        for player in squad:
+            names.add(player.get('name', ''))
+            if player.get('status_flag') == 'OUT' and not player.get('is_starter'):
+                bench_out_ids.append(player.get('player_id'))
+        return {'names': names, 'bench_out_ids': bench_out_ids}
+
+    def _find_replacement_players(self, projections: CanonicalProjectionSet, player_to_replace: Dict, team_data: Dict,
+                                  owned_names: Optional[set] = None) -> List[Dict]:
         """Find suitable replacement players for the same position"""
         position = player_to_replace['position']
         # Fix: team_info is direct key, not nested under my_team
         bank = team_data.get('team_info', {}).get('bank', 0.5)
-        max_price = player_to_replace['price'] + bank  # Current price + available bank
+        # Current price + available bank, in integer tenths (FPL price unit) so float
+        # drift like 4.6 + 0.1 < 4.7 cannot exclude an exactly affordable player
+        max_price_tenths = round((player_to_replace['price'] + bank) * 10)
         
         # Get current squad to avoid recommending players already owned
-        current_squad_names = set()
-        # Fix: team_data structure has current_squad as direct key, not nested under my_team
-        current_squad = team_data.get('current_squad', [])
-        for player in current_squad:
-            current_squad_names.add(player.get('name', ''))
+        if owned_names is None:
+            # Fix: team_data structure has current_squad as direct key, not nested under my_team
+            owned_names = self._build_squad_view(team_data.get('current_squad', []))['names']
+        current_squad_names = owned_names
+        
+        # Multi-violation squads repeat the same position/budget search within a cycle
+        if self._replacement_cache_source is not projections:
+            self._replacement_cache = {}
+            self._replacement_cache_source = projections
+        cache_key = (position, max_price_tenths, frozenset(current_squad_names))
+        cached = self._replacement_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
         
         replacement_candidates = []
         
-        # Filter projections for same position, affordable, not owned, and not injured
+        # Filter projections for same position, affordable, likely to start, not owned, and not injured
+        # (cheap numeric comparisons first, set/tag membership only for survivors)
         for proj in projections.projections:
             if (proj.position == position and 
-                proj.current_price <= max_price and 
+                round(proj.current_price * 10) <= max_price_tenths and 
+                proj.xMins_next >= 60 and  # Only consider players likely to start
                 proj.name not in current_squad_names and
-                not proj.is_injury_risk and  # Exclude injured/unavailable players
-                proj.xMins_next >= 60):  # Only consider players likely to start
+                not proj.is_injury_risk):  # Exclude injured/unavailable players
                 
-                replacement_candidates.append({
-                    'name': proj.name,
-                    'position': proj.position,
-                    'team': proj.team,
-                    'price': proj.current_price,
-                    'expected_points': proj.nextGW_pts,
-                    'expected_minutes': proj.xMins_next,
-                    'value_score': proj.nextGW_pts / proj.current_price  # Points per million
-                })
+                replacement_candidates.append(ReplacementCandidate(
+                    name=proj.name,
+                    position=proj.position,
+                    team=proj.team,
+                    price=proj.current_price,
+                    expected_points=proj.nextGW_pts,
+                    expected_minutes=proj.xMins_next,
+                    value_score=proj.nextGW_pts / proj.current_price  # Points per million
+                ))
         
+        # Sort by expected points (descending), then by value score
+        replacement_candidates.sort(key=attrgetter('expected_points', 'value_score'), reverse=True)
         
+        # Return top 3 options (as dicts for the transfer recommendation builders)
+        top_candidates = [candidate.to_dict() for candidate in replacement_candidates[:3]]
+        self._replacement_cache[cache_key] = top_candidates
+        return list(top_candidates)
+
+    def _score_transfer_out_candidates(self, excess_players: List[Dict], injury_out_ids: set) -> List[Dict]:
+        """
+        Score excess players for transfer out: injured +100, benched +50,
+        plus an inverted price so cheaper players go first.
+        """
+        transfer_candidates = []
+        for player in excess_players:
+            current_price = player.get('current_price', 0.0)
+            is_injured = self._coerce_player_id(player.get('player_id')) in injury_out_ids
+            is_bench = player.get('playing_position') in BENCH_PLAYING_POSITIONS
+            
+            # Flags weight the score arithmetically; lower price = higher priority for transfer out
+            priority_score = 100 * is_injured + 50 * is_bench + (20 - current_price)
+            priority_reason = [
+                label for flag, label in ((is_injured, "INJURED (OUT)"), (is_bench, "benched")) if flag
+            ]
+            
+            transfer_candidates.append({
+                'player': player,
+                'name': player.get('name', 'Unknown'),
+                'position': player.get('position', 'Unknown'),
+                'price': current_price,
+                'priority_score': priority_score,
+                'reasons': priority_reason,
+                'is_injured': is_injured,
+                'is_bench': is_bench
+            })
+        return transfer_candidates
+
+    def _plan_additional_transfers(self, team_data: Dict, projections: CanonicalProjectionSet,
+                                   remaining_transfers: int, squad_fix_players: set) -> List[Dict]:
+        """Recommend uses for free transfers left after a squad-violation fix."""
+        if remaining_transfers <= 0:
+            return []
         
-        # Sort by expected points (descending), then by value score
-        replacement_candidates.sort(key=lambda x: (x['expected_points'], x['value_score']), reverse=True)
+        # Generate additional transfer recommendations for remaining free transfers
+        additional_transfers = self._recommend_transfers(team_data, remaining_transfers, projections)
         
-        # Return top 3 options
-        return replacement_candidates[:3]
+        # Filter out any transfers that conflict with the squad violation fix
+        valid_additional = [
+            t for t in (additional_transfers or [])
+            if t.get('player_name') not in squad_fix_players
+        ]
+        return valid_additional[:remaining_transfers]  # Add up to remaining transfers
 
     def _create_squad_violation_decision(self, violations: List[Dict], team_data: Dict, 
                                        projections: CanonicalProjectionSet, injury_reports: Dict) -> DecisionOutput:
@@ -3415,14 +3520,11 @@ class EnhancedDecisionFramework:
         Create URGENT decision output for squad rule violations requiring immediate transfers
         Enhanced to also recommend use of remaining free transfers
         """
+        # Resolve squad and team_info once (same fallback as _validate_squad_composition)
+        squad = team_data.get('current_squad') or team_data.get('players') or []
+        team_info = team_data.get('team_info', {})
+        squad_view = self._build_squad_view(squad)
         
-        # First try to create XI for captaincy analysis
-        optimized_xi = None
-        try:
-            optimized_xi = self._optimize_starting_xi(team_data, projections, injury_reports)
-        except ValueError:
-            # XI optimization failed, we'll skip captain/formation analysis
-            pass
         violation = violations[0]  # Handle first violation (most critical)
         team_name = violation['team']
         excess_players = violation['players']
@@ -3431,58 +3533,36 @@ class EnhancedDecisionFramework:
         squad_evidence = []
         squad_evidence.append("### 🚫 Squad Rule Check")
         player_names = [p.get('name', f"Player {p.get('player_id', 'Unknown')}") for p in violation['players']]
-        squad_evidence.append(f"{team_name}: {violation['current_count']} ({', '.join(player_names)}) ← violates max {violation['max_allowed']}")
+        violation_line = f"{team_name}: {violation['current_count']} ({', '.join(player_names)}) ← violates max {violation['max_allowed']}"
+        squad_evidence.append(violation_line)
         squad_evidence.append("")
         
         # Get available free transfers to plan remaining transfer recommendations
-        free_transfers = team_data.get('team_info', {}).get('free_transfers', 1)
+        free_transfers = team_info.get('free_transfers', 1)
         
         # Prioritize transfer out: injured players first, then bench players, then lowest value
-        transfer_candidates = []
+        # Injury reports are keyed by player_id (see _load_injury_reports) and may be None
+        injury_out_ids = {
+            player_id for player_id, report in (injury_reports or {}).items()
+            if report.status == InjuryStatus.OUT
+        }
         
-        for player in excess_players:
-            player_name = player.get('name', 'Unknown')
-            position = player.get('position', 'Unknown')
-            current_price = player.get('current_price', 0.0)
-            is_injured = player_name in injury_reports and injury_reports[player_name].get('status') == 'OUT'
-            is_bench = player.get('playing_position') in [12, 13, 14, 15]  # Bench positions
-            
-            priority_score = 0
-            priority_reason = []
-            
-            if is_injured:
-                priority_score += 100
-                priority_reason.append("INJURED (OUT)")
-            if is_bench:
-                priority_score += 50
-                priority_reason.append("benched")
-            
-            # Add negative value bonus (lower price = higher priority for transfer out)
-            priority_score += (20 - current_price)  # Invert price (lower price = higher score)
-            
-            transfer_candidates.append({
-                'player': player,
-                'name': player_name,
-                'position': position,
-                'price': current_price,
-                'priority_score': priority_score,
-                'reasons': priority_reason,
-                'is_injured': is_injured,
-                'is_bench': is_bench
-            })
+        transfer_candidates = self._score_transfer_out_candidates(excess_players, injury_out_ids)
         
         # Sort by priority (highest first)
-        transfer_candidates.sort(key=lambda x: x['priority_score'], reverse=True)
+        transfer_candidates.sort(key=itemgetter('priority_score'), reverse=True)
         top_candidate = transfer_candidates[0]
         
         # Find suitable replacement players for the same position
-        replacement_candidates = self._find_replacement_players(projections, top_candidate, team_data)
+        replacement_candidates = self._find_replacement_players(
+            projections, top_candidate, team_data, owned_names=squad_view['names']
+        )
         
         # Create transfer recommendation with CLEAN REASONING ONLY (per user requirements)
         reasoning = f"Squad rule violation detected ({team_name} players={violation['current_count']}). One forced transfer required (see Transfer Plan)."
         
         # Store evidence separately for clean display
-        squad_evidence_text = f"{team_name}: {violation['current_count']} ({', '.join(player_names)}) ← violates max {violation['max_allowed']}"
+        squad_evidence_lines = [violation_line]
         
         # Calculate post-transfer state
         post_transfer_state = {}
@@ -3493,18 +3573,19 @@ class EnhancedDecisionFramework:
             new_count = violation['current_count'] - 1
             max_allowed = violation['max_allowed']
             status = "compliant" if new_count <= max_allowed else "STILL_VIOLATION"
-            squad_evidence_text += f"\nAfter transfer: {team_name} becomes {new_count} ({status})"
+            squad_evidence_lines.append(f"After transfer: {team_name} becomes {new_count} ({status})")
             
             # Calculate bench OUT count after transfer (if forced player was on bench)
-            current_squad = team_data.get('current_squad', [])
-            bench_out_after = len([p for p in current_squad if p.get('status_flag') == 'OUT' and not p.get('is_starter') and p.get('player_id') != top_candidate['player'].get('player_id')])
+            top_candidate_id = top_candidate['player'].get('player_id')
+            bench_out_after = sum(1 for pid in squad_view['bench_out_ids'] if pid != top_candidate_id)
             
             post_transfer_state = {
                 'squad_rule_compliance': f"{team_name} count = {new_count} (ok)" if status == "compliant" else f"{team_name} count = {new_count} (STILL VIOLATION)",
                 'bench_out_count': f"Bench OUT = {bench_out_after} (ok)" if bench_out_after == 0 else f"Bench OUT = {bench_out_after}"
             }
         else:
-            squad_evidence_text += "\nDATA_ERROR: cannot produce compliant transfer"
+            squad_evidence_lines.append("DATA_ERROR: cannot produce compliant transfer")
+        squad_evidence_text = "\n".join(squad_evidence_lines)
         
         transfer_recs = [{
             'action': 'OUT',
@@ -3536,25 +3617,12 @@ class EnhancedDecisionFramework:
         # ENHANCEMENT: If additional free transfers are available, recommend strategic use
         # This will be handled separately in the Transfer Plan section, not in reasoning
         remaining_transfers = free_transfers - 1  # 1 transfer used for squad violation fix
-        additional_transfer_recs = []
-        
-        if remaining_transfers > 0:
-            # Generate additional transfer recommendations for remaining free transfers
-            additional_transfers = self._recommend_transfers(team_data, remaining_transfers, projections)
-            
-            if additional_transfers:
-                # Filter out any transfers that conflict with the squad violation fix
-                squad_fix_players = {top_candidate['name']}
-                if replacement_candidates:
-                    squad_fix_players.add(replacement_candidates[0]['name'])
-                
-                valid_additional = [
-                    t for t in additional_transfers 
-                    if t.get('player_name') not in squad_fix_players
-                ]
-                
-                if valid_additional:
-                    additional_transfer_recs.extend(valid_additional[:remaining_transfers])  # Add up to remaining transfers
+        squad_fix_players = {top_candidate['name']}
+        if replacement_candidates:
+            squad_fix_players.add(replacement_candidates[0]['name'])
+        additional_transfer_recs = self._plan_additional_transfers(
+            team_data, projections, remaining_transfers, squad_fix_players
+        )
         
         # Update the main reasoning to stay clean and short
         # No additional reasoning appended - handled in Transfer Plan section
@@ -3571,20 +3639,25 @@ class EnhancedDecisionFramework:
                 risk_level=RiskLevel.CRITICAL,
                 mitigation_action=f"Transfer out {top_candidate['name']}, in {replacement_candidates[0]['name'] if replacement_candidates else 'suitable replacement'} immediately"
             )],
-            transfer_recommendations=transfer_recs
+            transfer_recommendations=transfer_recs,
+            # Additional transfer recommendations and post-transfer state for Transfer Plan section
+            additional_transfer_recommendations=additional_transfer_recs,
+            post_transfer_state=post_transfer_state,
         )
         
-        # Store additional transfer recommendations and post-transfer state for Transfer Plan section
-        setattr(urgent_decision, 'additional_transfer_recommendations', additional_transfer_recs)
-        setattr(urgent_decision, 'post_transfer_state', post_transfer_state)
-        
-        # Add captaincy and XI analysis even for urgent transfers, if XI optimization succeeded
+        # Add captaincy and XI analysis even for urgent transfers, if XI optimization succeeded.
+        # Optimized only here, once the transfer plan is settled, since nothing above consumes it.
+        optimized_xi = None
+        try:
+            optimized_xi = self._optimize_starting_xi(team_data, projections, injury_reports)
+        except ValueError:
+            # XI optimization failed, we'll skip captain/formation analysis
+            pass
         if optimized_xi:
             urgent_decision.captaincy = self._recommend_captaincy_from_xi(optimized_xi, {}, projections, injury_reports)
             urgent_decision.optimized_xi = optimized_xi
         
         # Add basic chip guidance for urgent situations
-        team_info = team_data.get('team_info', {})
         available_chips = team_info.get('available_chips', [])
         if available_chips:
             urgent_decision.chip_guidance = ChipDecisionContext(
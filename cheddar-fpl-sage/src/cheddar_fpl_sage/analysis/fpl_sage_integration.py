@@ -5,19 +5,36 @@ Combines team data collection with improved decision framework
 """
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
+import math
+import os
+import re
+import sys
+from collections import Counter
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from datetime import datetime, timezone
-from typing import Dict, Optional, List, Any
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, List, Any, Tuple
 import unicodedata
 
+import aiohttp
+
 from cheddar_fpl_sage.collectors.enhanced_fpl_collector import EnhancedFPLCollector
 from cheddar_fpl_sage.collectors.weekly_bundle_collector import collect_weekly_bundle, BundlePaths
 from cheddar_fpl_sage.analysis.enhanced_decision_framework import EnhancedDecisionFramework, DecisionOutput
-from cheddar_fpl_sage.utils import OutputBundleManager, generate_run_id, write_json_atomic, write_text_atomic
+from cheddar_fpl_sage.utils import (
+    AtomicWriteBatch,
+    OutputBundleManager,
+    dump_json_bytes,
+    generate_run_id,
+    load_json_file,
+)
 from cheddar_fpl_sage.utils.sprint3_5_config_manager import Sprint35ConfigManager
 from cheddar_fpl_sage.injury.processing import (
+    INJURY_ARTIFACT_VOLATILE_KEYS,
     build_injury_artifact_payload,
     build_manual_injury_reports,
     resolve_injury_payloads,
@@ -41,6 +58,299 @@ from cheddar_fpl_sage.rules.fpl_rules import load_ruleset
 # Multiple basicConfig calls create duplicate handlers causing repeated log messages
 logger = logging.getLogger(__name__)
 
+# API chip names normalized by _CHIP_NAME_STRIP -> engine chip names
+_API_CHIP_MAP = {
+    'wildcard': 'Wildcard',
+    'benchboost': 'Bench Boost',
+    'triplecaptain': 'Triple Captain',
+    'freehit': 'Free Hit',
+}
+_CHIP_NAME_STRIP = str.maketrans('', '', '_- ')
+
+
+def _override_to_dict(override: Any) -> Any:
+    """Dump a pydantic override model (v2 model_dump or v1 dict); pass anything else through."""
+    dump = getattr(override, "model_dump", None) or getattr(override, "dict", None)
+    return dump() if dump is not None else override
+
+
+def _manual_injury_entry(override: Dict) -> Dict[str, Any]:
+    """Map an API injury override onto manual_injury_overrides fields."""
+    entry = {}
+    if override.get('status'):
+        entry['status_flag'] = override['status']
+    if override.get('chance') is not None:
+        entry['chance_of_playing_next_round'] = override['chance']
+    return entry
+
+# Season ids look like "2025-26" (also the ruleset file name)
+_VALID_SEASON_RE = re.compile(r"^\d{4}-\d{2}$")
+_SEASON_FIX_HINT = (
+    "How to fix:\n"
+    "  Run: python fpl_sage.py --season 2025-26\n"
+    "  Or add \"season\": \"2025-26\" to team_config.json\n"
+)
+_SEASON_MISSING_MSG = (
+    "\n" + "-" * 60 + "\n"
+    "DATA_GAP: SEASON_MISSING\n"
+    "\n"
+    "We couldn't detect the FPL season from the data.\n"
+    "\n"
+    "Why this matters:\n"
+    "  The season determines chip windows, deadlines, and rules.\n"
+    "  Without it, we can't make reliable recommendations.\n"
+    "\n"
+    + _SEASON_FIX_HINT
+    + "\n" + "-" * 60
+)
+_SEASON_META_MISSING_MSG = (
+    "\n" + "=" * 60 + "\n"
+    "DATA_GAP: SEASON_MISSING\n"
+    "Failed to load metadata and determine season.\n"
+    "\n"
+    + _SEASON_FIX_HINT
+    + "\n" + "=" * 60
+)
+_HOLD_SUMMARY_TEMPLATE = (
+    "# Analysis blocked\n"
+    "\n"
+    "## Decision: HOLD — {block_reason}\n"
+    "\n"
+    "**Reason:** {reasoning}\n"
+    "{missing_line}\n"
+    "\n"
+    "No modeling run executed because required bundle inputs were missing or stale."
+)
+
+# Reuse a previously collected bundle if it is younger than this (3 days)
+EXISTING_BUNDLE_MAX_MINUTES = 4320
+
+if sys.version_info >= (3, 11):
+    # 3.11+ parses a trailing "Z" natively; skip the per-call string copy
+    _parse_iso_datetime = datetime.fromisoformat
+else:
+    def _parse_iso_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+# Capability-matrix freshness entries and the collection_meta timestamp each is derived from
+_META_FRESHNESS_FIELDS = (
+    ("raw_data_freshness", "collection_time"),
+    ("model_inputs_freshness", "analysis_timestamp"),
+)
+
+# FPL element_type -> position code
+_POSITION_CODES = {1: "GK", 2: "DEF", 3: "MID", 4: "FWD"}
+# FPL element status -> status flag; other statuses are graded by chance of playing
+_STATUS_FLAGS = {"u": "OUT", "i": "OUT", "s": "OUT", "n": "OUT", "d": "DOUBT"}
+
+# Basic projection tags as bits; _PROJECTION_TAGS maps every combination to its
+# tag tuple in output order. "blank" marks a team with no fixture in the target GW.
+_TAG_INJURY_RISK = 1
+_TAG_ROTATION_RISK = 2
+_TAG_TOUGH_FIXTURE = 4
+_TAG_FAVORABLE_FIXTURE = 8
+_TAG_BLANK = 16
+_TAG_ORDER = (
+    ("rotation_risk", _TAG_ROTATION_RISK),
+    ("injury_risk", _TAG_INJURY_RISK),
+    ("tough_fixture", _TAG_TOUGH_FIXTURE),
+    ("favorable_fixture", _TAG_FAVORABLE_FIXTURE),
+    ("blank", _TAG_BLANK),
+)
+_PROJECTION_TAGS = tuple(
+    tuple(name for name, bit in _TAG_ORDER if mask & bit) for mask in range(32)
+)
+_STATUS_TAG_BITS = {
+    **dict.fromkeys(("OUT", "I", "INJURED", "S", "SUSPENDED"), _TAG_INJURY_RISK),
+    **dict.fromkeys(("DOUBT", "D"), _TAG_ROTATION_RISK | _TAG_INJURY_RISK),
+}
+
+# Sort keys for ranking projections by next-GW / six-GW points
+_next_pts = attrgetter("nextGW_pts")
+_next6_pts = attrgetter("next6_pts")
+
+
+def _unwrap_payload(loaded: Any) -> Any:
+    """Return the ``data`` body of a wrapped bundle artifact, or the payload as-is."""
+    data = loaded.get("data") if isinstance(loaded, dict) else None
+    return data if isinstance(data, (dict, list)) else loaded
+
+
+def _starter_status_entry(player: Dict) -> Dict[str, Any]:
+    """Name/news/chance summary for an injured or doubtful starter."""
+    return {
+        'name': player['name'],
+        'news': player.get('news', ''),
+        'chance_next': player.get('chance_of_playing_next_round'),
+    }
+
+
+# Persisted decision fields, in output order, with the default for decision
+# objects that predate the field. RiskScenario entries in risk_scenarios are
+# dataclasses; the JSON encoder writes their fields and enum values.
+_DECISION_FIELDS = (
+    ('primary_decision', None),
+    ('reasoning', None),
+    ('tilt_armor_threshold', None),
+    ('risk_scenarios', None),
+    ('lineup_focus', None),
+    ('next_gw_prep', None),
+    ('variance_expectations', None),
+    ('captaincy', None),
+    ('transfer_recommendations', None),
+    ('decision_status', None),
+    ('confidence_score', None),
+    ('confidence_label', 'MEDIUM'),
+    ('confidence_summary', ''),
+    ('block_reason', None),
+    ('risk_posture', None),
+    ('strategy_mode', 'BALANCED'),
+    ('rank_bucket', 'unknown'),
+    ('manager_state', None),
+    ('near_threshold_moves', None),
+    ('strategy_paths', None),
+    ('squad_issues', None),
+    ('chip_timing_outlook', None),
+    ('fixture_planner', None),
+    ('fixture_planner_reason', None),
+    ('no_transfer_reason', None),
+    ('near_threshold_reason', None),
+    ('strategy_paths_reason', None),
+    ('chip_guidance', None),
+    ('free_hit_context', None),
+    ('free_hit_plan', None),
+    ('post_free_hit_plan', None),
+)
+
+
+def _decision_payload(decision_obj: Any) -> Dict[str, Any]:
+    """Serializable view of a DecisionOutput for analysis.json."""
+    payload = {key: getattr(decision_obj, key, default) for key, default in _DECISION_FIELDS}
+    if payload['chip_guidance']:
+        payload['chip_guidance'] = payload['chip_guidance'].__dict__
+    else:
+        payload['chip_guidance'] = None
+    return payload
+
+
+def _squad_hash(squad: List[Dict]) -> str:
+    """
+    Stable digest of the squad, identical across processes (unlike ``hash``).
+
+    Always hashes the stdlib encoding: orjson differs on non-ASCII escaping
+    and float formatting, so using it when installed would change the digest.
+    """
+    encoded = json.dumps(
+        squad, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _prefetch_bundle_files(bundle_paths: BundlePaths) -> None:
+    """
+    Hint the kernel to start reading bundle artifacts into the page cache.
+
+    POSIX_FADV_WILLNEED only queues readahead and returns immediately, so the
+    meta/ruleset/gate work that follows overlaps with the disk reads. No-op on
+    platforms without posix_fadvise.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in (
+        bundle_paths.bootstrap_static,
+        bundle_paths.fixtures,
+        bundle_paths.events,
+        bundle_paths.slate,
+        bundle_paths.team_picks,
+        bundle_paths.entry_info,
+    ):
+        if path is None:
+            continue
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+class _NoFreshBundle(Exception):
+    """Raised by _resolve_fresh_bundle_cached so that misses are not memoized."""
+
+
+def _resolve_fresh_bundle(
+    latest_file: str,
+    mtime_ns: int,
+    team_id: Optional[int],
+    target_gw: Optional[int],
+) -> Optional[Tuple[BundlePaths, datetime]]:
+    """
+    Resolve LATEST.json to a validated bundle and the time it stops being fresh.
+
+    Passes are memoized per LATEST.json version (``mtime_ns``), so repeated
+    analyses in one process skip the parse and gate checks; a new collection
+    rewrites the pointer and misses the cache. Returns None when the bundle is
+    absent or fails the gate; that result is not cached, so a later call can
+    find a bundle that has appeared since. A cached pass whose run dir has been
+    pruned is dropped.
+    """
+    try:
+        resolved = _resolve_fresh_bundle_cached(latest_file, mtime_ns, team_id, target_gw)
+    except _NoFreshBundle:
+        return None
+    if not resolved[0].collection_meta.exists():
+        _resolve_fresh_bundle_cached.cache_clear()
+        return None
+    return resolved
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_fresh_bundle_cached(
+    latest_file: str,
+    mtime_ns: int,
+    team_id: Optional[int],
+    target_gw: Optional[int],
+) -> Tuple[BundlePaths, datetime]:
+    latest_data = load_json_file(latest_file)
+    if latest_data.get("team_id") != str(team_id):
+        raise _NoFreshBundle
+    existing_run_dir = Path(f"outputs/runs/team_{team_id}") / latest_data["run_id"]
+    if not existing_run_dir.exists():
+        raise _NoFreshBundle
+    data_dir = existing_run_dir / "data_collections"
+    existing_paths = BundlePaths(
+        team_id=team_id,
+        run_id=latest_data["run_id"],
+        run_dir=existing_run_dir,
+        bootstrap_static=data_dir / "bootstrap_static.json",
+        fixtures=data_dir / "fixtures.json",
+        events=data_dir / "events.json",
+        team_picks=(data_dir / "team_picks.json") if team_id else None,
+        slate=data_dir / f"slate_gw{target_gw or 'unknown'}.json",
+        collection_meta=data_dir / "collection_meta.json",
+        entry_info=data_dir / "entry_info.json",
+        injury_fpl=data_dir / "injury_fpl.json",
+        injury_secondary=data_dir / "injury_secondary.json",
+        injury_manual=data_dir / "injury_manual.json",
+        injury_resolved=data_dir / "injury_resolved.json",
+    )
+
+    gate = validate_bundle(existing_paths, team_id, target_gw or 0, freshness_max_minutes=EXISTING_BUNDLE_MAX_MINUTES)
+    if gate.status != "PASS":
+        raise _NoFreshBundle
+    # The gate passed, so collected_at is present and parseable
+    collected_at = load_json_file(existing_paths.collection_meta)["collected_at"]
+    collected_ts = _parse_iso_datetime(collected_at)
+    if collected_ts.tzinfo is None:
+        # The collector writes UTC; don't let astimezone read a bare timestamp as local time
+        collected_ts = collected_ts.replace(tzinfo=timezone.utc)
+    collected_ts = collected_ts.astimezone(timezone.utc)
+    return existing_paths, collected_ts + timedelta(minutes=EXISTING_BUNDLE_MAX_MINUTES)
+
 
 class FPLSageIntegration:
     """Main integration class for enhanced FPL analysis"""
@@ -49,10 +359,13 @@ class FPLSageIntegration:
         self.team_id = team_id
         self.config_file = config_file
         
-        # Sprint 3.5: Use centralized config manager with cache invalidation
+        # Sprint 3.5: Use centralized config manager with cache invalidation.
+        # The parsed file is shared per on-disk version; self.config is a private copy.
         self.config_manager = Sprint35ConfigManager(config_file)
-        self.config = self.config_manager.get_config(force_reload=True)
+        self.config = self.config_manager.get_config()
         self._chip_authority_source: Optional[str] = None
+        # Shared FPL API connection pool for bundle collection within one analysis
+        self._http_session: Optional[aiohttp.ClientSession] = None
 
         # Override team_id with config if not provided
         if not self.team_id and self.config.get('team_id'):
@@ -77,30 +390,29 @@ class FPLSageIntegration:
     def _load_config(self) -> Dict:
         """Load configuration from file"""
         try:
-            with open(self.config_file, 'r') as f:
-                raw = json.load(f)
-                # If the file itself is a stringified JSON, decode it
-                if isinstance(raw, str):
-                    try:
-                        raw = json.loads(raw)
-                    except json.JSONDecodeError:
-                        raw = {}
-                        
-                # Convert to dictionary format (handle Pydantic objects or raw dicts)
-                # Pydantic validation ensures consistency but we need dicts for the engine
+            raw = load_json_file(self.config_file)
+            # If the file itself is a stringified JSON, decode it
+            if isinstance(raw, str):
                 try:
-                    from cheddar_fpl_sage.analysis.decision_framework import TeamConfig
-                    validated_config = TeamConfig(**raw)
-                    # Use model_dump() to convert Pydantic models to dicts
-                    config_dict = validated_config.model_dump(mode='python')
-                    logger.debug("Config validated through Pydantic and converted to dict")
-                    return config_dict
-                except Exception as e:
-                    logger.warning(f"Could not validate config through Pydantic: {e}. Using raw dict.")
-                    # Fallback: normalize string fields manually
-                    for key in ["manual_chip_status", "chip_policy", "manual_overrides", "manual_injury_overrides"]:
-                        raw[key] = self._ensure_dict(raw.get(key), key)
-                    return raw
+                    raw = json.loads(raw)
+                except json.JSONDecodeError:
+                    raw = {}
+                    
+            # Convert to dictionary format (handle Pydantic objects or raw dicts)
+            # Pydantic validation ensures consistency but we need dicts for the engine
+            try:
+                from cheddar_fpl_sage.analysis.decision_framework import TeamConfig
+                validated_config = TeamConfig(**raw)
+                # Use model_dump() to convert Pydantic models to dicts
+                config_dict = validated_config.model_dump(mode='python')
+                logger.debug("Config validated through Pydantic and converted to dict")
+                return config_dict
+            except Exception as e:
+                logger.warning(f"Could not validate config through Pydantic: {e}. Using raw dict.")
+                # Fallback: normalize string fields manually
+                for key in ["manual_chip_status", "chip_policy", "manual_overrides", "manual_injury_overrides"]:
+                    raw[key] = self._ensure_dict(raw.get(key), key)
+                return raw
         except FileNotFoundError:
             logger.warning(f"Config file {self.config_file} not found. Using defaults.")
             return {}
@@ -110,10 +422,11 @@ class FPLSageIntegration:
 
     def _ensure_dict(self, value: Any, label: str, default: Optional[Dict] = None) -> Dict:
         """Ensure value is a dict; if stringified JSON, decode and warn."""
+        # Fast path: plain dicts (the common case) skip the default/str handling
+        if type(value) is dict or isinstance(value, dict):
+            return value
         if default is None:
             default = {}
-        if isinstance(value, dict):
-            return value
         if isinstance(value, str):
             try:
                 parsed = json.loads(value)
@@ -122,7 +435,6 @@ class FPLSageIntegration:
                     return parsed
             except json.JSONDecodeError:
                 logger.warning(f"{label} provided as string but could not be parsed; using defaults")
-            return default
         return default
 
     def _apply_api_overrides(self, overrides: Dict) -> None:
@@ -138,25 +450,22 @@ class FPLSageIntegration:
         - injury_overrides: [{'player_name': str, 'status': str, 'chance': int}, ...]
         - thresholds: dict of posture thresholds
         """
-        print(f"🔧 _apply_api_overrides called with: {overrides}")
         logger.info(f"Applying API overrides: {list(overrides.keys())}")
+        logger.debug(f"API overrides payload: {overrides}")
         
         # 1. Available chips → manual_chip_status
         if 'available_chips' in overrides:
-            chip_map = {
-                'wildcard': 'Wildcard',
-                'bench_boost': 'Bench Boost',
-                'triple_captain': 'Triple Captain',
-                'free_hit': 'Free Hit'
+            # Accepts 'bench_boost', 'Bench Boost', 'bench-boost', ...
+            engine_chips = (
+                _API_CHIP_MAP.get(api_chip.lower().translate(_CHIP_NAME_STRIP))
+                for api_chip in overrides['available_chips']
+            )
+            chip_status = {
+                engine_chip: {'available': True, 'played_by_entry': 0}
+                for engine_chip in engine_chips
+                if engine_chip
             }
             
-            # Build chip status dict
-            chip_status = {}
-            for api_chip in overrides['available_chips']:
-                engine_chip = chip_map.get(api_chip.lower().replace('_', ''))
-                if engine_chip:
-                    chip_status[engine_chip] = {'available': True, 'played_by_entry': 0}
-            
             self.config['manual_chip_status'] = chip_status
             logger.info(f"Set manual_chip_status: {list(chip_status.keys())}")
         
@@ -193,23 +502,15 @@ class FPLSageIntegration:
 
         # 5. Injury overrides → manual_injury_overrides
         if 'injury_overrides' in overrides and overrides['injury_overrides']:
-            manual_injuries = {}
-            for override in overrides['injury_overrides']:
-                if hasattr(override, 'dict'):
-                    override = override.dict()
-                if not isinstance(override, dict):
-                    continue
-                player_name = override.get('player_name') or override.get('player')
-                if not player_name:
-                    continue
-                entry = {}
-                status = override.get('status')
-                chance = override.get('chance')
-                if status:
-                    entry['status_flag'] = status
-                if chance is not None:
-                    entry['chance_of_playing_next_round'] = chance
-                manual_injuries[player_name] = entry
+            named = [
+                override
+                for override in map(_override_to_dict, overrides['injury_overrides'])
+                if isinstance(override, dict) and (override.get('player_name') or override.get('player'))
+            ]
+            manual_injuries = {
+                override.get('player_name') or override.get('player'): _manual_injury_entry(override)
+                for override in named
+            }
             if manual_injuries:
                 self.config['manual_injury_overrides'] = manual_injuries
                 logger.info(f"Applied {len(manual_injuries)} manual injury overrides")
@@ -335,16 +636,26 @@ class FPLSageIntegration:
             "strategy_mode_hint": strategy_mode_hint,
         }
     
-    def _normalize_chip_status_map(self, chip_status: Dict) -> Dict:
-        """Ensure each chip entry is a dict; replace bad entries with {}."""
+    def _normalize_chip_status_map(self, chip_status: Dict) -> Dict[str, Dict]:
+        """
+        Return chip_status as a dict of dicts; replace bad entries with {}.
+
+        Stringified maps and entries are JSON-decoded here, so callers can use
+        the result directly.
+        """
         # Defensive: ensure chip_status is a dict (in case it's stringified)
         if isinstance(chip_status, str):
             try:
                 chip_status = json.loads(chip_status)
             except json.JSONDecodeError:
                 chip_status = {}
+        if not isinstance(chip_status, dict):
+            return {}
+        # Fast path: already well-formed (the common case) - return as-is
+        if type(chip_status) is dict and all(type(status) is dict for status in chip_status.values()):
+            return chip_status
         normalized = {}
-        for chip, status in (chip_status or {}).items():
+        for chip, status in chip_status.items():
             if isinstance(status, dict):
                 normalized[chip] = status
             elif isinstance(status, str):
@@ -357,12 +668,17 @@ class FPLSageIntegration:
                 normalized[chip] = {}
         return normalized
     
-    def _safe_float(self, value: Any, default: float = 0.0) -> float:
-        """Convert value to float with safe fallback for invalid/missing data."""
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return default
+    @staticmethod
+    def _safe_float(value: Any, default: float = 0.0) -> float:
+        """Convert value to a finite float with safe fallback for invalid/missing data."""
+        if value.__class__ is float:
+            result = value
+        else:
+            try:
+                result = float(value)
+            except (TypeError, ValueError):
+                return default
+        return result if math.isfinite(result) else default
 
     @staticmethod
     def _normalize_text(value: Any) -> str:
@@ -371,28 +687,34 @@ class FPLSageIntegration:
 
     def _build_fixture_lookup(self, fixtures: List[Dict], current_gw: int) -> Dict[int, Dict[str, Any]]:
         """Map each team to its next upcoming fixture (event >= current_gw)."""
-        lookup: Dict[int, Dict[str, Any]] = {}
-        sorted_fixtures = sorted(
-            (fix for fix in fixtures if isinstance(fix, dict)),
-            key=lambda fix: ((fix.get("event") or 0), fix.get("id") or 0)
-        )
-        for fixture in sorted_fixtures:
+        # Single pass keeping the earliest (event, id) per team; no full sort needed.
+        # Strict < keeps the first fixture seen on ties, matching a stable sort.
+        earliest: Dict[int, Tuple[Tuple[int, int], Dict[str, Any], bool]] = {}
+        for fixture in fixtures:
+            if not isinstance(fixture, dict):
+                continue
             event = fixture.get("event")
             if event is None or event < current_gw:
                 continue
+            order_key = (event, fixture.get("id") or 0)
             for team_key, is_home in (("team_h", True), ("team_a", False)):
                 team_id = fixture.get(team_key)
-                if team_id is None or team_id in lookup:
+                if team_id is None:
                     continue
-                difficulty_key = "team_h_difficulty" if is_home else "team_a_difficulty"
-                difficulty = fixture.get(difficulty_key) or 3
-                lookup[team_id] = {
-                    "event": event,
-                    "fixture": fixture,
-                    "is_home": is_home,
-                    "difficulty": difficulty,
-                    "opponent": fixture.get("team_a" if is_home else "team_h"),
-                }
+                best = earliest.get(team_id)
+                if best is None or order_key < best[0]:
+                    earliest[team_id] = (order_key, fixture, is_home)
+
+        lookup: Dict[int, Dict[str, Any]] = {}
+        for team_id, ((event, _), fixture, is_home) in earliest.items():
+            difficulty_key = "team_h_difficulty" if is_home else "team_a_difficulty"
+            lookup[team_id] = {
+                "event": event,
+                "fixture": fixture,
+                "is_home": is_home,
+                "difficulty": fixture.get(difficulty_key) or 3,
+                "opponent": fixture.get("team_a" if is_home else "team_h"),
+            }
         return lookup
 
     def _extract_squad_player_refs(self, team_data: Dict) -> List[Dict[str, Any]]:
@@ -675,6 +997,30 @@ class FPLSageIntegration:
             captain_candidate_refs=[],
         )
     
+    async def _read_json_files(self, *paths) -> List[Any]:
+        """Read and decode JSON files concurrently in worker threads; None paths yield None."""
+        async def _read(path):
+            if path is None:
+                return None
+            return await asyncio.to_thread(load_json_file, path)
+
+        return list(await asyncio.gather(*(_read(path) for path in paths)))
+
+    async def _collect_bundle(self, target_gw: Optional[int], run_id: str) -> BundlePaths:
+        """Collect a fresh bundle, reusing one keep-alive session for every collection in the analysis."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+            )
+        return await collect_weekly_bundle(
+            self.team_id, target_gw, force_refresh=True, run_id=run_id, session=self._http_session
+        )
+
+    async def _close_http_session(self) -> None:
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
     async def run_full_analysis(self, save_data: bool = True, overrides: Optional[Dict] = None) -> Dict:
         """
         Run complete FPL analysis with enhanced decision framework
@@ -683,6 +1029,13 @@ class FPLSageIntegration:
             save_data: Whether to save collected data to disk
             overrides: Manual overrides from API (available_chips, free_transfers, risk_posture, manual_transfers)
         """
+        try:
+            return await self._run_full_analysis(save_data, overrides)
+        finally:
+            # Sessions are bound to the running event loop; don't carry one across analyses
+            await self._close_http_session()
+
+    async def _run_full_analysis(self, save_data: bool, overrides: Optional[Dict]) -> Dict:
         logger.info("Starting enhanced FPL analysis...")
         
         # Apply API overrides to config before analysis
@@ -697,7 +1050,6 @@ class FPLSageIntegration:
         run_id = generate_run_id(target_gw)
 
         # Step 0: Check for existing data first, then collect if needed
-        existing_paths = None
         should_collect_fresh = True
         
         # Try to find existing data from LATEST.json
@@ -705,71 +1057,37 @@ class FPLSageIntegration:
             from pathlib import Path
             latest_file = Path("outputs/LATEST.json")
             if latest_file.exists():
-                with open(latest_file) as f:
-                    latest_data = json.load(f)
-                    if latest_data.get("team_id") == str(self.team_id):
-                        # Check if existing data is fresh enough
-                        existing_run_dir = Path(f"outputs/runs/team_{self.team_id}") / latest_data["run_id"]
-                        if existing_run_dir.exists():
-                            data_dir = existing_run_dir / "data_collections"
-                            existing_paths = BundlePaths(
-                                team_id=self.team_id,
-                                run_id=latest_data["run_id"],
-                                run_dir=existing_run_dir,
-                                bootstrap_static=data_dir / "bootstrap_static.json",
-                                fixtures=data_dir / "fixtures.json",
-                                events=data_dir / "events.json",
-                                team_picks=(data_dir / "team_picks.json") if self.team_id else None,
-                                slate=data_dir / f"slate_gw{target_gw or 'unknown'}.json",
-                                collection_meta=data_dir / "collection_meta.json",
-                                entry_info=data_dir / "entry_info.json",
-                                injury_fpl=data_dir / "injury_fpl.json",
-                                injury_secondary=data_dir / "injury_secondary.json", 
-                                injury_manual=data_dir / "injury_manual.json",
-                                injury_resolved=data_dir / "injury_resolved.json",
-                            )
-                            
-                            # Test if existing data passes freshness check
-                            test_gate = validate_bundle(existing_paths, self.team_id, target_gw or 0, freshness_max_minutes=4320)
-                            if test_gate.status == "PASS":
-                                should_collect_fresh = False
-                                bundle_paths = existing_paths
-                                print("🔄 Using existing fresh data...")
-        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError) as exc:
+                # Check if existing data is fresh enough (memoized per LATEST.json version)
+                resolved = _resolve_fresh_bundle(
+                    str(latest_file.resolve()),
+                    latest_file.stat().st_mtime_ns,
+                    self.team_id,
+                    target_gw,
+                )
+                if resolved is not None and datetime.now(timezone.utc) < resolved[1]:
+                    should_collect_fresh = False
+                    bundle_paths = resolved[0]
+                    logger.info("🔄 Using existing fresh data...")
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
             logger.debug(f"Could not load existing data: {exc}")
         
         # Collect fresh data if needed
         if should_collect_fresh:
-            print("📡 Collecting fresh FPL data...")
-            bundle_paths = await collect_weekly_bundle(self.team_id, target_gw, force_refresh=True, run_id=run_id)
+            logger.info("📡 Collecting fresh FPL data...")
+            bundle_paths = await self._collect_bundle(target_gw, run_id)
+        _prefetch_bundle_files(bundle_paths)
         # Use collected meta for derived target_gw
         try:
-            with open(bundle_paths.collection_meta) as f:
-                meta_loaded = json.load(f)
-                target_gw = target_gw or meta_loaded.get("target_gw")
-                season = meta_loaded.get("season")
-                
-                # CRITICAL A2: Never allow season = unknown
-                if not season or season.lower() == "unknown":
-                    error_msg = (
-                        "\n" + "-" * 60 + "\n"
-                        "DATA_GAP: SEASON_MISSING\n"
-                        "\n"
-                        "We couldn't detect the FPL season from the data.\n"
-                        "\n"
-                        "Why this matters:\n"
-                        "  The season determines chip windows, deadlines, and rules.\n"
-                        "  Without it, we can't make reliable recommendations.\n"
-                        "\n"
-                        "How to fix:\n"
-                        "  Run: python fpl_sage.py --season 2025-26\n"
-                        "  Or add \"season\": \"2025-26\" to team_config.json\n"
-                        "\n" + "-" * 60
-                    )
-                    logger.error(error_msg)
-                    raise ValueError("Season resolution failed - cannot proceed without valid season")
-                
-                logger.info(f"✓ Season resolved: {season}")
+            meta_loaded = load_json_file(bundle_paths.collection_meta)
+            target_gw = target_gw or meta_loaded.get("target_gw")
+            season = meta_loaded.get("season")
+            
+            # CRITICAL A2: Never allow season = unknown (or any malformed season id)
+            if not _VALID_SEASON_RE.match(season or ""):
+                logger.error(_SEASON_MISSING_MSG)
+                raise ValueError("Season resolution failed - cannot proceed without valid season")
+            
+            logger.info(f"✓ Season resolved: {season}")
         except ValueError:
             # Re-raise season validation errors
             raise
@@ -777,18 +1095,7 @@ class FPLSageIntegration:
             logger.debug(f"Could not load collection meta: {exc}")
             meta_loaded = {}
             # CRITICAL A2: Do not silently default - fail explicitly
-            error_msg = (
-                "\n" + "="*60 + "\n"
-                "DATA_GAP: SEASON_MISSING\n"
-                "Failed to load metadata and determine season.\n"
-                "\n"
-                "How to fix:\n"
-                "  Run: python fpl_sage.py --season 2025-26\n"
-                "  Or add \"season\": \"2025-26\" to team_config.json\n"
-                "\n"
-                "="*60
-            )
-            logger.error(error_msg)
+            logger.error(_SEASON_META_MISSING_MSG)
             raise ValueError(f"Season resolution failed: {exc}")
 
         # Load ruleset (season-aware)
@@ -803,55 +1110,62 @@ class FPLSageIntegration:
         if gate_result.status == "HOLD":
             # Special handling for stale data with automatic refresh
             if gate_result.block_reason == "STALE_COLLECTION":
-                print("\n" + "=" * 60)
-                print("⚠️ STALE DATA DETECTED - FETCHING FRESH PRICES")
-                print("=" * 60)
-                print("🕒 Cached data is too old - player prices may have changed")
-                if gate_result.missing:
-                    print(f"📅 Details: {gate_result.missing[0]}")
-                print("")
-                print("🔄 Automatically fetching fresh FPL data...")
-                print("   This may take 30-60 seconds...")
-                print("=" * 60)
+                details = f"📅 Details: {gate_result.missing[0]}\n" if gate_result.missing else ""
+                logger.warning(
+                    f"\n{'=' * 60}\n"
+                    "⚠️ STALE DATA DETECTED - FETCHING FRESH PRICES\n"
+                    f"{'=' * 60}\n"
+                    "🕒 Cached data is too old - player prices may have changed\n"
+                    f"{details}"
+                    "\n"
+                    "🔄 Automatically fetching fresh FPL data...\n"
+                    "   This may take 30-60 seconds...\n"
+                    f"{'=' * 60}"
+                )
                 
                 # Force fresh data collection
                 try:
-                    bundle_paths = await collect_weekly_bundle(self.team_id, target_gw, force_refresh=True, run_id=run_id)
-                    print("✅ Fresh data collected successfully!")
-                    print("🔄 Restarting analysis with updated prices...\n")
+                    bundle_paths = await self._collect_bundle(target_gw, run_id)
+                    logger.info("✅ Fresh data collected successfully! Restarting analysis with updated prices...")
                     
                     # Reload metadata with fresh data
                     try:
-                        with open(bundle_paths.collection_meta) as f:
-                            meta_loaded = json.load(f)
-                            target_gw = target_gw or meta_loaded.get("target_gw")
-                            season = meta_loaded.get("season", "unknown")
+                        meta_loaded = load_json_file(bundle_paths.collection_meta)
+                        target_gw = target_gw or meta_loaded.get("target_gw")
+                        season = meta_loaded.get("season")
                     except (FileNotFoundError, json.JSONDecodeError, KeyError) as exc:
                         logger.debug(f"Could not load fresh collection meta: {exc}")
                         meta_loaded = {}
-                        season = "unknown"
+                        season = None
                     
                     # Revalidate with fresh data
                     gate_result = validate_bundle(bundle_paths, self.team_id, target_gw or 0, freshness_max_minutes=4320)
                     if gate_result.status == "HOLD":
-                        print("❌ Fresh data collection failed - still have stale data")
-                        print("💡 Try running: python scripts/data_pipeline_cli.py --team-id YOUR_TEAM_ID")
-                        import sys
+                        logger.error(
+                            "❌ Fresh data collection failed - still have stale data\n"
+                            "💡 Try running: python scripts/data_pipeline_cli.py --team-id YOUR_TEAM_ID"
+                        )
                         sys.exit(1)
                         
                 except (OSError, IOError, json.JSONDecodeError, ValueError, KeyError, asyncio.TimeoutError) as exc:
-                    print(f"❌ Failed to collect fresh data: {exc}")
-                    print("")
-                    print("💡 Manual solutions:")
-                    print("   1. Run data collection manually:")
-                    print("      python scripts/data_pipeline_cli.py --team-id YOUR_TEAM_ID")
-                    print("   2. Or delete cached data to force fresh collection:")
-                    print("      rm -rf outputs/LATEST.json")
-                    print("")
-                    print("⛔ Exiting to prevent inaccurate analysis...")
-                    print("=" * 60 + "\n")
-                    import sys
+                    logger.error(
+                        f"❌ Failed to collect fresh data: {exc}\n"
+                        "\n"
+                        "💡 Manual solutions:\n"
+                        "   1. Run data collection manually:\n"
+                        "      python scripts/data_pipeline_cli.py --team-id YOUR_TEAM_ID\n"
+                        "   2. Or delete cached data to force fresh collection:\n"
+                        "      rm -rf outputs/LATEST.json\n"
+                        "\n"
+                        "⛔ Exiting to prevent inaccurate analysis...\n"
+                        f"{'=' * 60}"
+                    )
                     sys.exit(1)
+
+                # CRITICAL A2: same season check as the first resolution, outside the collection handler
+                if not _VALID_SEASON_RE.match(season or ""):
+                    logger.error(_SEASON_MISSING_MSG)
+                    raise ValueError("Season resolution failed - cannot proceed without valid season")
             
             reasoning = f"Blocked by data gate: {gate_result.block_reason}"
             if gate_result.missing:
@@ -864,17 +1178,13 @@ class FPLSageIntegration:
                 block_reason=gate_result.block_reason,
                 risk_posture=self.decision_framework.risk_posture,
             )
-            summary_lines = [
-                "# Analysis blocked",
-                "",
-                f"## Decision: HOLD — {gate_result.block_reason}",
-                "",
-                f"**Reason:** {reasoning}",
-                f"**Missing inputs:** {', '.join(gate_result.missing or [])}" if gate_result.missing else "",
-                "",
-                "No modeling run executed because required bundle inputs were missing or stale.",
-            ]
-            summary = "\n".join([line for line in summary_lines if line is not None])
+            summary = _HOLD_SUMMARY_TEMPLATE.format(
+                block_reason=gate_result.block_reason,
+                reasoning=reasoning,
+                missing_line=(
+                    f"**Missing inputs:** {', '.join(gate_result.missing)}" if gate_result.missing else ""
+                ),
+            )
             analysis_output = {
                 "decision": decision,
                 "formatted_summary": summary,
@@ -885,7 +1195,7 @@ class FPLSageIntegration:
                 "season": season,
                 "current_gameweek": target_gw or 0,
                 "source": {"type": "data_gate", "block_reason": gate_result.block_reason},
-                "ruleset": ruleset.__dict__ if ruleset else None,
+                "ruleset": ruleset,
             }
             if save_data:
                 await self._save_analysis_data(raw_data, analysis_output, run_id=run_id, bundle_paths=bundle_paths)
@@ -897,46 +1207,47 @@ class FPLSageIntegration:
         
         # Step 1: Load bundle data (bootstrap, fixtures, events, picks, slate)
         try:
-            with open(bundle_paths.bootstrap_static) as f:
-                bootstrap_loaded = json.load(f)
-                # Handle both wrapped and unwrapped formats
-                bootstrap = bootstrap_loaded.get("data", bootstrap_loaded) if isinstance(bootstrap_loaded, dict) and "data" in bootstrap_loaded and isinstance(bootstrap_loaded.get("data"), dict) else bootstrap_loaded
-            
-            with open(bundle_paths.fixtures) as f:
-                fixtures_loaded = json.load(f)
-                # Extract fixtures data if wrapped
-                fixtures = fixtures_loaded.get("data", fixtures_loaded) if isinstance(fixtures_loaded, dict) and "data" in fixtures_loaded else fixtures_loaded
-            
-            with open(bundle_paths.events) as f:
-                events_loaded = json.load(f)
-                # Extract events data if wrapped
-                events = events_loaded.get("data", events_loaded) if isinstance(events_loaded, dict) and "data" in events_loaded else events_loaded
-            
-            with open(bundle_paths.slate) as f:
-                slate_loaded = json.load(f)
-                # Extract slate data if wrapped
-                slate = slate_loaded.get("data", slate_loaded) if isinstance(slate_loaded, dict) and "data" in slate_loaded else slate_loaded
+            # Optional artifacts are only read when present
+            # (BundlePaths already holds Path objects; os.path.exists skips re-wrapping them)
+            team_picks_path = bundle_paths.team_picks
+            if not (self.team_id and team_picks_path and os.path.exists(team_picks_path)):
+                team_picks_path = None
+            entry_info_path = bundle_paths.entry_info
+            if not (self.team_id and entry_info_path and os.path.exists(entry_info_path)):
+                entry_info_path = None
+            (
+                bootstrap_loaded,
+                fixtures_loaded,
+                events_loaded,
+                slate_loaded,
+                team_picks_loaded,
+                entry_loaded,
+            ) = await self._read_json_files(
+                bundle_paths.bootstrap_static,
+                bundle_paths.fixtures,
+                bundle_paths.events,
+                bundle_paths.slate,
+                team_picks_path,
+                entry_info_path,
+            )
             
-            team_picks = None
-            if self.team_id and bundle_paths.team_picks and Path(bundle_paths.team_picks).exists():
-                with open(bundle_paths.team_picks) as f:
-                    team_picks_loaded = json.load(f)
-                    # Extract team picks data if wrapped
-                    team_picks = team_picks_loaded.get("data", team_picks_loaded) if isinstance(team_picks_loaded, dict) and "data" in team_picks_loaded else team_picks_loaded
-            entry_identity = None
-            if self.team_id and bundle_paths.entry_info and Path(bundle_paths.entry_info).exists():
-                with open(bundle_paths.entry_info) as f:
-                    entry_loaded = json.load(f)
-                    entry_identity = entry_loaded.get("data", entry_loaded) if isinstance(entry_loaded, dict) and "data" in entry_loaded else entry_loaded
+            # Handle both wrapped and unwrapped formats (missing optional files stay None)
+            bootstrap = _unwrap_payload(bootstrap_loaded)
+            fixtures = _unwrap_payload(fixtures_loaded)
+            events = _unwrap_payload(events_loaded)
+            slate = _unwrap_payload(slate_loaded)
+            team_picks = _unwrap_payload(team_picks_loaded)
+            entry_identity = _unwrap_payload(entry_loaded)
         except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError) as exc:
             logger.error(f"Failed to load bundle artifacts: {exc}")
             raise
 
         # Derive current GW from events
-        current_gw = target_gw or 0
-        for ev in events or []:
-            if ev.get("is_current"):
-                current_gw = ev.get("id") or current_gw
+        # (the is_current event wins over target_gw; stop at the first match)
+        current_gw = next(
+            (ev.get("id") for ev in events or [] if ev.get("is_current") and ev.get("id")),
+            None,
+        ) or target_gw or 0
         if not current_gw and events:
             current_gw = (events[0].get("id") or 0)
 
@@ -948,7 +1259,7 @@ class FPLSageIntegration:
             "current_gameweek": current_gw,
             "slate": slate,
             "collection_meta": meta_loaded,
-            "ruleset": ruleset.__dict__ if ruleset else None,
+            "ruleset": ruleset,
         }
         if self.team_id and team_picks:
             data["my_team"] = self._build_team_from_bundle(team_picks, bootstrap, events, identity_info=entry_identity)
@@ -965,16 +1276,20 @@ class FPLSageIntegration:
             fixture_data = {'fixtures': data.get('fixtures', [])}
             chip_authority_source = self._resolve_chip_authority_source(team_data)
             data['chip_authority_source'] = chip_authority_source
-            team_data['chip_authority_source'] = chip_authority_source
-            team_data['chip_policy'] = (ruleset.chip_policy if ruleset else {})
             analysis_prefs = self.config.get('analysis_preferences', {})
-            team_data['analysis_preferences'] = analysis_prefs
-            team_data['manager_context'] = analysis_prefs.get('manager_context') or self.config.get('manager_context')
-            team_data['force_tc_override'] = analysis_prefs.get('force_tc_override', False) or self.config.get('force_tc_override', False)
-            
-            # Inject manual overrides from config into team_data for decision framework
-            team_data['manual_overrides'] = self.config.get('manual_overrides') or {}
-            team_data['manual_injury_overrides'] = self.config.get('manual_injury_overrides') or {}
+            # Inject policy, preferences and manual overrides from config into team_data
+            # for the decision framework in one update (my_team is persisted with these keys)
+            team_data.update({
+                'chip_authority_source': chip_authority_source,
+                'chip_policy': ruleset.chip_policy if ruleset else {},
+                'analysis_preferences': analysis_prefs,
+                'manager_context': analysis_prefs.get('manager_context') or self.config.get('manager_context'),
+                'force_tc_override': (
+                    analysis_prefs.get('force_tc_override', False) or self.config.get('force_tc_override', False)
+                ),
+                'manual_overrides': self.config.get('manual_overrides') or {},
+                'manual_injury_overrides': self.config.get('manual_injury_overrides') or {},
+            })
             effective_context = self._resolve_effective_decision_context(team_data, overrides=overrides)
             logger.info(f"DEBUG: Injected manual_overrides into team_data: {list(team_data['manual_overrides'].keys())}")
             planned_xfers = team_data['manual_overrides'].get('planned_transfers', [])
@@ -1013,10 +1328,11 @@ class FPLSageIntegration:
                 team_data['injury_resolution_traces'] = resolution_traces
                 team_data['injury_summary'] = injury_artifacts.get('summary', {})
                 team_data['injury_data_source'] = "resolved"
-            free_transfers = effective_context.get("free_transfers", team_info.get('free_transfers', 0))
+            ft_post_fh = team_info.get('free_transfers', 0)
+            free_transfers = effective_context.get("free_transfers", ft_post_fh)
             ft_source = effective_context.get("free_transfers_source", team_info.get('free_transfers_source', 'api'))
-            print("\n🔄 TRANSFER SITUATION:")
-            print("\n" + "🔄" + " TRANSFER SITUATION ".center(56, "="))
+            # Build the transfer summary and emit it with one write
+            summary_lines = ["\n" + "🔄" + " TRANSFER SITUATION ".center(56, "=")]
             
             # Team identification
             # Sprint 3.5: Extract and save manager identity from API
@@ -1036,13 +1352,13 @@ class FPLSageIntegration:
             
             overall_rank = team_info.get('overall_rank')
             
-            print(f"👤 Team: {team_name}")
-            print(f"📊 Manager: {manager_name}")
+            summary_lines.append(f"👤 Team: {team_name}")
+            summary_lines.append(f"📊 Manager: {manager_name}")
             if isinstance(overall_rank, (int, float)):
-                print(f"🏆 Overall Rank: {overall_rank:,}")
+                summary_lines.append(f"🏆 Overall Rank: {overall_rank:,}")
             elif overall_rank:
-                print(f"🏆 Overall Rank: {overall_rank}")
-            print("-" * 60)
+                summary_lines.append(f"🏆 Overall Rank: {overall_rank}")
+            summary_lines.append("-" * 60)
             
             # Detect Free Hit and adjust effective transfers
             active_chip = team_data.get('active_chip')
@@ -1050,6 +1366,8 @@ class FPLSageIntegration:
                 self._ensure_dict(team_data.get('chip_status', {}), "chip_status")
             )
             is_free_hit_week = active_chip == 'freehit'
+            chip_policy = self._ensure_dict(self.config.get("chip_policy", {}), "chip_policy")
+            chips_expire_after_gw = chip_policy.get("expiration", {}).get("chips_expire_after_gw")
             if is_free_hit_week:
                 free_transfers = 0
                 team_info['ft_effective_this_week'] = 0
@@ -1058,82 +1376,71 @@ class FPLSageIntegration:
                 team_info['ft_effective_this_week'] = free_transfers
             
             ft_note = " (manual)" if ft_source == 'manual' else ""
-            print(f"Free Transfers Available: {free_transfers}{ft_note}")
-            print(f"Bank Value: £{team_data.get('team_info', {}).get('bank_value', 0):.1f}m")
-            print(f"Team Value: £{team_data.get('team_info', {}).get('team_value', 0):.1f}m")
+            summary_lines.append(f"Free Transfers Available: {free_transfers}{ft_note}")
+            summary_lines.append(f"Bank Value: £{team_info.get('bank_value', 0):.1f}m")
+            summary_lines.append(f"Team Value: £{team_info.get('team_value', 0):.1f}m")
             chip_authority = team_data.get('chip_authority_source', 'bundle')
-            print(f"Chip data source: {chip_authority}")
+            summary_lines.append(f"Chip data source: {chip_authority}")
             injury_source = team_data.get('injury_data_source', 'api')
             if injury_source == 'manual':
-                print("Injury data source: manual overrides applied")
+                summary_lines.append("Injury data source: manual overrides applied")
             elif injury_source == 'resolved':
-                print("Injury data source: resolved (FPL + secondary + manual)")
+                summary_lines.append("Injury data source: resolved (FPL + secondary + manual)")
             else:
-                print("Injury data source: api (use overrides for current injuries)")
+                summary_lines.append("Injury data source: api (use overrides for current injuries)")
             
             # Check for injured/unavailable players
             squad = team_data.get('current_squad', [])
             injured_players = []
             doubtful_players = []
             
+            status_buckets = {'OUT': injured_players, 'DOUBT': doubtful_players}
             for player in squad:
                 if player.get('is_starter', False):
-                    status = player.get('status_flag', 'FIT')
-                    news = player.get('news', '')
-                    chance_next = player.get('chance_of_playing_next_round')
-                    
-                    if status == 'OUT':
-                        injured_players.append({
-                            'name': player['name'],
-                            'news': news,
-                            'chance_next': chance_next
-                        })
-                    elif status == 'DOUBT':
-                        doubtful_players.append({
-                            'name': player['name'], 
-                            'news': news,
-                            'chance_next': chance_next
-                        })
+                    bucket = status_buckets.get(player.get('status_flag', 'FIT'))
+                    if bucket is not None:
+                        bucket.append(_starter_status_entry(player))
             
             if injured_players:
-                print("\n🚨 INJURED/UNAVAILABLE STARTERS:")
+                summary_lines.append("\n🚨 INJURED/UNAVAILABLE STARTERS:")
                 for player in injured_players:
                     news_text = f" - {player['news']}" if player['news'] else ""
                     chance_text = f" (Next round: {player['chance_next']}%)" if player['chance_next'] is not None else ""
-                    print(f"• {player['name']}{news_text}{chance_text}")
+                    summary_lines.append(f"• {player['name']}{news_text}{chance_text}")
                     
             if doubtful_players:
-                print("\n⚠️ DOUBTFUL STARTERS:")
+                summary_lines.append("\n⚠️ DOUBTFUL STARTERS:")
                 for player in doubtful_players:
                     news_text = f" - {player['news']}" if player['news'] else ""
                     chance_text = f" (Next round: {player['chance_next']}%)" if player['chance_next'] is not None else ""
-                    print(f"• {player['name']}{news_text}{chance_text}")
+                    summary_lines.append(f"• {player['name']}{news_text}{chance_text}")
             
             # Strategic guidance based on transfer count
             if free_transfers >= 4:
-                print(f"\n🚀 MULTIPLE TRANSFER STRATEGY ({free_transfers} transfers):")
-                print("• Excellent opportunity for major squad restructuring")
-                print("• Consider premium upgrades and position rebalancing")
-                print("• Plan upgrade pathway to maximize team value")
-                print("• Focus on form players with favorable fixture runs")
+                summary_lines.append(f"\n🚀 MULTIPLE TRANSFER STRATEGY ({free_transfers} transfers):")
+                summary_lines.append("• Excellent opportunity for major squad restructuring")
+                summary_lines.append("• Consider premium upgrades and position rebalancing")
+                summary_lines.append("• Plan upgrade pathway to maximize team value")
+                summary_lines.append("• Focus on form players with favorable fixture runs")
             elif free_transfers == 3:
-                print("\n🎯 TRIPLE TRANSFER STRATEGY:")
-                print("• Address multiple weaknesses simultaneously") 
-                print("• Consider complete position overhauls")
-                print("• Balance premium upgrades with budget optimization")
+                summary_lines.append("\n🎯 TRIPLE TRANSFER STRATEGY:")
+                summary_lines.append("• Address multiple weaknesses simultaneously") 
+                summary_lines.append("• Consider complete position overhauls")
+                summary_lines.append("• Balance premium upgrades with budget optimization")
             elif free_transfers == 2:
-                print("\n⚡ DUAL TRANSFER STRATEGY:")
-                print("• Target two most critical improvements")
-                print("• Consider sideways moves for fixture advantages")
+                summary_lines.append("\n⚡ DUAL TRANSFER STRATEGY:")
+                summary_lines.append("• Target two most critical improvements")
+                summary_lines.append("• Consider sideways moves for fixture advantages")
             elif free_transfers == 1:
-                print("\n🔧 SINGLE TRANSFER FOCUS:")
-                print("• Prioritize highest impact improvement only")
-                print("• Avoid luxury upgrades - focus on urgent needs")
+                summary_lines.append("\n🔧 SINGLE TRANSFER FOCUS:")
+                summary_lines.append("• Prioritize highest impact improvement only")
+                summary_lines.append("• Avoid luxury upgrades - focus on urgent needs")
             else:
-                print("\n⚠️ NO FREE TRANSFERS:")
-                print("• Hold chips until a future window clearly outperforms this week.")
-                print("• Prioritize captaincy and wait for manager context confirmation before irreversible moves.")
-            print("=" * 60)
+                summary_lines.append("\n⚠️ NO FREE TRANSFERS:")
+                summary_lines.append("• Hold chips until a future window clearly outperforms this week.")
+                summary_lines.append("• Prioritize captaincy and wait for manager context confirmation before irreversible moves.")
+            summary_lines.append("=" * 60)
+            sys.stdout.write("\n".join(summary_lines) + "\n")
             
             # Display current team state for manual verification
             self._display_current_team_for_verification(team_data)
@@ -1196,16 +1503,22 @@ class FPLSageIntegration:
             )
             
             # Attach Free Hit context to decision output for downstream consumers
+            # (one timestamp shared by every free_hit_context written in this run)
+            fh_generated_at = datetime.now(timezone.utc).isoformat()
+            # Squad digest, computed once by whichever Free Hit branch below needs it first
+            pre_fh_hash: Optional[str] = None
             if is_free_hit_week:
-                decision.free_hit_plan = self._build_free_hit_plan(team_data, projections)
-                decision.post_free_hit_plan = self._build_post_free_hit_plan(team_data, projections)
+                pre_fh_hash = _squad_hash(team_data.get('current_squad', []))
+                proj_lookup = {p.player_id: p for p in projections.projections}
+                decision.free_hit_plan = self._build_free_hit_plan(team_data, projections, proj_lookup)
+                decision.post_free_hit_plan = self._build_post_free_hit_plan(team_data, projections, proj_lookup)
                 decision.free_hit_context = {
                     "is_active": True,
                     "gw": current_gw,
-                    "ft_available_post_fh": team_info.get('free_transfers', 0),
-                    "pre_free_hit_team_hash": str(hash(str(team_data.get('current_squad', [])))),
-                    "generated_at": datetime.now(timezone.utc).isoformat(),
-                    "expires_after_gw": self._ensure_dict(self.config.get("chip_policy", {}), "chip_policy").get("expiration", {}).get("chips_expire_after_gw", 19),
+                    "ft_available_post_fh": ft_post_fh,
+                    "pre_free_hit_team_hash": pre_fh_hash,
+                    "generated_at": fh_generated_at,
+                    "expires_after_gw": 19 if chips_expire_after_gw is None else chips_expire_after_gw,
                     "urgency": False
                 }
                 # Avoid chip activation language when FH is active
@@ -1216,18 +1529,12 @@ class FPLSageIntegration:
                     decision.block_reason = "FREE_HIT_ACTIVE"
             
             # Chip expiry urgency gating
-            chip_policy = self._ensure_dict(self.config.get("chip_policy", {}), "chip_policy")
             chip_expires_this_gw = EnhancedDecisionFramework.chip_expires_before_next_deadline(
                 "Free Hit", current_gw, chip_policy
             )
-            # Ensure chip_status is a dict before calling .get()
-            if isinstance(chip_status, str):
-                try:
-                    chip_status = json.loads(chip_status)
-                except json.JSONDecodeError:
-                    chip_status = {}
             fh_available = chip_status.get('Free Hit', {}).get('available', False)
             if chip_expires_this_gw and fh_available:
+                pre_fh_hash = pre_fh_hash or _squad_hash(team_data.get('current_squad', []))
                 if decision.decision_status == "PASS":
                     # Force FH activation
                     decision.primary_decision = "ACTIVATE_FREE_HIT"
@@ -1247,18 +1554,22 @@ class FPLSageIntegration:
                             reasons.append("EXPIRING_CHIP_FORCE")
                         decision.chip_guidance.reason_codes = reasons
                     # Ensure FH plans are present
-                    if not decision.free_hit_plan:
-                        decision.free_hit_plan = self._build_free_hit_plan(team_data, projections)
-                    if not decision.post_free_hit_plan:
-                        decision.post_free_hit_plan = self._build_post_free_hit_plan(team_data, projections)
+                    if not (decision.free_hit_plan and decision.post_free_hit_plan):
+                        proj_lookup = {p.player_id: p for p in projections.projections}
+                        if not decision.free_hit_plan:
+                            decision.free_hit_plan = self._build_free_hit_plan(team_data, projections, proj_lookup)
+                        if not decision.post_free_hit_plan:
+                            decision.post_free_hit_plan = self._build_post_free_hit_plan(
+                                team_data, projections, proj_lookup
+                            )
                     decision.free_hit_context = decision.free_hit_context or {}
                     decision.free_hit_context.update({
                         "is_active": True,
                         "gw": current_gw,
-                        "ft_available_post_fh": team_info.get('free_transfers', 0),
-                        "pre_free_hit_team_hash": str(hash(str(team_data.get('current_squad', [])))),
-                        "generated_at": datetime.now(timezone.utc).isoformat(),
-                        "expires_after_gw": self._ensure_dict(self.config.get("chip_policy", {}), "chip_policy").get("expiration", {}).get("chips_expire_after_gw"),
+                        "ft_available_post_fh": ft_post_fh,
+                        "pre_free_hit_team_hash": pre_fh_hash,
+                        "generated_at": fh_generated_at,
+                        "expires_after_gw": chips_expire_after_gw,
                         "urgency": True
                     })
                     # Strip transfer recommendations headline
@@ -1271,10 +1582,10 @@ class FPLSageIntegration:
                     decision.free_hit_context.update({
                         "is_active": True,
                         "gw": current_gw,
-                        "ft_available_post_fh": team_info.get('free_transfers', 0),
-                        "pre_free_hit_team_hash": str(hash(str(team_data.get('current_squad', [])))),
-                        "generated_at": datetime.now(timezone.utc).isoformat(),
-                        "expires_after_gw": self._ensure_dict(self.config.get("chip_policy", {}), "chip_policy").get("expiration", {}).get("chips_expire_after_gw"),
+                        "ft_available_post_fh": ft_post_fh,
+                        "pre_free_hit_team_hash": pre_fh_hash,
+                        "generated_at": fh_generated_at,
+                        "expires_after_gw": chips_expire_after_gw,
                         "urgency": True
                     })
 
@@ -1304,18 +1615,20 @@ class FPLSageIntegration:
             data['blocked_actions'] = blocked_actions
             data['block_reasons'] = reasons
             
-            # Validate identity consistency across rendered sections (ID-first)
-            try:
-                rendered_sections = []
-                if decision.free_hit_plan and decision.free_hit_plan.get("squad"):
-                    rendered_sections.append(decision.free_hit_plan["squad"])
-                if decision.post_free_hit_plan:
-                    rendered_sections.extend(plan for plan in decision.post_free_hit_plan.get("plans", []) if isinstance(plan, list))
-                validate_player_identity(team_data.get("current_squad", []), rendered_sections)
-            except ValueError as exc:
-                decision.decision_status = "HOLD"
-                decision.block_reason = "DATA_INTEGRITY"
-                decision.reasoning += f" | {exc}"
+            # Validate identity consistency across rendered sections (ID-first);
+            # only Free Hit plans render squads, so most runs have nothing to check
+            rendered_sections = []
+            if decision.free_hit_plan and decision.free_hit_plan.get("squad"):
+                rendered_sections.append(decision.free_hit_plan["squad"])
+            if decision.post_free_hit_plan:
+                rendered_sections.extend(plan for plan in decision.post_free_hit_plan.get("plans", []) if isinstance(plan, list))
+            if rendered_sections:
+                try:
+                    validate_player_identity(team_data.get("current_squad", []), rendered_sections)
+                except ValueError as exc:
+                    decision.decision_status = "HOLD"
+                    decision.block_reason = "DATA_INTEGRITY"
+                    decision.reasoning += f" | {exc}"
             
             # Generate formatted summary
             decision_summary = self.decision_framework.generate_decision_summary(decision, team_data)
@@ -1336,11 +1649,8 @@ class FPLSageIntegration:
                 logger.info(f"Optimized XI includes {len(optimized_xi.starting_xi)} starters and {len(optimized_xi.bench)} bench")
             
             # Print summary to console
-            print("\n" + "="*60)
-            print("FPL SAGE ENHANCED ANALYSIS")
-            print("="*60)
-            print(decision_summary)
-            print("="*60 + "\n")
+            rule = "=" * 60
+            sys.stdout.write(f"\n{rule}\nFPL SAGE ENHANCED ANALYSIS\n{rule}\n{decision_summary}\n{rule}\n\n")
         
         # Step 3: Save data if requested
         # Compute and save capability matrix
@@ -1350,11 +1660,10 @@ class FPLSageIntegration:
             await self._save_analysis_data(data, analysis_output, run_id=run_id, bundle_paths=bundle_paths)
             # Save capability matrix as run_context.json
             context_path = bundle_paths.run_dir / 'run_context.json'
-            with open(context_path, 'w') as f:
-                json.dump({
-                    'capability_matrix': capability_matrix,
-                    'timestamp': datetime.now(timezone.utc).isoformat()
-                }, f, indent=2)
+            context_path.write_bytes(dump_json_bytes({
+                'capability_matrix': capability_matrix,
+                'timestamp': datetime.now(timezone.utc).isoformat()
+            }))
         return {
             'raw_data': data,
             'analysis': analysis_output,
@@ -1362,12 +1671,22 @@ class FPLSageIntegration:
             'capability_matrix': capability_matrix
         }
 
-    def _build_free_hit_plan(self, team_data: Dict, projections: CanonicalProjectionSet) -> Dict:
-        """Deterministic Free Hit plan builder (greedy, policy-compliant)."""
+    def _build_free_hit_plan(
+        self,
+        team_data: Dict,
+        projections: CanonicalProjectionSet,
+        proj_lookup: Optional[Dict[int, CanonicalPlayerProjection]] = None,
+    ) -> Dict:
+        """Deterministic Free Hit plan builder (greedy, policy-compliant).
+
+        ``proj_lookup`` (player_id -> projection) may be passed in to share one
+        index with ``_build_post_free_hit_plan``; it is built here otherwise.
+        """
         # Use provided FH squad if present, else start from current squad pool
         fh_snapshot = team_data.get("team_input_free_hit", {}).get("current_squad") or team_data.get("current_squad", [])
-        bank_value = team_data.get("team_info", {}).get("bank_value", 0.0)
-        budget = team_data.get("team_info", {}).get("team_value", 100.0) + bank_value
+        team_info = team_data.get("team_info", {})
+        bank_value = team_info.get("bank_value", 0.0)
+        budget = team_info.get("team_value", 100.0) + bank_value
 
         # If no FH snapshot exists, build a fresh 15 using projections (greedy within constraints)
         if not fh_snapshot:
@@ -1376,18 +1695,23 @@ class FPLSageIntegration:
             squad = []
             total_cost = 0.0
 
-            for proj in sorted(projections.projections, key=lambda p: p.nextGW_pts, reverse=True):
-                if pos_limits.get(proj.position, 0) <= 0:
+            budget_cap = budget + 1e-6
+            for proj in sorted(projections.projections, key=_next_pts, reverse=True):
+                # Read each attribute once; the pool is every projected player (~600)
+                position, team, price = proj.position, proj.team, proj.current_price
+                open_slots = pos_limits.get(position, 0)
+                if open_slots <= 0:
                     continue
-                if team_limits.get(proj.team, 0) >= 3:
+                team_count = team_limits.get(team, 0)
+                if team_count >= 3:
                     continue
-                if total_cost + proj.current_price > budget + 1e-6:
+                if total_cost + price > budget_cap:
                     continue
 
                 squad.append(proj)
-                pos_limits[proj.position] -= 1
-                team_limits[proj.team] = team_limits.get(proj.team, 0) + 1
-                total_cost += proj.current_price
+                pos_limits[position] = open_slots - 1
+                team_limits[team] = team_count + 1
+                total_cost += price
 
                 if len(squad) == 15:
                     break
@@ -1404,58 +1728,44 @@ class FPLSageIntegration:
             ]
 
         # Build XI from FH snapshot respecting formation
-        proj_lookup = {p.player_id: p for p in projections.projections}
-        gks = []
-        defs = []
-        mids = []
-        fwds = []
+        if proj_lookup is None:
+            proj_lookup = {p.player_id: p for p in projections.projections}
+        buckets: Dict[str, List[CanonicalPlayerProjection]] = {"GK": [], "DEF": [], "MID": [], "FWD": []}
         for p in fh_snapshot:
             proj = proj_lookup.get(p.get("player_id"))
-            if not proj:
-                continue
-            if proj.position == "GK":
-                gks.append(proj)
-            elif proj.position == "DEF":
-                defs.append(proj)
-            elif proj.position == "MID":
-                mids.append(proj)
-            elif proj.position == "FWD":
-                fwds.append(proj)
-
-        gks.sort(key=lambda p: p.nextGW_pts, reverse=True)
-        defs.sort(key=lambda p: p.nextGW_pts, reverse=True)
-        mids.sort(key=lambda p: p.nextGW_pts, reverse=True)
-        fwds.sort(key=lambda p: p.nextGW_pts, reverse=True)
+            if proj and proj.position in buckets:
+                buckets[proj.position].append(proj)
+        for bucket in buckets.values():
+            bucket.sort(key=_next_pts, reverse=True)
+        gks, defs, mids, fwds = buckets["GK"], buckets["DEF"], buckets["MID"], buckets["FWD"]
 
         xi: List[CanonicalPlayerProjection] = []
-        bench: List[CanonicalPlayerProjection] = []
-
-        if gks:
-            xi.append(gks.pop(0))
-        xi.extend(defs[:3])
-        xi.extend(mids[:3])
-        if fwds:
-            xi.append(fwds.pop(0))
+        team_counts: Dict[str, int] = {}
 
-        # Fill remaining XI slots with best remaining projections regardless of position (respecting team limit 3)
-        remaining_pool = defs[3:] + mids[3:] + fwds + gks
-        team_counts = {}
-        for player in xi:
+        def _add_to_xi(player: CanonicalPlayerProjection) -> None:
+            xi.append(player)
             team_counts[player.team] = team_counts.get(player.team, 0) + 1
 
-        for player in sorted(remaining_pool, key=lambda p: p.nextGW_pts, reverse=True):
+        # Formation core: 1 GK, 3 DEF, 3 MID, 1 FWD
+        for player in gks[:1] + defs[:3] + mids[:3] + fwds[:1]:
+            _add_to_xi(player)
+
+        # Fill remaining XI slots with best remaining projections regardless of position (respecting team limit 3)
+        remaining_pool = sorted(
+            defs[3:] + mids[3:] + fwds[1:] + gks[1:],
+            key=_next_pts,
+            reverse=True,
+        )
+        for player in remaining_pool:
             if len(xi) >= 11:
                 break
             if team_counts.get(player.team, 0) >= 3:
                 continue
-            xi.append(player)
-            team_counts[player.team] = team_counts.get(player.team, 0) + 1
+            _add_to_xi(player)
 
         # Bench is remaining sorted by projection
         used_ids = {p.player_id for p in xi}
-        bench = [p for p in remaining_pool if p.player_id not in used_ids]
-        bench.sort(key=lambda p: p.nextGW_pts, reverse=True)
-        bench = bench[:4]
+        bench = [p for p in remaining_pool if p.player_id not in used_ids][:4]
 
         starting_ids = [p.player_id for p in xi]
         bench_ids = [p.player_id for p in bench]
@@ -1488,12 +1798,19 @@ class FPLSageIntegration:
             }
         }
 
-    def _build_post_free_hit_plan(self, team_data: Dict, projections: CanonicalProjectionSet) -> Dict:
+    def _build_post_free_hit_plan(
+        self,
+        team_data: Dict,
+        projections: CanonicalProjectionSet,
+        projection_lookup: Optional[Dict[int, CanonicalPlayerProjection]] = None,
+    ) -> Dict:
         """Post-FH transfer plan using pre-FH squad as baseline."""
         pre_fh = team_data.get("team_input_pre_free_hit", {}).get("current_squad") or team_data.get("current_squad", [])
-        bank = team_data.get("team_info", {}).get("bank_value", 0.0)
-        ft_available = team_data.get("team_info", {}).get("free_transfers", 0)
-        projection_lookup = {p.player_id: p for p in projections.projections}
+        team_info = team_data.get("team_info", {})
+        bank = team_info.get("bank_value", 0.0)
+        ft_available = team_info.get("free_transfers", 0)
+        if projection_lookup is None:
+            projection_lookup = {p.player_id: p for p in projections.projections}
 
         # Build hold plan
         plans = [
@@ -1510,13 +1827,15 @@ class FPLSageIntegration:
         # Simple single-upgrade plan: swap lowest projection bench player for best affordable upgrade
         if pre_fh:
             squad_ids = {p.get("player_id") for p in pre_fh}
-            bench_like = sorted(
-                [p for p in pre_fh if not p.get("is_starter")],
-                key=lambda x: projection_lookup.get(x.get("player_id"), None).next6_pts if projection_lookup.get(x.get("player_id")) else 0,
-            )
-            if bench_like:
-                sell = bench_like[0]
-                sell_proj = projection_lookup.get(sell.get("player_id"))
+            # Score each bench player once; min() keeps the first of equal scores like a stable sort
+            bench_scored = []
+            for p in pre_fh:
+                if p.get("is_starter"):
+                    continue
+                proj = projection_lookup.get(p.get("player_id"))
+                bench_scored.append((proj.next6_pts if proj else 0, p, proj))
+            if bench_scored:
+                _, sell, sell_proj = min(bench_scored, key=itemgetter(0))
                 sell_price = sell.get("current_price", sell.get("now_cost", 0) / 10)
                 buy_budget = bank + sell_price
                 candidates = [
@@ -1524,7 +1843,7 @@ class FPLSageIntegration:
                     if p.player_id not in squad_ids and p.current_price <= buy_budget + 1e-6
                 ]
                 if candidates:
-                    best_buy = sorted(candidates, key=lambda p: p.next6_pts, reverse=True)[0]
+                    best_buy = max(candidates, key=_next6_pts)
                     gain = (best_buy.next6_pts - (sell_proj.next6_pts if sell_proj else 0))
                     plans.append(
                         {
@@ -1553,60 +1872,47 @@ class FPLSageIntegration:
             "team_picks_provenance": "UNKNOWN",
         }
 
-        # Heuristic freshness checks (basic)
-        now = datetime.now(timezone.utc)
-        max_staleness = 60 * 60  # 1 hour in seconds
-
-        # Check collection_meta timestamps if available
+        # Everything below is derived from collection_meta
         meta = data.get('collection_meta', {})
-        if meta:
-            collection_time = meta.get('collection_time')
-            if collection_time:
-                try:
-                    collection_dt = datetime.fromisoformat(collection_time.replace("Z", "+00:00"))
-                    if now and collection_dt:
-                        age = (now - collection_dt).total_seconds()
-                        if age < max_staleness:
-                            matrix['raw_data_freshness'] = "FRESH"
-                        else:
-                            matrix['raw_data_freshness'] = "STALE"
-                except (ValueError, TypeError):
-                    matrix['raw_data_freshness'] = "UNKNOWN"
-
-            # Model inputs freshness (derived from analysis timestamp)
-            analysis_timestamp = meta.get('analysis_timestamp')
-            if analysis_timestamp:
-                try:
-                    analysis_dt = datetime.fromisoformat(analysis_timestamp.replace("Z", "+00:00"))
-                    if now and analysis_dt:
-                        age = (now - analysis_dt).total_seconds()
-                        if age < max_staleness:
-                            matrix['model_inputs_freshness'] = "FRESH"
-                        else:
-                            matrix['model_inputs_freshness'] = "STALE"
-                except (ValueError, TypeError):
-                    matrix['model_inputs_freshness'] = "UNKNOWN"
-
-            # Analysis freshness (directly from analysis output)
-            analysis_age = (now - (data.get('analysis_timestamp') or now)).total_seconds()
-            if analysis_age < max_staleness:
-                matrix['analysis_freshness'] = "FRESH"
-            else:
-                matrix['analysis_freshness'] = "STALE"
+        if not meta:
+            return matrix
 
-            # Team picks confidence and provenance from collection_meta if available
-            matrix['team_picks_confidence'] = meta.get('team_picks_confidence', 'UNKNOWN')
-            matrix['team_picks_provenance'] = meta.get('team_picks_provenance', 'UNKNOWN')
-        else:
-            matrix['team_picks_confidence'] = 'UNKNOWN'
-            matrix['team_picks_provenance'] = 'UNKNOWN'
+        # Heuristic freshness checks (basic)
+        now_ts = datetime.now(timezone.utc).timestamp()
+        max_staleness = 60 * 60  # 1 hour in seconds
 
+        def freshness(stamp: Any) -> str:
+            """FRESH/STALE by age; UNKNOWN for unparseable or naive timestamps."""
+            try:
+                if isinstance(stamp, str):
+                    stamp = _parse_iso_datetime(stamp)
+                if stamp.tzinfo is None:
+                    return "UNKNOWN"
+                age = now_ts - stamp.timestamp()
+            except (ValueError, TypeError, AttributeError):
+                return "UNKNOWN"
+            return "FRESH" if age < max_staleness else "STALE"
+
+        for matrix_key, meta_key in _META_FRESHNESS_FIELDS:
+            stamp = meta.get(meta_key)
+            if stamp:
+                matrix[matrix_key] = freshness(stamp)
+
+        # Analysis freshness (directly from analysis output); without a stamp the
+        # analysis is the one being produced by this run
+        analysis_stamp = data.get('analysis_timestamp')
+        matrix['analysis_freshness'] = freshness(analysis_stamp) if analysis_stamp else "FRESH"
+
+        # Team picks confidence and provenance from collection_meta if available
+        matrix['team_picks_confidence'] = meta.get('team_picks_confidence', 'UNKNOWN')
+        matrix['team_picks_provenance'] = meta.get('team_picks_provenance', 'UNKNOWN')
         return matrix
     
     async def _save_analysis_data(self, raw_data: Dict, analysis_output: Dict, run_id: Optional[str] = None, bundle_paths=None):
         """Save analysis data following the run bundle contract."""
         now = datetime.now(timezone.utc)
         timestamp = now.strftime("%Y%m%d_%H%M%S")
+        generated_at = now.isoformat()
         current_gw = raw_data.get('current_gameweek') or raw_data.get('my_team', {}).get('current_gameweek') or 0
         season = raw_data.get('season') or raw_data.get('my_team', {}).get('season') or "unknown"
 
@@ -1625,7 +1931,7 @@ class FPLSageIntegration:
             "run_id": run_id,
             "gameweek": current_gw,
             "season": season,
-            "generated_at": now.isoformat(),
+            "generated_at": generated_at,
             "source": raw_data.get("source", {"type": "bundle"}),
             "source_bundle": {
                 "bootstrap_static": str(bundle_paths.bootstrap_static) if bundle_paths else None,
@@ -1637,8 +1943,9 @@ class FPLSageIntegration:
             },
             "ruleset": raw_data.get("ruleset"),
         })
-        write_json_atomic(run_paths.data_collection, raw_with_meta)
-        logger.info(f"Raw data saved to {run_paths.data_collection}")
+        # Artifacts are encoded as they are added and published together below
+        batch = AtomicWriteBatch()
+        batch.add_json(run_paths.data_collection, raw_with_meta)
 
         # Pull decision object early (for FH snapshots)
         decision_obj = analysis_output['decision'] if analysis_output else None
@@ -1670,10 +1977,11 @@ class FPLSageIntegration:
                     my_team['injury_summary'] = fallback.get('summary', {})
                     my_team['injury_data_source'] = "resolved"
 
+        # Reusing a fresh bundle writes into its run dir; only the run stamp may differ there
         if manual_payload:
-            write_json_atomic(run_paths.injury_manual, manual_payload)
+            batch.add_json(run_paths.injury_manual, manual_payload, ignore_keys=INJURY_ARTIFACT_VOLATILE_KEYS)
         if resolved_payload:
-            write_json_atomic(run_paths.injury_resolved, resolved_payload)
+            batch.add_json(run_paths.injury_resolved, resolved_payload, ignore_keys=INJURY_ARTIFACT_VOLATILE_KEYS)
 
         if resolved_reports is not None:
             raw_data["injury_reports"] = resolved_reports
@@ -1700,17 +2008,10 @@ class FPLSageIntegration:
         fh_plan_squad = None
         if decision_obj and getattr(decision_obj, "free_hit_plan", None):
             fh_plan_squad = decision_obj.free_hit_plan.get("squad")
+        # Same fields as the pre-FH state; overriding the key keeps its position
         team_input_free_hit = {
-            "team_info": my_team.get("team_info", {}),
-            "chip_status": my_team.get("chip_status", {}),
-            "current_squad": fh_plan_squad or team_input_pre_fh.get("current_squad", []),
-            "recent_transfers": my_team.get("recent_transfers", []),
-            "active_chip": my_team.get("active_chip"),
-            "captain_info": my_team.get("captain_info", {}),
-            "lineup_source": my_team.get("lineup_source"),
-            "picks_gameweek": my_team.get("picks_gameweek"),
-            "current_gameweek": my_team.get("current_gameweek"),
-            "next_gameweek": my_team.get("next_gameweek"),
+            **team_input_pre_fh,
+            "current_squad": fh_plan_squad or team_input_pre_fh["current_squad"],
         }
 
         model_inputs = {
@@ -1718,7 +2019,7 @@ class FPLSageIntegration:
             "run_id": run_id,
             "gameweek": current_gw,
             "season": season,
-            "generated_at": now.isoformat(),
+            "generated_at": generated_at,
             "team_input": team_input_pre_fh,
             "team_input_pre_free_hit": team_input_pre_fh,
             "team_input_free_hit": team_input_free_hit,
@@ -1727,7 +2028,7 @@ class FPLSageIntegration:
             "fixture_input": raw_data.get("fixtures", []),
             "ruleset": raw_data.get("ruleset"),
         }
-        write_json_atomic(run_paths.model_inputs, model_inputs)
+        batch.add_json(run_paths.model_inputs, model_inputs)
 
         if analysis_output and decision_obj:
             serializable_analysis = {
@@ -1735,90 +2036,51 @@ class FPLSageIntegration:
                 'run_id': run_id,
                 'gameweek': current_gw,
                 'season': season,
-                'generated_at': now.isoformat(),
-                'decision': {
-                    'primary_decision': decision_obj.primary_decision,
-                    'reasoning': decision_obj.reasoning,
-                    'tilt_armor_threshold': decision_obj.tilt_armor_threshold,
-                    'risk_scenarios': [
-                        {
-                            'condition': r.condition,
-                            'expected_loss_range': r.expected_loss_range,
-                            'risk_level': r.risk_level.value,
-                            'probability_estimate': r.probability_estimate,
-                            'mitigation_action': r.mitigation_action
-                        } for r in decision_obj.risk_scenarios
-                    ],
-                    'lineup_focus': decision_obj.lineup_focus,
-                    'next_gw_prep': decision_obj.next_gw_prep,
-                    'variance_expectations': decision_obj.variance_expectations,
-                    'captaincy': decision_obj.captaincy,
-                    'transfer_recommendations': decision_obj.transfer_recommendations,
-                    'decision_status': decision_obj.decision_status,
-                    'confidence_score': decision_obj.confidence_score,
-                    'confidence_label': getattr(decision_obj, 'confidence_label', 'MEDIUM'),
-                    'confidence_summary': getattr(decision_obj, 'confidence_summary', ''),
-                    'block_reason': decision_obj.block_reason,
-                    'risk_posture': decision_obj.risk_posture,  # CRITICAL: Include risk posture!
-                    'strategy_mode': getattr(decision_obj, "strategy_mode", "BALANCED"),
-                    'rank_bucket': getattr(decision_obj, "rank_bucket", "unknown"),
-                    'manager_state': getattr(decision_obj, "manager_state", None),
-                    'near_threshold_moves': getattr(decision_obj, "near_threshold_moves", None),
-                    'strategy_paths': getattr(decision_obj, "strategy_paths", None),
-                    'squad_issues': getattr(decision_obj, "squad_issues", None),
-                    'chip_timing_outlook': getattr(decision_obj, "chip_timing_outlook", None),
-                    'fixture_planner': getattr(decision_obj, "fixture_planner", None),
-                    'fixture_planner_reason': getattr(decision_obj, "fixture_planner_reason", None),
-                    'no_transfer_reason': getattr(decision_obj, "no_transfer_reason", None),
-                    'near_threshold_reason': getattr(decision_obj, "near_threshold_reason", None),
-                    'strategy_paths_reason': getattr(decision_obj, "strategy_paths_reason", None),
-                    'chip_guidance': (
-                        decision_obj.chip_guidance.__dict__
-                        if getattr(decision_obj, "chip_guidance", None) else None
-                    ),
-                    'free_hit_context': getattr(decision_obj, "free_hit_context", None),
-                    'free_hit_plan': getattr(decision_obj, "free_hit_plan", None),
-                    'post_free_hit_plan': getattr(decision_obj, "post_free_hit_plan", None),
-                },
+                'generated_at': generated_at,
+                'decision': _decision_payload(decision_obj),
                 'analysis_timestamp': analysis_output['analysis_timestamp']
             }
-            write_json_atomic(run_paths.analysis, serializable_analysis)
-            logger.info(f"Analysis output saved to {run_paths.analysis}")
+            batch.add_json(run_paths.analysis, serializable_analysis)
 
             summary_text = analysis_output['formatted_summary']
-            write_text_atomic(run_paths.report, summary_text)
-            logger.info(f"Formatted summary saved to {run_paths.report}")
+            batch.add_text(run_paths.report, summary_text)
         else:
             serializable_analysis = {
                 'schema_version': "1.0.0",
                 'run_id': run_id,
                 'gameweek': current_gw,
                 'season': season,
-                'generated_at': now.isoformat(),
+                'generated_at': generated_at,
                 'decision': {},
                 'formatted_summary': "No analysis available.",
-                'analysis_timestamp': now.isoformat()
+                'analysis_timestamp': generated_at
             }
             summary_text = "# FPL Analysis\n\nNo analysis available."
-            write_json_atomic(run_paths.analysis, serializable_analysis)
-            write_text_atomic(run_paths.report, summary_text)
+            batch.add_json(run_paths.analysis, serializable_analysis)
+            batch.add_text(run_paths.report, summary_text)
 
         # Compatibility mirrors (legacy file names)
         mirror_raw = Path(f"outputs/data_collections/enhanced_fpl_data_{timestamp}.json")
         mirror_analysis = Path(f"outputs/processed_data/fpl_analysis_{timestamp}.json")
         mirror_summary = Path(f"outputs/processed_data/fpl_summary_{timestamp}.md")
-        write_json_atomic(mirror_raw, raw_with_meta)
+        batch.add_mirror(mirror_raw, run_paths.data_collection)
         if analysis_output:
-            write_json_atomic(mirror_analysis, serializable_analysis)
-            write_text_atomic(mirror_summary, summary_text)
+            batch.add_mirror(mirror_analysis, run_paths.analysis)
+            batch.add_mirror(mirror_summary, run_paths.report)
+
+        # Payloads are already encoded; only the blocking writes/fsyncs leave the loop
+        await asyncio.to_thread(batch.flush)
+        logger.info(f"Raw data saved to {run_paths.data_collection}")
+        logger.info(f"Analysis output saved to {run_paths.analysis}")
+        logger.info(f"Formatted summary saved to {run_paths.report}")
 
         # Update pointer + summary
         try:
-            bundle_manager.update_latest_pointer(run_paths)
+            await asyncio.to_thread(bundle_manager.update_latest_pointer, run_paths)
         except FileNotFoundError as exc:
             logger.error(f"Pointer update skipped: {exc}")
         try:
-            bundle_manager.update_data_summary(run_paths, season, current_gw)
+            await asyncio.to_thread(bundle_manager.update_data_summary, run_paths, season, current_gw)
         except (IOError, json.JSONDecodeError, KeyError, TypeError) as exc:
             logger.error(f"DATA_SUMMARY update failed: {exc}")
 
@@ -1826,8 +2088,8 @@ class FPLSageIntegration:
         """Read an injury artifact payload safely."""
         if path and path.exists():
             try:
-                return json.loads(path.read_text())
-            except (json.JSONDecodeError, IOError) as exc:
+                return load_json_file(path)
+            except (ValueError, OSError) as exc:
                 logger.warning("Failed to load injury artifact %s: %s", path, exc)
         return {"schema_version": "1.0.0", "reports": []}
 
@@ -1857,6 +2119,10 @@ class FPLSageIntegration:
         expected_ids = []
         for player in squad_players:
             player_id = player.get("player_id")
+            if isinstance(player_id, int):
+                # Bundle squads carry int ids; only coerce the odd str/float
+                expected_ids.append(player_id)
+                continue
             if player_id is None:
                 continue
             try:
@@ -1879,13 +2145,12 @@ class FPLSageIntegration:
             extra={"resolution_traces": resolution_traces},
         )
 
-        status_counts: Dict[str, int] = {}
-        low_confidence = 0
-        for report in resolved_reports:
-            status = (report.get("status") or "UNKNOWN").upper()
-            status_counts[status] = status_counts.get(status, 0) + 1
-            if (report.get("confidence") or "").upper() == "LOW":
-                low_confidence += 1
+        status_counts = dict(Counter(
+            (report.get("status") or "UNKNOWN").upper() for report in resolved_reports
+        ))
+        low_confidence = sum(
+            1 for report in resolved_reports if (report.get("confidence") or "").upper() == "LOW"
+        )
 
         return {
             "manual_payload": manual_payload,
@@ -1956,23 +2221,40 @@ class FPLSageIntegration:
         print("=" * 50)
 
     def _position_code(self, element_type: int) -> str:
-        return {1: 'GK', 2: 'DEF', 3: 'MID', 4: 'FWD'}.get(element_type, 'UNK')
+        return _POSITION_CODES.get(element_type, 'UNK')
 
     def _parse_status_flag(self, status: str, chance: Optional[int]) -> str:
-        if status in {'u', 'i', 's', 'n'}:
-            return 'OUT'
-        if status == 'd':
-            return 'DOUBT'
+        flag = _STATUS_FLAGS.get(status)
+        if flag:
+            return flag
         if chance is not None and chance <= 25:
             return 'DOUBT'
         return 'FIT'
 
-    def _get_captain_info_from_picks(self, picks_payload: Dict, bootstrap: Dict) -> Dict:
+    def _get_captain_info_from_picks(
+        self,
+        picks_payload: Dict,
+        bootstrap: Dict,
+        elements: Optional[Dict] = None,
+        teams: Optional[Dict] = None,
+    ) -> Dict:
         picks = picks_payload.get('picks', []) or picks_payload.get('team_picks', [])
-        elements = {p['id']: p for p in bootstrap.get('elements', [])}
-        teams = {t['id']: t for t in bootstrap.get('teams', [])}
-        captain_pick = next((p for p in picks if p.get('is_captain')), None)
-        vice_pick = next((p for p in picks if p.get('is_vice_captain')), None)
+        captain_pick = vice_pick = None
+        for pick in picks:
+            if captain_pick is None and pick.get('is_captain'):
+                captain_pick = pick
+            if vice_pick is None and pick.get('is_vice_captain'):
+                vice_pick = pick
+            if captain_pick is not None and vice_pick is not None:
+                break
+        if captain_pick is None and vice_pick is None:
+            return {'captain': None, 'vice_captain': None}
+
+        # Callers that already indexed the bootstrap pass elements/teams in
+        if elements is None:
+            elements = {p['id']: p for p in bootstrap.get('elements', [])}
+        if teams is None:
+            teams = {t['id']: t for t in bootstrap.get('teams', [])}
 
         def fmt_pick(pick):
             if not pick:
@@ -2029,12 +2311,16 @@ class FPLSageIntegration:
             if not element:
                 continue
             team = teams.get(element.get('team'))
+            team_short_name = team.get('short_name') if team else 'UNK'
+            if isinstance(team_short_name, str):
+                # Shared with projection.team (also interned) for identity-fast comparisons
+                team_short_name = sys.intern(team_short_name)
             chance = element.get('chance_of_playing_next_round')
             status_flag = self._parse_status_flag(element.get('status', ''), chance)
             current_squad.append({
                 'player_id': element.get('id'),
                 'name': element.get('web_name'),
-                'team': team.get('short_name') if team else 'UNK',
+                'team': team_short_name,
                 'team_id': element.get('team'),
                 'position': self._position_code(element.get('element_type')),
                 'current_price': element.get('now_cost', 0) / 10,
@@ -2088,12 +2374,12 @@ class FPLSageIntegration:
                 # Try to load enhanced FPL data to get the proper manager name
                 enhanced_data_path = self.bundle_paths.data_directory / "enhanced_fpl_data.json"
                 if enhanced_data_path and enhanced_data_path.exists():
-                    enhanced_data = self._load_json(enhanced_data_path)
+                    enhanced_data = load_json_file(enhanced_data_path)
                     if enhanced_data and "my_team" in enhanced_data and "team_info" in enhanced_data["my_team"]:
                         enhanced_manager_name = enhanced_data["my_team"]["team_info"].get("manager_name")
                         if enhanced_manager_name and enhanced_manager_name != "Unknown Manager":
                             manager_name = enhanced_manager_name
-            except (AttributeError, json.JSONDecodeError, KeyError, TypeError):
+            except (AttributeError, ValueError, OSError, KeyError, TypeError):
                 pass  # Fallback to Unknown Manager
         
         # Final fallback
@@ -2109,10 +2395,8 @@ class FPLSageIntegration:
         logger.info(f"Using framework risk_posture for team_data: {risk_posture}")
         
         # Update manager context with rank for future reference
-        if overall_rank and overall_rank > 0:
-            from cheddar_fpl_sage.utils.sprint3_5_config_manager import Sprint35ConfigManager
-            config_manager = Sprint35ConfigManager()
-            config_manager.update_manager_context(overall_rank=overall_rank)
+        if overall_rank and overall_rank > 0 and self.config_manager:
+            self.config_manager.update_manager_context(overall_rank=overall_rank)
 
         team_info = {
             'team_info': {
@@ -2134,7 +2418,7 @@ class FPLSageIntegration:
             'current_squad': current_squad,
             'recent_transfers': [],
             'active_chip': active_chip,
-            'captain_info': self._get_captain_info_from_picks(team_picks, bootstrap),
+            'captain_info': self._get_captain_info_from_picks(team_picks, bootstrap, elements, teams),
             'last_updated': datetime.now(timezone.utc).isoformat(),
             'picks_gameweek': team_picks.get('event') or next_gw or current_gw,
             'current_gameweek': current_gw,
@@ -2183,11 +2467,34 @@ class FPLSageIntegration:
 
         projections = []
         created_at = datetime.now(timezone.utc).isoformat()
-        pos_map = {1: "GK", 2: "DEF", 3: "MID", 4: "FWD"}
 
         def clamp(value: float, minimum: float, maximum: float) -> float:
             return max(minimum, min(maximum, value))
 
+        # Name, next fixture, fixture modifier and fixture tag bits depend only on the
+        # team, so resolve them once per team; the player loop then does a single
+        # lookup. The modifier is None for teams without a fixture in the target GW.
+        team_context = {}
+        for team_id in team_map.keys() | fixture_lookup.keys():
+            fixture_info = fixture_lookup.get(team_id)
+            fixture_modifier = None
+            fixture_tag_bits = _TAG_BLANK
+            if fixture_info and fixture_info.get("event") == current_gw:
+                difficulty = fixture_info["difficulty"]
+                venue_adj = 0.05 if fixture_info["is_home"] else -0.05
+                fixture_modifier = clamp(1 + (3 - difficulty) * 0.04 + venue_adj, 0.7, 1.2)
+                if difficulty >= 4:
+                    fixture_tag_bits = _TAG_TOUGH_FIXTURE
+                elif difficulty <= 2:
+                    fixture_tag_bits = _TAG_FAVORABLE_FIXTURE
+                else:
+                    fixture_tag_bits = 0
+            team_name = team_map.get(team_id) or f"Team {team_id}"
+            team_context[team_id] = (team_name, fixture_info, fixture_modifier, fixture_tag_bits)
+        minutes_divisor = max(1, current_gw - 1) if current_gw > 1 else 1
+        confidence_total = 0.0
+
+        safe_float = self._safe_float
         for player in players:
             if not isinstance(player, dict):
                 continue
@@ -2200,9 +2507,9 @@ class FPLSageIntegration:
 
             raw_pos = player.get("position") or player.get("element_type") or player.get("position_id")
             if isinstance(raw_pos, int):
-                position = pos_map.get(raw_pos, "UNK")
+                position = _POSITION_CODES.get(raw_pos, "UNK")
             elif isinstance(raw_pos, str) and raw_pos.isdigit():
-                position = pos_map.get(int(raw_pos), "UNK")
+                position = _POSITION_CODES.get(int(raw_pos), "UNK")
             elif isinstance(raw_pos, str):
                 position = raw_pos.upper()
             else:
@@ -2217,32 +2524,29 @@ class FPLSageIntegration:
             else:
                 price = 0.0
 
-            form_score = self._safe_float(player.get("form"))
-            season_ppg = self._safe_float(player.get("points_per_game"))
+            form_score = safe_float(player.get("form"))
+            season_ppg = safe_float(player.get("points_per_game"))
             recent_weight = 0.7
             base_points = max(0.1, recent_weight * form_score + (1 - recent_weight) * season_ppg)
 
-            xg = self._safe_float(player.get("expected_goals"))
-            xa = self._safe_float(player.get("expected_assists"))
-            xgi = self._safe_float(player.get("expected_goal_involvements"))
+            xg = safe_float(player.get("expected_goals"))
+            xa = safe_float(player.get("expected_assists"))
+            xgi = safe_float(player.get("expected_goal_involvements"))
             advanced_signal = xgi if xgi > 0 else (xg + xa)
             advanced_offset = (advanced_signal - 0.45) * 0.15
             advanced_modifier = clamp(1 + advanced_offset, 0.85, 1.15)
 
             team_id = player.get("team")
-            team_name = team_map.get(team_id)
-            if not team_name:
+            context = team_context.get(team_id)
+            if context is None:
                 team_name = f"Team {team_id}" if team_id is not None else "UNK"
-
-            fixture_info = fixture_lookup.get(team_id)
-            fixture_in_target_gw = bool(
-                fixture_info and fixture_info.get("event") == current_gw
-            )
-            fixture_modifier = 1.0
-            if fixture_in_target_gw:
-                diff_delta = 3 - fixture_info["difficulty"]
-                venue_adj = 0.05 if fixture_info["is_home"] else -0.05
-                fixture_modifier = clamp(1 + diff_delta * 0.04 + venue_adj, 0.7, 1.2)
+                fixture_info = fixture_modifier = None
+                fixture_tag_bits = _TAG_BLANK
+            else:
+                team_name, fixture_info, fixture_modifier, fixture_tag_bits = context
+            fixture_in_target_gw = fixture_modifier is not None
+            if not fixture_in_target_gw:
+                fixture_modifier = 1.0
 
             next_gw_pts = max(0, base_points * fixture_modifier * advanced_modifier)
             next6_pts = max(0, next_gw_pts * 5)
@@ -2251,9 +2555,7 @@ class FPLSageIntegration:
 
             chance_next = player.get("chance_of_playing_next_round")
             if chance_next is None:
-                minutes_recorded = self._safe_float(player.get("minutes"))
-                divisor = max(1, current_gw - 1) if current_gw > 1 else 1
-                observed_minutes = minutes_recorded / divisor if divisor else minutes_recorded
+                observed_minutes = safe_float(player.get("minutes")) / minutes_divisor
                 raw_minutes = observed_minutes if observed_minutes > 0 else 75
                 xmins = clamp(raw_minutes, 45, 90)
             else:
@@ -2262,42 +2564,26 @@ class FPLSageIntegration:
                 xmins = 0.0
 
             status_flag = str(player.get("status_flag") or player.get("status") or "").upper()
-            tags = []
-            if status_flag in {"OUT", "I", "INJURED", "S", "SUSPENDED"}:
-                tags.append("injury_risk")
-            if status_flag in {"DOUBT", "D"}:
-                tags.append("rotation_risk")
-                if "injury_risk" not in tags:
-                    tags.append("injury_risk")
+            tag_bits = _STATUS_TAG_BITS.get(status_flag, 0) | fixture_tag_bits
             # Treat any sub-85% availability as an injury concern for transfer-in filtering.
             if chance_next is not None and chance_next < 85:
-                if "injury_risk" not in tags:
-                    tags.append("injury_risk")
-            if fixture_in_target_gw:
-                if fixture_info["difficulty"] >= 4:
-                    tags.append("tough_fixture")
-                elif fixture_info["difficulty"] <= 2:
-                    tags.append("favorable_fixture")
-
-            # Mark players whose team has no fixture this GW (blank GW for this team)
-            if not fixture_in_target_gw:
-                tags.append("blank")
+                tag_bits |= _TAG_INJURY_RISK
+            tags = list(_PROJECTION_TAGS[tag_bits])
             consistency = clamp(base_points / 10, 0.0, 1.0)
             volatility = clamp(0.3 + (1 - consistency) * 0.45, 0.2, 0.75)
             ceiling = next_gw_pts * 1.4
             floor = max(0, next_gw_pts * 0.6)
 
-            coverage_signals = sum(
-                1 if signal > 0 else 0
-                for signal in (form_score, advanced_signal)
-            ) + (1 if fixture_in_target_gw else 0)
+            coverage_signals = (form_score > 0) + (advanced_signal > 0) + fixture_in_target_gw
             confidence = clamp(
                 0.35 + 0.1 * coverage_signals + 0.05 * consistency + (0.05 if fixture_in_target_gw else 0),
                 0.3,
                 0.95
             )
 
-            ownership_pct = self._safe_float(player.get("ownership") or player.get("selected_by_percent"))
+            confidence_total += confidence
+
+            ownership_pct = safe_float(player.get("ownership") or player.get("selected_by_percent"))
             
             # Extract fixture difficulty if available
             fixture_diff = fixture_info.get("difficulty") if fixture_info else None
@@ -2323,10 +2609,7 @@ class FPLSageIntegration:
                 )
             )
 
-        avg_confidence = (
-            sum(p.confidence for p in projections) / len(projections)
-            if projections else 0.0
-        )
+        avg_confidence = confidence_total / len(projections) if projections else 0.0
         if avg_confidence >= 0.6:
             confidence_level = "high"
         elif avg_confidence >= 0.45:
@@ -2368,10 +2651,8 @@ async def main():
             chip_status = sage._normalize_chip_status_map(
                 sage._ensure_dict(results['raw_data']['my_team'].get('chip_status', {}), "chip_status")
             )
-            available_chips = [
-                chip for chip, status in chip_status.items()
-                if isinstance(status, dict) and status.get('available', False)
-            ]
+            # Normalized entries are always dicts
+            available_chips = [chip for chip, status in chip_status.items() if status.get('available')]
             if available_chips:
                 print(f"🎯 Available chips: {', '.join(available_chips)}")
         
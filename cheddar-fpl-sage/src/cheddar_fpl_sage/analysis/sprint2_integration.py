@@ -110,7 +110,8 @@ class Sprint2IntegrationAdapter:
             f"(count: {ft_state.count}, confidence: {ft_state.confidence.value})"
         )
         
-        # Step 3: Create team state
+        # Step 3: Create team state (verified at the same instant the run context is stamped)
+        now = datetime.now()
         team_state = TeamStateResolution(
             resolution_state=(
                 ResolutionState.KNOWN_API if has_team_state 
@@ -122,7 +123,7 @@ class Sprint2IntegrationAdapter:
             ),
             data_source="fpl_api" if has_team_state else "unknown",
             last_verified_gw=current_gw,
-            last_verified_timestamp=datetime.now(),
+            last_verified_timestamp=now,
         )
         
         logger.info(
@@ -168,7 +169,7 @@ class Sprint2IntegrationAdapter:
                 },
                 "restrictions": restrictions.to_dict(),
                 "authority_level": authority_level,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
             }
         }
         
@@ -246,22 +247,18 @@ class Sprint2IntegrationAdapter:
         if team_data is None:
             team_data = {}
         
-        team_data['_sprint2_restrictions'] = {
-            'blocked_actions': sprint2_result['restrictions'].blocked_actions,
-            'authority_level': sprint2_result['authority_level'],
-            'warnings': sprint2_result['restrictions'].warnings,
-            'suggestions': sprint2_result['restrictions'].suggestions,
-        }
-        
-        team_data['_sprint2_ft_safe'] = (
-            sprint2_result['ft_state'].is_safe_to_plan_transfers()
-        )
-        team_data['_sprint2_chip_safe'] = (
-            sprint2_result['chip_state'].is_safe_to_use_chips()
-        )
-        team_data['_sprint2_team_safe'] = (
-            sprint2_result['team_state'].is_safe_to_suggest_lineup()
-        )
+        restrictions = sprint2_result['restrictions']
+        team_data.update({
+            '_sprint2_restrictions': {
+                'blocked_actions': restrictions.blocked_actions,
+                'authority_level': sprint2_result['authority_level'],
+                'warnings': restrictions.warnings,
+                'suggestions': restrictions.suggestions,
+            },
+            '_sprint2_ft_safe': sprint2_result['ft_state'].is_safe_to_plan_transfers(),
+            '_sprint2_chip_safe': sprint2_result['chip_state'].is_safe_to_use_chips(),
+            '_sprint2_team_safe': sprint2_result['team_state'].is_safe_to_suggest_lineup(),
+        })
         
         return team_data
 
@@ -10,7 +10,7 @@ Minimal, non-intrusive injection:
 - Replaces generic output codes with explicit codes (D)
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List, Tuple
 
 from cheddar_fpl_sage.utils.sprint3_fixes import (
@@ -22,15 +22,15 @@ from cheddar_fpl_sage.utils.sprint3_fixes import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Sprint3Context:
     """Context for Sprint 3 fixes during a run."""
     season: Optional[int] = None
     season_source: str = "unknown"
     season_error: Optional[str] = None
     
-    injury_counts: Dict[str, int] = None
-    bench_injuries: List[Dict[str, Any]] = None
+    injury_counts: Dict[str, int] = field(default_factory=dict)
+    bench_injuries: List[Dict[str, Any]] = field(default_factory=list)
     
     framework_crash: Optional[CrashContext] = None
     output_code: Optional[str] = None
@@ -41,8 +41,8 @@ class Sprint3Context:
             "season": self.season,
             "season_source": self.season_source,
             "season_error": self.season_error,
-            "injury_counts": self.injury_counts or {},
-            "bench_injuries_count": len(self.bench_injuries) if self.bench_injuries else 0,
+            "injury_counts": self.injury_counts,
+            "bench_injuries_count": len(self.bench_injuries),
             "framework_crash": self.framework_crash.to_dict() if self.framework_crash else None,
             "output_code": self.output_code,
         }
@@ -73,10 +73,18 @@ def _write_with_metadata(path: Path, payload: Dict[str, Any], run_id: str, seaso
     write_json_atomic(path, enriched)
 
 
-async def collect_weekly_bundle(team_id: Optional[int], target_gw: Optional[int], force_refresh: bool = False, run_id: Optional[str] = None) -> BundlePaths:
+async def collect_weekly_bundle(
+    team_id: Optional[int],
+    target_gw: Optional[int],
+    force_refresh: bool = False,
+    run_id: Optional[str] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> BundlePaths:
     """
     Collect weekly data and write into a run bundle.
     Returns BundlePaths pointing to saved artifacts.
+
+    Pass ``session`` to reuse a caller-owned connection pool; it is not closed here.
     """
     manager = OutputBundleManager()
     resolved_run_id = run_id or generate_run_id(target_gw)
@@ -100,66 +108,70 @@ async def collect_weekly_bundle(team_id: Optional[int], target_gw: Optional[int]
         injury_resolved=data_dir / "injury_resolved.json",
     )
 
-    async def _collect():
+    async def _collect(session: aiohttp.ClientSession):
         base_url = "https://fantasy.premierleague.com/api"
-        async with aiohttp.ClientSession() as session:
-            bootstrap_resp, fixtures_resp, events_resp = await asyncio.gather(
-                _fetch_json(session, f"{base_url}/bootstrap-static/"),
-                _fetch_json(session, f"{base_url}/fixtures/"),
-                _fetch_json(session, f"{base_url}/events/"),
-            )
-            picks_resp = None
-            team_picks_provenance = None
-            team_picks_confidence = None
-            entry_resp = None
-            if team_id:
-                gw_for_picks = target_gw
-                if gw_for_picks is None:
-                    # derive next GW from events
-                    next_events = [e for e in events_resp["payload"] if isinstance(e, dict) and e.get("is_next")]
-                    if next_events:
-                        gw_for_picks = next_events[0].get("id")
-                gw_for_picks = gw_for_picks or target_gw or 1
-                # Try to fetch picks for the target gameweek
-                picks_resp = await _fetch_json(session, f"{base_url}/entry/{team_id}/event/{gw_for_picks}/picks/")
-                if picks_resp["status"] == 200:
-                    team_picks_provenance = "AVAILABLE"
-                    team_picks_confidence = "HIGH"
-                elif picks_resp["status"] == 404 and gw_for_picks > 1:
-                    current_events = [e for e in events_resp["payload"] if isinstance(e, dict) and e.get("is_current")]
-                    if current_events:
-                        fallback_gw = current_events[0].get("id", gw_for_picks - 1)
-                        print(f"⚠️  No picks available for GW{gw_for_picks}, trying GW{fallback_gw}...")
-                        fallback_resp = await _fetch_json(session, f"{base_url}/entry/{team_id}/event/{fallback_gw}/picks/")
-                        if fallback_resp["status"] == 200:
-                            picks_resp = fallback_resp
-                            team_picks_provenance = "FALLBACK_CURRENT_GW"
-                            team_picks_confidence = "MED"
-                            print(f"✅ Using picks from GW{fallback_gw}")
-                        else:
-                            team_picks_provenance = "UNAVAILABLE_404"
-                            team_picks_confidence = "LOW"
+        bootstrap_resp, fixtures_resp, events_resp = await asyncio.gather(
+            _fetch_json(session, f"{base_url}/bootstrap-static/"),
+            _fetch_json(session, f"{base_url}/fixtures/"),
+            _fetch_json(session, f"{base_url}/events/"),
+        )
+        picks_resp = None
+        team_picks_provenance = None
+        team_picks_confidence = None
+        entry_resp = None
+        if team_id:
+            gw_for_picks = target_gw
+            if gw_for_picks is None:
+                # derive next GW from events
+                next_events = [e for e in events_resp["payload"] if isinstance(e, dict) and e.get("is_next")]
+                if next_events:
+                    gw_for_picks = next_events[0].get("id")
+            gw_for_picks = gw_for_picks or target_gw or 1
+            # Try to fetch picks for the target gameweek
+            picks_resp = await _fetch_json(session, f"{base_url}/entry/{team_id}/event/{gw_for_picks}/picks/")
+            if picks_resp["status"] == 200:
+                team_picks_provenance = "AVAILABLE"
+                team_picks_confidence = "HIGH"
+            elif picks_resp["status"] == 404 and gw_for_picks > 1:
+                current_events = [e for e in events_resp["payload"] if isinstance(e, dict) and e.get("is_current")]
+                if current_events:
+                    fallback_gw = current_events[0].get("id", gw_for_picks - 1)
+                    print(f"⚠️  No picks available for GW{gw_for_picks}, trying GW{fallback_gw}...")
+                    fallback_resp = await _fetch_json(session, f"{base_url}/entry/{team_id}/event/{fallback_gw}/picks/")
+                    if fallback_resp["status"] == 200:
+                        picks_resp = fallback_resp
+                        team_picks_provenance = "FALLBACK_CURRENT_GW"
+                        team_picks_confidence = "MED"
+                        print(f"✅ Using picks from GW{fallback_gw}")
                     else:
                         team_picks_provenance = "UNAVAILABLE_404"
                         team_picks_confidence = "LOW"
-                elif picks_resp["status"] >= 500 or picks_resp["status"] < 0:
-                    team_picks_provenance = "FAILED"
-                    team_picks_confidence = "LOW"
                 else:
                     team_picks_provenance = "UNAVAILABLE_404"
                     team_picks_confidence = "LOW"
-                entry_resp = await _fetch_json(session, f"{base_url}/entry/{team_id}/")
-            return (
-                bootstrap_resp,
-                fixtures_resp,
-                events_resp,
-                picks_resp,
-                team_picks_provenance,
-                team_picks_confidence,
-                entry_resp,
-            )
+            elif picks_resp["status"] >= 500 or picks_resp["status"] < 0:
+                team_picks_provenance = "FAILED"
+                team_picks_confidence = "LOW"
+            else:
+                team_picks_provenance = "UNAVAILABLE_404"
+                team_picks_confidence = "LOW"
+            entry_resp = await _fetch_json(session, f"{base_url}/entry/{team_id}/")
+        return (
+            bootstrap_resp,
+            fixtures_resp,
+            events_resp,
+            picks_resp,
+            team_picks_provenance,
+            team_picks_confidence,
+            entry_resp,
+        )
 
-    bootstrap_resp, fixtures_resp, events_resp, picks_resp, team_picks_provenance, team_picks_confidence, entry_resp = await _collect()
+    if session is not None:
+        collected = await _collect(session)
+    else:
+        async with aiohttp.ClientSession() as own_session:
+            collected = await _collect(own_session)
+    bootstrap_resp, fixtures_resp, events_resp, picks_resp, team_picks_provenance, team_picks_confidence, entry_resp = collected
 
     season = ""
     events_payload = events_resp["payload"] or []
@@ -21,6 +21,8 @@ logger = logging.getLogger(__name__)
 
 CACHE_DIR = Path("outputs") / "injury_cache"
 SECONDARY_FEED_NAME = "secondary_feed.json"
+# Fields of build_injury_artifact_payload that change on every build
+INJURY_ARTIFACT_VOLATILE_KEYS = ("run_id", "generated_at")
 
 
 def _ensure_cache_dir():
@@ -96,13 +98,13 @@ def load_secondary_injury_payload(cache_path: Optional[Path] = None, fallback_pa
     payload: Dict[str, Any] = {"schema_version": "1.0.0", "reports": []}
     if cache_file.exists():
         try:
-            payload = json.loads(cache_file.read_text())
+            payload = json.loads(cache_file.read_text(encoding="utf-8"))
         except Exception:
             logger.warning(f"Failed to parse secondary feed cache {cache_file}; falling back to fallback source.")
             payload = payload
     elif fallback_path and fallback_path.exists():
         try:
-            payload = json.loads(fallback_path.read_text())
+            payload = json.loads(fallback_path.read_text(encoding="utf-8"))
         except Exception:
             payload = payload
     return {
@@ -3,10 +3,13 @@ Canonical Projection Contracts
 Establishes single source of truth for post-engine projections
 """
 
+import heapq
+import sys
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class CanonicalPlayerProjection:
     """
     Single canonical projection format used by ALL downstream components.
@@ -39,6 +42,13 @@ class CanonicalPlayerProjection:
     # Fixture context
     fixture_difficulty: Optional[int] = None  # 1-5 scale (1=easiest, 5=hardest)
     
+    def __post_init__(self):
+        # Only ~20 teams and 4 positions: intern so equality checks short-circuit on identity
+        if isinstance(self.position, str):
+            self.position = sys.intern(self.position)
+        if isinstance(self.team, str):
+            self.team = sys.intern(self.team)
+    
     @property
     def effective_ownership(self) -> Optional[float]:
         """Calculate EO only when we have captaincy data"""
@@ -80,7 +90,7 @@ class CanonicalProjectionSet:
         return [p for p in self.projections if any(tag in p.tags for tag in tags)]
     
     def top_by_points(self, n: int = 10) -> List[CanonicalPlayerProjection]:
-        return sorted(self.projections, key=lambda x: x.nextGW_pts, reverse=True)[:n]
+        return heapq.nlargest(n, self.projections, key=attrgetter("nextGW_pts"))
 
 @dataclass
 class OptimizedXI:
@@ -24,6 +24,13 @@ class InjuryConfidence(Enum):
     LOW = "LOW"
 
 
+def _member_by_name(enum_cls, raw: Any, default: Enum) -> Enum:
+    """Case-insensitive member lookup by name; non-strings and unknown names give default."""
+    if isinstance(raw, str):
+        return enum_cls.__members__.get(raw.strip().upper(), default)
+    return default
+
+
 @dataclass
 class InjuryReport:
     player_id: int
@@ -64,23 +71,9 @@ class InjuryReport:
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "InjuryReport":
         status_raw = payload.get("status") or payload.get("status_flag") or payload.get("status_label")
-        status = InjuryStatus.UNKNOWN
-        if isinstance(status_raw, str):
-            status_key = status_raw.strip().upper()
-            if status_key in InjuryStatus.__members__:
-                status = InjuryStatus[status_key]
-        source_raw = payload.get("source")
-        source = InjurySource.UNKNOWN
-        if isinstance(source_raw, str):
-            key = source_raw.strip().upper()
-            if key in InjurySource.__members__:
-                source = InjurySource[key]
-        confidence_raw = payload.get("confidence")
-        confidence = InjuryConfidence.HIGH
-        if isinstance(confidence_raw, str):
-            key = confidence_raw.strip().upper()
-            if key in InjuryConfidence.__members__:
-                confidence = InjuryConfidence[key]
+        status = _member_by_name(InjuryStatus, status_raw, InjuryStatus.UNKNOWN)
+        source = _member_by_name(InjurySource, payload.get("source"), InjurySource.UNKNOWN)
+        confidence = _member_by_name(InjuryConfidence, payload.get("confidence"), InjuryConfidence.HIGH)
         asof = payload.get("asof_utc") or payload.get("asof") or datetime.now(timezone.utc).isoformat()
         reason = payload.get("reason") or payload.get("notes") or payload.get("injury_note")
         player_id = payload.get("player_id", -1)
@@ -2,10 +2,12 @@
 Versioned FPL rules layer (single source of truth).
 """
 
+import copy
+import functools
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 
 @dataclass
@@ -19,13 +21,21 @@ class Ruleset:
     source: str
 
 
+@functools.lru_cache(maxsize=8)
+def _read_ruleset_json(path: str, stat_key: Tuple[int, int]) -> Dict[str, Any]:
+    """Parse a ruleset file once per on-disk version (mtime_ns, size)."""
+    with open(path) as f:
+        return json.load(f)
+
+
 def load_ruleset(season_id: str, base_dir: Path = Path("config/rulesets")) -> Ruleset:
     """Load a ruleset JSON by season_id."""
     rules_path = base_dir / f"{season_id}.json"
     if not rules_path.exists():
         raise FileNotFoundError(f"Ruleset not found for season {season_id}: {rules_path}")
-    with rules_path.open() as f:
-        data = json.load(f)
+    stat = rules_path.stat()
+    # Copy so callers can't mutate the cached policies
+    data = copy.deepcopy(_read_ruleset_json(str(rules_path.resolve()), (stat.st_mtime_ns, stat.st_size)))
     return Ruleset(
         season_id=data.get("season_id", season_id),
         version=data.get("ruleset_version", "0.0.0"),
@@ -5,7 +5,15 @@ Helper functions and tools
 
 from .chip_status_manager import ChipStatusManager
 from .manual_transfer_manager import ManualTransferManager
-from .output_manager import OutputBundleManager, generate_run_id, write_json_atomic, write_text_atomic
+from .output_manager import (
+    AtomicWriteBatch,
+    OutputBundleManager,
+    dump_json_bytes,
+    generate_run_id,
+    load_json_file,
+    write_json_atomic,
+    write_text_atomic,
+)
 
 # Sprint 2: Resolvable States Framework
 from .resolvable_states import (
@@ -31,8 +39,11 @@ __all__ = [
     # Legacy
     'ChipStatusManager',
     'ManualTransferManager',
+    'AtomicWriteBatch',
     'OutputBundleManager',
+    'dump_json_bytes',
     'generate_run_id',
+    'load_json_file',
     'write_json_atomic',
     'write_text_atomic',
     # Sprint 2
@@ -4,11 +4,24 @@ Handles run_id generation, atomic writes, and pointer/summary updates.
 """
 
 import json
+import math
 import os
-from dataclasses import dataclass
+import shutil
+import threading
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime, timezone
+from enum import Enum
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+
+# Serializes LATEST.json / DATA_SUMMARY.json updates; analyses run them on worker threads
+_INDEX_LOCK = threading.Lock()
 
 
 def _ensure_dir(path: Path) -> None:
@@ -16,26 +29,178 @@ def _ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def write_json_atomic(path: Path, payload: Dict) -> None:
-    """Atomically write JSON to disk."""
+def load_json_file(path: Path) -> Any:
+    """Read and decode a JSON file (orjson when installed, else stdlib json)."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode dataclasses field-by-field (no asdict deep copy), enums by value; str() anything else."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _null_non_finite(obj: Any) -> Any:
+    """Copy of obj with NaN/Infinity floats replaced by None (dataclasses are expanded)."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _null_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_null_non_finite(value) for value in obj]
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _null_non_finite(_json_default(obj))
+    return obj
+
+
+def dump_json_bytes(payload: Any) -> bytes:
+    """
+    Encode payload as 2-space indented JSON bytes.
+
+    Uses orjson when installed, else stdlib json. Datetimes and dataclasses are
+    passed through to _json_default and NaN/Infinity become null under both, so
+    the output is the same JSON; only exponent floats are spelled differently
+    (orjson ``1e20``, stdlib ``1e+20``).
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            payload,
+            default=_json_default,
+            option=(
+                orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+            ),
+        )
+    try:
+        encoded = json.dumps(payload, indent=2, ensure_ascii=False, allow_nan=False, default=_json_default)
+    except ValueError:
+        # NaN/Infinity are not JSON; write them as null like orjson (only walked when present)
+        encoded = json.dumps(_null_non_finite(payload), indent=2, ensure_ascii=False, default=_json_default)
+    return encoded.encode("utf-8")
+
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_suffix(path.suffix + ".tmp")
+
+
+def _holds_same_json(path: Path, data: bytes, ignore_keys: Tuple[str, ...]) -> bool:
+    """True if path decodes to the same JSON object as data once ignore_keys are dropped from both."""
+    try:
+        on_disk = load_json_file(path)
+    except (OSError, ValueError):
+        return False
+    staged = orjson.loads(data) if orjson is not None else json.loads(data)
+    if not (isinstance(on_disk, dict) and isinstance(staged, dict)):
+        return False
+    for key in ignore_keys:
+        on_disk.pop(key, None)
+        staged.pop(key, None)
+    return on_disk == staged
+
+
+def _write_tmp_durably(path: Path, data: bytes) -> Path:
+    """Write data to path's .tmp sibling and fsync it; return the temp path."""
     _ensure_dir(path.parent)
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-    with tmp_path.open("w") as f:
-        json.dump(payload, f, indent=2, default=str)
+    tmp_path = _tmp_path(path)
+    with tmp_path.open("wb") as f:
+        f.write(data)
         f.flush()
         os.fsync(f.fileno())
-    tmp_path.replace(path)
+    return tmp_path
+
+
+def write_json_atomic(path: Path, payload: Dict) -> None:
+    """Atomically write JSON to disk (see dump_json_bytes). Dataclass values are written as objects."""
+    _write_tmp_durably(path, dump_json_bytes(payload)).replace(path)
 
 
 def write_text_atomic(path: Path, content: str) -> None:
-    """Atomically write text to disk."""
-    _ensure_dir(path.parent)
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-    with tmp_path.open("w") as f:
-        f.write(content)
-        f.flush()
-        os.fsync(f.fileno())
-    tmp_path.replace(path)
+    """Atomically write text to disk as UTF-8."""
+    _write_tmp_durably(path, content.encode("utf-8")).replace(path)
+
+
+class AtomicWriteBatch:
+    """
+    Collect run-bundle artifact writes and publish them together.
+
+    Payloads are encoded as they are added. flush() writes and fsyncs every
+    temp file before renaming any of them into place, so a failure part-way
+    leaves the previous artifacts untouched instead of a half-updated bundle.
+    Mirrors added with add_mirror() are published after that as hard links
+    to their source artifact (or a copy of its bytes across filesystems).
+    Artifacts added with ignore_keys are skipped when the file on disk already
+    holds the same JSON apart from those top-level keys (e.g. generated_at).
+    Used as a context manager, the batch is flushed on clean exit and
+    discarded if the block raises.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[Path, bytes] = {}
+        self._mirrors: List[Tuple[Path, Path]] = []
+        self._ignore_keys: Dict[Path, Tuple[str, ...]] = {}
+
+    def __enter__(self) -> "AtomicWriteBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self._pending.clear()
+            self._mirrors.clear()
+            self._ignore_keys.clear()
+
+    def add_json(self, path: Path, payload: Any, ignore_keys: Tuple[str, ...] = ()) -> None:
+        self._pending[path] = dump_json_bytes(payload)
+        if ignore_keys:
+            self._ignore_keys[path] = ignore_keys
+
+    def add_text(self, path: Path, content: str) -> None:
+        self._pending[path] = content.encode("utf-8")
+
+    def add_mirror(self, path: Path, source: Path) -> None:
+        """Publish path with the same bytes as an artifact already in the batch."""
+        if source not in self._pending:
+            raise KeyError(f"Mirror source not staged in this batch: {source}")
+        self._mirrors.append((path, source))
+
+    def flush(self) -> None:
+        """Write all pending artifacts, rename them into place, then publish mirrors."""
+        pending, self._pending = self._pending, {}
+        mirrors, self._mirrors = self._mirrors, []
+        ignore_keys, self._ignore_keys = self._ignore_keys, {}
+        written: List[Path] = []
+        try:
+            for path, data in pending.items():
+                if path in ignore_keys and _holds_same_json(path, data, ignore_keys[path]):
+                    continue
+                written.append(path)
+                _write_tmp_durably(path, data)
+        except OSError:
+            for path in written:
+                _tmp_path(path).unlink(missing_ok=True)
+            raise
+        for path in written:
+            _tmp_path(path).replace(path)
+        for path, source in mirrors:
+            tmp = _tmp_path(path)
+            _ensure_dir(path.parent)
+            tmp.unlink(missing_ok=True)
+            try:
+                os.link(source, tmp)
+            except OSError:
+                # Cross-device or no hard-link support
+                shutil.copyfile(source, tmp)
+            tmp.replace(path)
 
 
 def generate_run_id(current_gw: Optional[int] = None) -> str:
@@ -109,11 +274,10 @@ class OutputBundleManager:
     def _validate_json_payload(self, path: Path) -> None:
         """Ensure required top-level fields exist in the JSON artifact."""
         required_fields = {"schema_version", "run_id", "gameweek", "season", "generated_at"}
-        with path.open() as f:
-            try:
-                payload = json.load(f)
-            except Exception as exc:
-                raise ValueError(f"Invalid JSON in {path}: {exc}") from exc
+        try:
+            payload = load_json_file(path)
+        except ValueError as exc:
+            raise ValueError(f"Invalid JSON in {path}: {exc}") from exc
         missing = [field for field in required_fields if field not in payload]
         if missing:
             raise ValueError(f"Missing required fields {missing} in {path}")
@@ -141,14 +305,19 @@ class OutputBundleManager:
             "report": str(run_paths.report),
             "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         }
-        write_json_atomic(self.latest_pointer, payload)
+        with _INDEX_LOCK:
+            write_json_atomic(self.latest_pointer, payload)
 
     def update_data_summary(self, run_paths: RunPaths, season: str, gameweek: int) -> None:
         """Append/update DATA_SUMMARY.json with the latest run entry."""
+        with _INDEX_LOCK:
+            self._update_data_summary(run_paths, season, gameweek)
+
+    def _update_data_summary(self, run_paths: RunPaths, season: str, gameweek: int) -> None:
         summary = []
         if self.summary_file.exists():
             try:
-                loaded = json.loads(self.summary_file.read_text())
+                loaded = load_json_file(self.summary_file)
                 if isinstance(loaded, list):
                     summary = [row for row in loaded if isinstance(row, dict)]
                 else:
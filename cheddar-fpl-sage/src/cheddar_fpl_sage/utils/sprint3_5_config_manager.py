@@ -15,6 +15,8 @@ This module provides:
 4. Manager identity extraction and storage
 """
 
+import copy
+import functools
 import json
 from pathlib import Path
 from typing import Dict, Optional, Any, Tuple, Union
@@ -54,6 +56,40 @@ def normalize_manual_chip_status(chip_status: Dict) -> Dict:
     return normalized
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, stat_key: Tuple[int, int, int]) -> Dict[str, Any]:
+    """
+    Parse and validate a config file once per on-disk version.
+
+    ``stat_key`` is (st_mtime_ns, st_size, st_ino), so any rewrite of the file
+    produces a new cache entry. Callers must copy the result before mutating it.
+    """
+    with open(path, 'r') as f:
+        raw_content = f.read()
+    return _parse_config_content(raw_content)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_content(raw_content: str) -> Dict[str, Any]:
+    """
+    Validate config text, memoized on content.
+
+    A rewrite with identical content (e.g. a save that changed nothing) gets a
+    new stat key but skips Pydantic validation here.
+    """
+    # Handle double-encoded JSON (legacy issue)
+    try:
+        raw = json.loads(raw_content)
+        if isinstance(raw, str):
+            raw = json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise ConfigurationError(f"Invalid JSON in config file: {e}")
+
+    # Validate with Pydantic
+    validated = TeamConfig.model_validate(raw)
+    return Sprint35ConfigManager._team_config_to_dict(validated)
+
+
 class Sprint35ConfigManager:
     """
     Centralized config management for Sprint 3.5
@@ -111,20 +147,14 @@ class Sprint35ConfigManager:
             return self._config_cache
 
         try:
-            with open(self.config_file, 'r') as f:
-                raw_content = f.read()
-
-            # Handle double-encoded JSON (legacy issue)
-            try:
-                raw = json.loads(raw_content)
-                if isinstance(raw, str):
-                    raw = json.loads(raw)
-            except json.JSONDecodeError as e:
-                raise ConfigurationError(f"Invalid JSON in config file: {e}")
-
-            # Validate with Pydantic
-            validated = TeamConfig.model_validate(raw)
-            self._config_cache = self._team_config_to_dict(validated)
+            # Parsed configs are shared process-wide per file version; hand out
+            # a private copy so callers can mutate it freely.
+            stat = self.config_file.stat()
+            cached = _load_config_cached(
+                str(self.config_file.resolve()),
+                (stat.st_mtime_ns, stat.st_size, stat.st_ino),
+            )
+            self._config_cache = copy.deepcopy(cached)
             self._last_reload_time = datetime.now()
             return self._config_cache
 
@@ -145,6 +175,8 @@ class Sprint35ConfigManager:
     def invalidate_cache(self):
         """Force cache to be reloaded on next access"""
         self._config_cache = None
+        _load_config_cached.cache_clear()
+        _parse_config_content.cache_clear()
         self._last_reload_time = None
     
     def get_config(self, force_reload: bool = False) -> Dict:
@@ -163,10 +195,10 @@ class Sprint35ConfigManager:
     
     def _ensure_dict(self, value: Any, default: Optional[Dict] = None) -> Dict:
         """Ensure value is a dict."""
+        if type(value) is dict or isinstance(value, dict):
+            return value
         if default is None:
             default = {}
-        if isinstance(value, dict):
-            return value
         if isinstance(value, str):
             try:
                 parsed = json.loads(value)
@@ -372,7 +404,8 @@ class Sprint35ConfigManager:
             logger.error(f"Failed to set risk posture: {e}")
             return False
     
-    def _team_config_to_dict(self, config: TeamConfig) -> Dict[str, Any]:
+    @staticmethod
+    def _team_config_to_dict(config: TeamConfig) -> Dict[str, Any]:
         """Convert TeamConfig to dict, preserving structure for backward compatibility."""
         result = config.model_dump(mode='json')
         # Convert ChipStatus objects back to dicts for compatibility
@@ -20,7 +20,7 @@ class GateResult:
 
 
 def _load_json(path: Path):
-    with path.open() as f:
+    with path.open(encoding="utf-8") as f:
         data = json.load(f)
         # Handle wrapped format - if data has "data" key with list/dict, extract it
         if isinstance(data, dict) and "data" in data:
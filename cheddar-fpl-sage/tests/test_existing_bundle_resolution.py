@@ -0,0 +1,278 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import cheddar_fpl_sage.analysis.fpl_sage_integration as integration_module
+from cheddar_fpl_sage.analysis.fpl_sage_integration import (
+    _resolve_fresh_bundle,
+    _resolve_fresh_bundle_cached,
+    _unwrap_payload,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_bundle_cache():
+    _resolve_fresh_bundle_cached.cache_clear()
+    yield
+    _resolve_fresh_bundle_cached.cache_clear()
+
+
+def _write_bundle(root, team_id=1, run_id="run-1", target_gw=20, collected_at=None):
+    data_dir = root / "outputs" / "runs" / f"team_{team_id}" / run_id / "data_collections"
+    data_dir.mkdir(parents=True)
+    collected_at = collected_at or datetime.now(timezone.utc).isoformat()
+    artifacts = {
+        "bootstrap_static.json": {"elements": []},
+        "fixtures.json": [{"id": 1, "event": target_gw, "team_h": 1, "team_a": 2}],
+        "events.json": [{"id": target_gw, "deadline_time": "2026-01-01T11:00:00Z"}],
+        f"slate_gw{target_gw}.json": {"fixture_count": 1},
+        "team_picks.json": {"picks": [{"element": i} for i in range(15)]},
+        "collection_meta.json": {"collected_at": collected_at, "target_gw": target_gw},
+    }
+    for name, payload in artifacts.items():
+        (data_dir / name).write_text(json.dumps(payload))
+    latest = root / "outputs" / "LATEST.json"
+    latest.write_text(json.dumps({"team_id": str(team_id), "run_id": run_id}))
+    return latest
+
+
+def _resolve(latest, team_id=1, target_gw=20):
+    return _resolve_fresh_bundle(str(latest.resolve()), latest.stat().st_mtime_ns, team_id, target_gw)
+
+
+def test_fresh_bundle_is_resolved_once_per_latest_version(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    latest = _write_bundle(tmp_path)
+    calls = []
+    real_validate = integration_module.validate_bundle
+    monkeypatch.setattr(
+        integration_module,
+        "validate_bundle",
+        lambda *args, **kwargs: calls.append(args) or real_validate(*args, **kwargs),
+    )
+
+    first = _resolve(latest)
+    second = _resolve(latest)
+
+    assert first is second
+    bundle_paths, fresh_until = first
+    assert bundle_paths.run_id == "run-1"
+    assert fresh_until > datetime.now(timezone.utc) + timedelta(days=2)
+    assert len(calls) == 1
+
+    stat = latest.stat()
+    os.utime(latest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    _resolve(latest)
+    assert len(calls) == 2
+
+
+def test_stale_or_foreign_bundle_is_not_reused(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    stale = (datetime.now(timezone.utc) - timedelta(days=4)).isoformat()
+    latest = _write_bundle(tmp_path, collected_at=stale)
+
+    assert _resolve(latest) is None
+    assert _resolve(latest, team_id=2) is None
+
+
+def test_missing_bundle_is_not_memoized(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    latest = _write_bundle(tmp_path)
+    run_dir = tmp_path / "outputs" / "runs" / "team_1" / "run-1"
+    shutil.move(run_dir, tmp_path / "elsewhere")
+
+    assert _resolve(latest) is None
+    shutil.move(tmp_path / "elsewhere", run_dir)
+    assert _resolve(latest) is not None
+
+
+def test_pruned_bundle_is_dropped_from_the_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    latest = _write_bundle(tmp_path)
+    assert _resolve(latest) is not None
+
+    shutil.rmtree(tmp_path / "outputs" / "runs" / "team_1" / "run-1")
+
+    assert _resolve(latest) is None
+    assert _resolve_fresh_bundle_cached.cache_info().currsize == 0
+
+
+@pytest.fixture
+def _non_utc_local_time(monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("needs time.tzset to change the local timezone")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_naive_collected_at_is_read_as_utc(tmp_path, monkeypatch, _non_utc_local_time):
+    monkeypatch.chdir(tmp_path)
+    collected = datetime.now(timezone.utc).replace(microsecond=0)
+    latest = _write_bundle(tmp_path, collected_at=collected.replace(tzinfo=None).isoformat())
+
+    _, fresh_until = _resolve(latest)
+
+    assert fresh_until == collected + timedelta(minutes=integration_module.EXISTING_BUNDLE_MAX_MINUTES)
+
+
+def test_unwrap_payload_handles_wrapped_and_bare_artifacts():
+    fixtures = [{"id": 1}]
+    assert _unwrap_payload({"data": fixtures, "collected_at": "x"}) is fixtures
+    assert _unwrap_payload({"data": {"elements": []}}) == {"elements": []}
+    assert _unwrap_payload(fixtures) is fixtures
+    assert _unwrap_payload({"picks": [], "data": None}) == {"picks": [], "data": None}
+    assert _unwrap_payload(None) is None
+
+
+def test_prefetch_bundle_files_skips_missing_artifacts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    latest = _write_bundle(tmp_path)
+    bundle_paths, _ = _resolve(latest)
+    advised = []
+    if hasattr(os, "posix_fadvise"):
+        real_fadvise = os.posix_fadvise
+        monkeypatch.setattr(
+            integration_module.os,
+            "posix_fadvise",
+            lambda fd, *args: advised.append(fd) or real_fadvise(fd, *args),
+        )
+
+    # entry_info.json was never written; it must be skipped without raising
+    integration_module._prefetch_bundle_files(bundle_paths)
+
+    if hasattr(os, "posix_fadvise"):
+        assert len(advised) == 5
+
+
+@pytest.mark.parametrize(
+    "season, valid",
+    [("2025-26", True), ("unknown", False), ("UNKNOWN", False), ("", False), ("17:30", False), ("2025-2026", False)],
+)
+def test_season_id_validation(season, valid):
+    assert bool(integration_module._VALID_SEASON_RE.match(season)) is valid
+
+
+def test_squad_hash_is_stable_and_key_order_independent():
+    squad = [
+        {"player_id": 1, "name": "Raya", "team": "ARS", "price": 5.5},
+        {"player_id": 2, "name": "Ødegaard", "team": "ARS", "price": 1e20},
+    ]
+    reordered = [
+        {"team": "ARS", "price": 5.5, "name": "Raya", "player_id": 1},
+        {"price": 1e20, "team": "ARS", "player_id": 2, "name": "Ødegaard"},
+    ]
+    canonical = (
+        '[{"name":"Raya","player_id":1,"price":5.5,"team":"ARS"},'
+        '{"name":"Ødegaard","player_id":2,"price":1e+20,"team":"ARS"}]'
+    )
+
+    digest = integration_module._squad_hash(squad)
+
+    assert digest == integration_module._squad_hash(reordered)
+    assert digest == hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+    assert digest != integration_module._squad_hash(squad[:1])
+
+
+def test_parse_iso_datetime_accepts_zulu_and_offset_suffixes():
+    expected = datetime(2026, 1, 1, 11, 0, tzinfo=timezone.utc)
+
+    assert integration_module._parse_iso_datetime("2026-01-01T11:00:00Z") == expected
+    assert integration_module._parse_iso_datetime("2026-01-01T11:00:00+00:00") == expected
+
+
+def test_decision_payload_keeps_field_order_and_legacy_defaults():
+    from types import SimpleNamespace
+
+    from cheddar_fpl_sage.analysis.enhanced_decision_framework import DecisionOutput
+
+    decision = DecisionOutput(primary_decision="ROLL", reasoning="Bank the transfer", risk_scenarios=[])
+    payload = integration_module._decision_payload(decision)
+
+    assert list(payload) == [key for key, _ in integration_module._DECISION_FIELDS]
+    assert payload["primary_decision"] == "ROLL"
+    assert payload["chip_guidance"] is None
+    assert "optimized_xi" not in payload
+
+    legacy = integration_module._decision_payload(
+        SimpleNamespace(primary_decision="HOLD", chip_guidance=SimpleNamespace(current_gw=20))
+    )
+    assert legacy["confidence_label"] == "MEDIUM"
+    assert legacy["strategy_mode"] == "BALANCED"
+    assert legacy["rank_bucket"] == "unknown"
+    assert legacy["chip_guidance"] == {"current_gw": 20}
+
+
+def test_captain_info_reads_captain_and_vice_in_one_pass():
+    integration = integration_module.FPLSageIntegration.__new__(integration_module.FPLSageIntegration)
+    bootstrap = {
+        "elements": [
+            {"id": 10, "web_name": "Salah", "team": 1, "element_type": 3},
+            {"id": 11, "web_name": "Haaland", "team": 2, "element_type": 4},
+        ],
+        "teams": [{"id": 1, "short_name": "LIV"}],
+    }
+    picks = {"picks": [{"element": 10, "is_vice_captain": True}, {"element": 11, "is_captain": True}]}
+
+    info = integration._get_captain_info_from_picks(picks, bootstrap)
+
+    assert info["captain"] == {"player_id": 11, "name": "Haaland", "team": "UNK", "position": "FWD"}
+    assert info["vice_captain"]["name"] == "Salah"
+    assert info["vice_captain"]["team"] == "LIV"
+    assert integration._get_captain_info_from_picks({"picks": []}, bootstrap) == {
+        "captain": None,
+        "vice_captain": None,
+    }
+
+
+def test_load_injury_payload_falls_back_on_missing_or_bad_json(tmp_path):
+    integration = integration_module.FPLSageIntegration.__new__(integration_module.FPLSageIntegration)
+    good = tmp_path / "injury_fpl.json"
+    good.write_text(json.dumps({"schema_version": "1.0.0", "reports": [{"player_id": 7}]}))
+    bad = tmp_path / "injury_secondary.json"
+    bad.write_text("{not json")
+    empty = {"schema_version": "1.0.0", "reports": []}
+
+    assert integration._load_injury_payload(good)["reports"] == [{"player_id": 7}]
+    assert integration._load_injury_payload(bad) == empty
+    assert integration._load_injury_payload(tmp_path / "missing.json") == empty
+    assert integration._load_injury_payload(None) == empty
+
+
+@pytest.mark.parametrize(
+    "status, chance, flag",
+    [("i", None, "OUT"), ("n", 100, "OUT"), ("d", 75, "DOUBT"), ("a", 25, "DOUBT"), ("a", None, "FIT"), (None, 50, "FIT")],
+)
+def test_parse_status_flag(status, chance, flag):
+    integration = integration_module.FPLSageIntegration.__new__(integration_module.FPLSageIntegration)
+
+    assert integration._parse_status_flag(status, chance) == flag
+
+
+def test_prepare_injury_artifacts_summarises_resolved_reports(tmp_path):
+    from types import SimpleNamespace
+
+    integration = integration_module.FPLSageIntegration.__new__(integration_module.FPLSageIntegration)
+    integration.config = {}
+    fpl_path = tmp_path / "injury_fpl.json"
+    fpl_path.write_text(json.dumps({
+        "schema_version": "1.0.0",
+        "reports": [
+            {"player_id": 1, "status": "OUT", "source": "PRIMARY_FPL", "asof_utc": datetime.now(timezone.utc).isoformat()},
+        ],
+    }))
+    bundle_paths = SimpleNamespace(injury_fpl=fpl_path, injury_secondary=tmp_path / "missing.json")
+    squad = {"current_squad": [{"player_id": 1}, {"player_id": "2"}, {"player_id": None}, {"player_id": "x"}]}
+
+    artifacts = integration._prepare_injury_artifacts(squad, bundle_paths, "run-1")
+
+    assert sorted(r["player_id"] for r in artifacts["resolved_reports"]) == [1, 2]
+    assert artifacts["summary"] == {"status_counts": {"OUT": 1, "UNKNOWN": 1}, "low_confidence": 1}
+    assert type(artifacts["summary"]["status_counts"]) is dict
@@ -0,0 +1,242 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Optional
+
+from pydantic import BaseModel
+
+from cheddar_fpl_sage.analysis.fpl_sage_integration import FPLSageIntegration
+
+
+def _projection(
+    player_id: int,
+    name: str,
+    team: str,
+    position: str,
+    next_gw: float,
+    price: float,
+    next6: Optional[float] = None,
+):
+    return SimpleNamespace(
+        player_id=player_id,
+        name=name,
+        team=team,
+        position=position,
+        nextGW_pts=next_gw,
+        next6_pts=next6 if next6 is not None else next_gw * 6,
+        current_price=price,
+    )
+
+
+def test_fixture_lookup_picks_earliest_upcoming_fixture_per_team() -> None:
+    integration = FPLSageIntegration(team_id=1, config_file="/tmp/nonexistent-team-config.json")
+    fixtures = [
+        {"id": 3010, "event": 31, "team_h": 1, "team_a": 3, "team_h_difficulty": 2, "team_a_difficulty": 4},
+        {"id": 2990, "event": 29, "team_h": 1, "team_a": 2, "team_h_difficulty": 5, "team_a_difficulty": 5},
+        {"id": 3002, "event": 30, "team_h": 4, "team_a": 1, "team_h_difficulty": None, "team_a_difficulty": 4},
+        {"id": 3001, "event": 30, "team_h": 2, "team_a": 3, "team_h_difficulty": 2, "team_a_difficulty": 3},
+        {"id": 3005, "event": None, "team_h": 2, "team_a": 4},
+        "not-a-fixture",
+    ]
+
+    lookup = integration._build_fixture_lookup(fixtures, current_gw=30)
+
+    assert sorted(lookup) == [1, 2, 3, 4]
+    assert lookup[1]["fixture"]["id"] == 3002
+    assert lookup[1]["is_home"] is False
+    assert lookup[1]["opponent"] == 4
+    assert lookup[1]["difficulty"] == 4
+    assert lookup[4]["difficulty"] == 3
+    assert lookup[3] == {
+        "event": 30,
+        "fixture": fixtures[3],
+        "is_home": False,
+        "difficulty": 3,
+        "opponent": 2,
+    }
+
+
+def test_safe_float_rejects_missing_malformed_and_non_finite_values() -> None:
+    integration = FPLSageIntegration(team_id=1, config_file="/tmp/nonexistent-team-config.json")
+
+    assert integration._safe_float("5.5") == 5.5
+    assert integration._safe_float(2.25) == 2.25
+    assert integration._safe_float(90) == 90.0
+    assert integration._safe_float(None) == 0.0
+    assert integration._safe_float("n/a", default=1.0) == 1.0
+    assert integration._safe_float("nan") == 0.0
+    assert integration._safe_float(float("inf"), default=-1.0) == -1.0
+
+
+def test_api_chip_overrides_map_every_chip_spelling() -> None:
+    integration = FPLSageIntegration(team_id=1, config_file="/tmp/nonexistent-team-config.json")
+
+    integration._apply_api_overrides(
+        {"available_chips": ["wildcard", "bench_boost", "Triple Captain", "free-hit", "unknown"]}
+    )
+
+    assert list(integration.config["manual_chip_status"]) == [
+        "Wildcard",
+        "Bench Boost",
+        "Triple Captain",
+        "Free Hit",
+    ]
+    assert integration.config["manual_chip_status"]["Free Hit"] == {"available": True, "played_by_entry": 0}
+
+
+def test_chip_status_map_passes_well_formed_input_through() -> None:
+    integration = FPLSageIntegration(team_id=1, config_file="/tmp/nonexistent-team-config.json")
+    well_formed = {"Wildcard": {"available": True}, "Free Hit": {"available": False}}
+
+    assert integration._normalize_chip_status_map(well_formed) is well_formed
+    assert integration._normalize_chip_status_map(
+        {"Wildcard": '{"available": true}', "Bench Boost": None, "Free Hit": "[1]"}
+    ) == {"Wildcard": {"available": True}, "Bench Boost": {}, "Free Hit": {}}
+    assert integration._normalize_chip_status_map("not json") == {}
+    assert integration._normalize_chip_status_map('[{"name": "wildcard"}]') == {}
+    assert integration._normalize_chip_status_map(None) == {}
+
+
+def test_api_injury_overrides_accept_models_and_dicts() -> None:
+    class _Override(BaseModel):
+        player_name: str
+        status: Optional[str] = None
+        chance: Optional[int] = None
+
+    integration = FPLSageIntegration(team_id=1, config_file="/tmp/nonexistent-team-config.json")
+
+    integration._apply_api_overrides(
+        {
+            "injury_overrides": [
+                _Override(player_name="Alpha", status="OUT", chance=0),
+                {"player": "Bravo", "chance": 75},
+                {"status": "OUT"},
+                "garbage",
+            ]
+        }
+    )
+
+    assert integration.config["manual_injury_overrides"] == {
+        "Alpha": {"status_flag": "OUT", "chance_of_playing_next_round": 0},
+        "Bravo": {"chance_of_playing_next_round": 75},
+    }
+
+
+def test_free_hit_plan_fills_xi_by_points_within_formation_and_team_limit() -> None:
+    integration = FPLSageIntegration(team_id=1, config_file="/tmp/nonexistent-team-config.json")
+    specs = [
+        (1, "GK", 5.0, "BOU"), (2, "GK", 3.0, "BRE"),
+        (3, "DEF", 6.0, "CHE"), (4, "DEF", 5.0, "CRY"), (5, "DEF", 4.0, "EVE"), (6, "DEF", 3.0, "FUL"),
+        (7, "DEF", 2.0, "LEE"),
+        (8, "MID", 9.0, "ARS"), (9, "MID", 8.0, "ARS"), (10, "MID", 7.0, "ARS"), (11, "MID", 6.0, "ARS"),
+        (12, "MID", 5.0, "LIV"),
+        (13, "FWD", 10.0, "MCI"), (14, "FWD", 4.0, "NEW"), (15, "FWD", 1.0, "WHU"),
+    ]
+    projections = SimpleNamespace(
+        projections=[_projection(pid, f"P{pid}", team, pos, pts, 5.0) for pid, pos, pts, team in specs]
+    )
+    squad = [{"player_id": pid, "position": pos, "team": team, "current_price": 5.0} for pid, pos, _, team in specs]
+    team_data = {"current_squad": squad, "team_info": {"bank_value": 0.0, "team_value": 75.0}}
+
+    plan = integration._build_free_hit_plan(team_data, projections)
+
+    assert plan["starting_xi"] == [1, 3, 4, 5, 8, 9, 10, 13, 12, 14, 6]
+    assert plan["bench_order"] == [11, 2, 7, 15]
+    assert plan["captain_id"] == 1
+    assert plan["constraints_check"] == {"budget_ok": True, "formation_ok": True, "team_limit_ok": True}
+
+
+def test_free_hit_plan_builds_greedy_squad_within_budget_position_and_team_limits() -> None:
+    integration = FPLSageIntegration(team_id=1, config_file="/tmp/nonexistent-team-config.json")
+    specs = [
+        (1, "GK", 5.0, "BOU", 5.0), (2, "GK", 4.0, "BRE", 5.0), (3, "GK", 3.0, "BHA", 5.0),
+        (4, "DEF", 6.0, "CHE", 5.0), (5, "DEF", 5.0, "CRY", 5.0), (6, "DEF", 4.0, "EVE", 5.0),
+        (7, "DEF", 3.0, "FUL", 5.0), (8, "DEF", 2.0, "LEE", 5.0), (9, "DEF", 1.0, "LEE", 5.0),
+        (10, "MID", 10.0, "ARS", 5.0), (11, "MID", 10.0, "ARS", 5.0), (12, "MID", 10.0, "ARS", 5.0),
+        (13, "MID", 9.5, "ARS", 5.0), (14, "MID", 8.0, "LIV", 5.0), (15, "MID", 7.0, "AVL", 5.0),
+        (16, "MID", 6.0, "TOT", 5.0),
+        (17, "FWD", 12.0, "MCI", 80.0), (18, "FWD", 7.0, "NEW", 5.0), (19, "FWD", 6.0, "WHU", 5.0),
+        (20, "FWD", 5.0, "WOL", 5.0), (21, "FWD", 4.0, "SUN", 5.0),
+    ]
+    projections = SimpleNamespace(
+        projections=[_projection(pid, f"P{pid}", team, pos, pts, price) for pid, pos, pts, team, price in specs]
+    )
+    team_data = {"current_squad": [], "team_info": {"bank_value": 0.0, "team_value": 75.0}}
+
+    plan = integration._build_free_hit_plan(team_data, projections)
+
+    squad_ids = {p["player_id"] for p in plan["squad"]}
+    assert len(squad_ids) == 15
+    # 4th Arsenal player, the unaffordable forward and overflow at full positions are skipped
+    assert {3, 9, 13, 16, 17, 21}.isdisjoint(squad_ids)
+    assert plan["constraints_check"]["budget_ok"] is True
+
+
+def test_post_free_hit_plan_sells_weakest_bench_player_for_best_affordable_upgrade() -> None:
+    integration = FPLSageIntegration(team_id=1, config_file="/tmp/nonexistent-team-config.json")
+    projections = SimpleNamespace(
+        projections=[
+            _projection(1, "Starter", "ARS", "MID", 8.0, 8.0),
+            _projection(2, "Bench A", "BOU", "DEF", 1.0, 4.5, next6=6.0),
+            _projection(3, "Bench B", "BRE", "DEF", 1.0, 4.0, next6=6.0),
+            _projection(10, "Pricey", "LIV", "MID", 9.0, 9.0, next6=60.0),
+            _projection(11, "Upgrade", "CHE", "DEF", 5.0, 5.0, next6=30.0),
+            _projection(12, "Upgrade Twin", "NEW", "DEF", 5.0, 5.0, next6=30.0),
+        ]
+    )
+    squad = [
+        {"player_id": 1, "is_starter": True, "current_price": 8.0},
+        {"player_id": 2, "is_starter": False, "current_price": 4.5},
+        {"player_id": 3, "is_starter": False, "current_price": 4.0},
+        {"player_id": 99, "is_starter": False, "current_price": 4.0},
+    ]
+    team_data = {"current_squad": squad, "team_info": {"bank_value": 1.0, "free_transfers": 2}}
+
+    plan = integration._build_post_free_hit_plan(team_data, projections)
+
+    assert plan["ft_available"] == 2
+    upgrade = plan["plans"][1]
+    # Unprojected player 99 scores 0 and is sold first; the first of tied upgrades is bought
+    assert upgrade["transfers_out"] == [99]
+    assert upgrade["transfers_in"] == [11]
+    assert upgrade["projected_gain_horizon"] == 30.0
+
+
+def test_capability_matrix_parses_string_analysis_timestamps() -> None:
+    integration = FPLSageIntegration(team_id=1, config_file="/tmp/nonexistent-team-config.json")
+    meta = {"team_picks_confidence": "HIGH"}
+    recent = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    old = (datetime.now(timezone.utc) - timedelta(hours=3)).isoformat()
+
+    def freshness(**extra):
+        return integration._compute_capability_matrix({"collection_meta": meta, **extra})["analysis_freshness"]
+
+    assert freshness() == "FRESH"
+    assert freshness(analysis_timestamp=recent) == "FRESH"
+    assert freshness(analysis_timestamp=old) == "STALE"
+    assert freshness(analysis_timestamp="not a timestamp") == "UNKNOWN"
+    assert freshness(analysis_timestamp="2026-01-01T11:00:00") == "UNKNOWN"  # naive
+
+
+def test_capability_matrix_grades_collection_meta_timestamps() -> None:
+    integration = FPLSageIntegration(team_id=1, config_file="/tmp/nonexistent-team-config.json")
+    now = datetime.now(timezone.utc)
+    meta = {
+        "collection_time": (now - timedelta(minutes=5)).isoformat(),
+        "analysis_timestamp": (now - timedelta(hours=2)).isoformat(),
+        "team_picks_confidence": "HIGH",
+        "team_picks_provenance": "api",
+    }
+
+    matrix = integration._compute_capability_matrix({"collection_meta": meta})
+
+    assert matrix == {
+        "raw_data_freshness": "FRESH",
+        "model_inputs_freshness": "STALE",
+        "analysis_freshness": "FRESH",
+        "team_picks_confidence": "HIGH",
+        "team_picks_provenance": "api",
+    }
+    assert integration._compute_capability_matrix({"collection_meta": {"collection_time": "garbage", "x": 1}})[
+        "raw_data_freshness"
+    ] == "UNKNOWN"
+    assert set(integration._compute_capability_matrix({}).values()) == {"UNKNOWN"}
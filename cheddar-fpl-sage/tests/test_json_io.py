@@ -0,0 +1,245 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from cheddar_fpl_sage.rules.fpl_rules import Ruleset
+from cheddar_fpl_sage.utils import output_manager
+from cheddar_fpl_sage.utils.output_manager import (
+    AtomicWriteBatch,
+    dump_json_bytes,
+    load_json_file,
+    write_json_atomic,
+    write_text_atomic,
+)
+
+
+def _ruleset():
+    return Ruleset(
+        season_id="2025-26",
+        version="1.0.0",
+        chip_policy={"chip_windows": []},
+        scoring_policy={},
+        transfer_policy={},
+        constraints={},
+        source="config/rulesets/2025-26.json",
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_json_file_round_trips_atomic_writes(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(output_manager, "orjson", None)
+    path = tmp_path / "collection_meta.json"
+    payload = {"season": "2025-26", "target_gw": 20, "teams": ["ARS", "Nottm Forest"], "bank": 0.5}
+
+    write_json_atomic(path, payload)
+
+    assert load_json_file(path) == payload
+
+
+def test_load_json_file_raises_value_error_on_bad_json(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text("{not json")
+
+    with pytest.raises(ValueError):
+        load_json_file(path)
+
+
+def test_write_json_atomic_serializes_dataclasses(tmp_path):
+    ruleset = _ruleset()
+    path = tmp_path / "model_inputs.json"
+
+    write_json_atomic(path, {"ruleset": ruleset, "generated_at": tmp_path})
+
+    loaded = load_json_file(path)
+    assert loaded["ruleset"] == ruleset.__dict__
+    assert loaded["generated_at"] == str(tmp_path)
+
+
+def test_dump_json_bytes_matches_stdlib_encoding():
+    payload = {
+        "timestamp": datetime(2026, 1, 1, 11, 0, tzinfo=timezone.utc),
+        "ruleset": _ruleset(),
+        "by_gw": {20: ["ARS"], 21: []},
+        "capability_matrix": {"raw_data_freshness": "FRESH", "team_picks_confidence": "HIGH"},
+    }
+
+    encoded = dump_json_bytes(payload)
+
+    assert json.loads(encoded) == json.loads(
+        json.dumps(payload, default=output_manager._json_default)
+    )
+    assert json.loads(encoded)["timestamp"] == "2026-01-01 11:00:00+00:00"
+    assert encoded.startswith(b'{\n  "timestamp"')
+
+
+def test_write_json_atomic_writes_the_same_json_with_and_without_orjson(tmp_path, monkeypatch):
+    from cheddar_fpl_sage.analysis.enhanced_decision_framework import RiskLevel, RiskScenario
+
+    payload = {
+        "risk_scenarios": [RiskScenario("Captain blanks", (4, 10), RiskLevel.ACCEPTABLE, 0.25)],
+        "name": "Ødegaard",
+        "bank": 0.5,
+        "by_gw": {20: None},
+        "xg_per_90": [float("nan"), float("inf"), -float("inf")],
+        "ceiling": 1e20,
+        "unpriced": RiskScenario("Keeper injured", (2, 6), RiskLevel.ACCEPTABLE, float("nan")),
+    }
+    fast_path = tmp_path / "fast.json"
+    write_json_atomic(fast_path, payload)
+    monkeypatch.setattr(output_manager, "orjson", None)
+    stdlib_path = tmp_path / "stdlib.json"
+    write_json_atomic(stdlib_path, payload)
+
+    # Same JSON, not the same bytes: orjson spells the exponent 1e20, stdlib 1e+20
+    assert load_json_file(fast_path) == load_json_file(stdlib_path)
+    assert load_json_file(stdlib_path)["xg_per_90"] == [None, None, None]
+    assert load_json_file(stdlib_path)["unpriced"]["probability_estimate"] is None
+    assert load_json_file(stdlib_path)["risk_scenarios"] == [
+        {
+            "condition": "Captain blanks",
+            "expected_loss_range": [4, 10],
+            "risk_level": "acceptable",
+            "probability_estimate": 0.25,
+            "mitigation_action": None,
+        }
+    ]
+
+
+def test_atomic_write_batch_publishes_all_artifacts_on_flush(tmp_path):
+    decision_path = tmp_path / "processed_data" / "analysis" / "decision.json"
+    report_path = tmp_path / "processed_data" / "reports" / "summary.md"
+    payload = {"run_id": "run-1", "gameweek": 20}
+
+    with AtomicWriteBatch() as batch:
+        batch.add_json(decision_path, payload)
+        payload["gameweek"] = 21  # encoded at add time
+        batch.add_text(report_path, "# Summary\n")
+        assert not decision_path.exists()
+
+    assert load_json_file(decision_path) == {"run_id": "run-1", "gameweek": 20}
+    assert report_path.read_text() == "# Summary\n"
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_atomic_write_batch_leaves_existing_artifacts_when_a_write_fails(tmp_path):
+    decision_path = tmp_path / "decision.json"
+    write_json_atomic(decision_path, {"run_id": "old"})
+    blocked = tmp_path / "not_a_dir"
+    blocked.write_text("")
+
+    batch = AtomicWriteBatch()
+    batch.add_json(decision_path, {"run_id": "new"})
+    batch.add_text(blocked / "summary.md", "unreachable")
+    with pytest.raises(OSError):
+        batch.flush()
+
+    assert load_json_file(decision_path) == {"run_id": "old"}
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_atomic_write_batch_discards_pending_writes_when_block_raises(tmp_path):
+    path = tmp_path / "decision.json"
+
+    with pytest.raises(RuntimeError):
+        with AtomicWriteBatch() as batch:
+            batch.add_json(path, {"run_id": "run-1"})
+            raise RuntimeError("analysis failed")
+
+    assert not path.exists()
+
+
+def test_atomic_write_batch_mirrors_reuse_source_bytes(tmp_path, monkeypatch):
+    report_path = tmp_path / "runs" / "summary.md"
+    mirror_path = tmp_path / "processed_data" / "fpl_summary.md"
+    mirror_path.parent.mkdir()
+    mirror_path.write_text("stale")
+
+    with AtomicWriteBatch() as batch:
+        batch.add_text(report_path, "# Summary\n")
+        batch.add_mirror(mirror_path, report_path)
+
+    assert mirror_path.read_bytes() == report_path.read_bytes()
+    assert not list(tmp_path.rglob("*.tmp"))
+
+    def _no_link(*_args):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(output_manager.os, "link", _no_link)
+    with AtomicWriteBatch() as batch:
+        batch.add_text(report_path, "# Updated\n")
+        batch.add_mirror(mirror_path, report_path)
+
+    assert mirror_path.read_text() == "# Updated\n"
+
+
+def test_atomic_write_batch_rejects_mirror_of_unstaged_artifact(tmp_path):
+    batch = AtomicWriteBatch()
+
+    with pytest.raises(KeyError):
+        batch.add_mirror(tmp_path / "mirror.json", tmp_path / "missing.json")
+
+
+def test_atomic_write_batch_skips_injury_artifact_when_only_run_stamp_changed(tmp_path, monkeypatch):
+    from cheddar_fpl_sage.injury.processing import (
+        INJURY_ARTIFACT_VOLATILE_KEYS,
+        build_injury_artifact_payload,
+        build_manual_injury_reports,
+    )
+
+    squad = [{"name": "Ødegaard", "player_id": 7}]
+    overrides = {"Ødegaard": {"status": "DOUBTFUL", "chance": 50}}
+    asof = "2025-12-29T10:00:00+00:00"
+
+    def manual_payload(run_id, overrides=overrides):
+        reports = build_manual_injury_reports(overrides, squad, asof)
+        return build_injury_artifact_payload(reports, run_id=run_id, label="manual_overrides")
+
+    manual_path = tmp_path / "injury_manual.json"
+    write_json_atomic(manual_path, manual_payload("run-1"))
+    rebuilt = manual_payload("run-2")
+    assert dump_json_bytes(rebuilt) != manual_path.read_bytes()
+
+    written = []
+    real_write = output_manager._write_tmp_durably
+    monkeypatch.setattr(
+        output_manager,
+        "_write_tmp_durably",
+        lambda path, data: written.append(path) or real_write(path, data),
+    )
+
+    with AtomicWriteBatch() as batch:
+        batch.add_json(manual_path, rebuilt, ignore_keys=INJURY_ARTIFACT_VOLATILE_KEYS)
+    assert written == []
+    assert load_json_file(manual_path)["run_id"] == "run-1"
+
+    changed = manual_payload("run-3", overrides={"Ødegaard": {"status": "OUT"}})
+    with AtomicWriteBatch() as batch:
+        batch.add_json(manual_path, changed, ignore_keys=INJURY_ARTIFACT_VOLATILE_KEYS)
+    assert written == [manual_path]
+    assert load_json_file(manual_path)["reports"][0]["status"] == "OUT"
+
+
+def test_write_text_atomic_writes_utf8_bytes(tmp_path):
+    path = tmp_path / "reports" / "summary.md"
+
+    write_text_atomic(path, "⚡ Ødegaard (C)\n")
+
+    assert path.read_bytes() == "⚡ Ødegaard (C)\n".encode("utf-8")
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_concurrent_data_summary_updates_keep_every_run(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    manager = output_manager.OutputBundleManager(base_dir=tmp_path / "outputs")
+    run_ids = [f"run-{i}" for i in range(16)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(
+            lambda run_id: manager.update_data_summary(manager.paths_for_run(run_id, team_id=1), "2025-26", 20),
+            run_ids,
+        ))
+
+    assert sorted(row["run_id"] for row in load_json_file(manager.summary_file)) == sorted(run_ids)
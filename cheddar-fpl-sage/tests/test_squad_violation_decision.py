@@ -0,0 +1,220 @@
+import datetime
+
+from cheddar_fpl_sage.analysis.enhanced_decision_framework import EnhancedDecisionFramework
+from cheddar_fpl_sage.models.canonical_projections import CanonicalPlayerProjection, CanonicalProjectionSet
+from cheddar_fpl_sage.models.injury_report import InjuryReport, InjuryStatus
+
+
+def _proj(pid, pos, pts, team="T", price=5.0, xmins=90, tags=None):
+    return CanonicalPlayerProjection(
+        player_id=pid,
+        name=f"Player {pid}",
+        position=pos,
+        team=team,
+        current_price=price,
+        nextGW_pts=pts,
+        next6_pts=pts * 5,
+        xMins_next=xmins,
+        volatility_score=0.2,
+        ceiling=pts * 2,
+        floor=max(0, pts * 0.5),
+        tags=tags or [],
+        confidence=0.5,
+        ownership_pct=10.0,
+    )
+
+
+def _violation_fixture():
+    """Four Arsenal players in a 15-man squad plus a pool of replacements."""
+    squad_specs = [
+        (1, "GK", 6, "ARS"),
+        (2, "GK", 3, "CHE"),
+        (3, "DEF", 5, "ARS"),
+        (4, "DEF", 5, "LIV"),
+        (5, "DEF", 4, "MCI"),
+        (6, "DEF", 4, "NEW"),
+        (7, "DEF", 2, "ARS"),
+        (8, "MID", 8, "ARS"),
+        (9, "MID", 7, "TOT"),
+        (10, "MID", 6, "AVL"),
+        (11, "MID", 5, "BHA"),
+        (12, "MID", 2, "FUL"),
+        (13, "FWD", 7, "BRE"),
+        (14, "FWD", 6, "WHU"),
+        (15, "FWD", 1, "EVE"),
+    ]
+    squad_projections = [_proj(pid, pos, pts, team) for pid, pos, pts, team in squad_specs]
+    pool = [
+        _proj(101, "DEF", 6.5, "BOU", price=4.5),
+        _proj(102, "DEF", 5.5, "CRY", price=4.0),
+        _proj(103, "DEF", 9.0, "NFO", price=9.0),  # unaffordable
+        _proj(104, "DEF", 8.0, "WOL", price=4.0, xmins=30),  # not a likely starter
+    ]
+    projection_set = CanonicalProjectionSet(
+        projections=squad_projections + pool,
+        gameweek=20,
+        created_timestamp=datetime.datetime.now().isoformat(),
+        confidence_level="medium",
+    )
+    bench_ids = {2, 7, 12, 15}
+    squad = []
+    for index, proj in enumerate(squad_projections, start=1):
+        squad.append({
+            "player_id": proj.player_id,
+            "name": proj.name,
+            "position": proj.position,
+            "team": proj.team,
+            "current_price": 4.0 if proj.player_id == 7 else proj.current_price,
+            "is_starter": proj.player_id not in bench_ids,
+            "playing_position": 12 + sorted(bench_ids).index(proj.player_id) if proj.player_id in bench_ids else index,
+            "status_flag": "OUT" if proj.player_id in {12, 15} else "FIT",
+        })
+    team_data = {
+        "current_squad": squad,
+        "team_info": {"bank": 0.5, "free_transfers": 1},
+    }
+    return team_data, projection_set
+
+
+def test_squad_violation_produces_urgent_transfer_pair():
+    team_data, projection_set = _violation_fixture()
+    framework = EnhancedDecisionFramework()
+
+    violations = framework._validate_squad_composition(team_data)
+    assert len(violations) == 1
+    assert violations[0]["team"] == "ARS"
+
+    decision = framework._create_squad_violation_decision(violations, team_data, projection_set, {})
+
+    assert decision.primary_decision == "URGENT_TRANSFER"
+    assert decision.decision_status == "URGENT"
+    out_rec, in_rec = decision.transfer_recommendations
+    # Cheapest benched Arsenal player is prioritised for removal.
+    assert out_rec["action"] == "OUT"
+    assert out_rec["player_name"] == "Player 7"
+    assert in_rec["action"] == "IN"
+    assert in_rec["player_name"] == "Player 101"
+    # Captaincy is still attached on the urgent path once the XI is optimized.
+    assert decision.optimized_xi is not None
+    assert decision.captaincy["captain"]["name"] == "Player 8"
+
+
+def test_squad_violation_post_transfer_state_counts_bench_out():
+    team_data, projection_set = _violation_fixture()
+    framework = EnhancedDecisionFramework()
+    violations = framework._validate_squad_composition(team_data)
+
+    decision = framework._create_squad_violation_decision(violations, team_data, projection_set, {})
+
+    assert decision.post_transfer_state == {
+        "squad_rule_compliance": "ARS count = 3 (ok)",
+        "bench_out_count": "Bench OUT = 2",
+    }
+    assert decision.additional_transfer_recommendations == []
+
+
+def test_replacement_search_excludes_owned_unaffordable_and_non_starters():
+    team_data, projection_set = _violation_fixture()
+    framework = EnhancedDecisionFramework()
+    player_to_replace = {"position": "DEF", "price": 4.0}
+
+    candidates = framework._find_replacement_players(projection_set, player_to_replace, team_data)
+
+    assert [c["name"] for c in candidates] == ["Player 101", "Player 102"]
+
+
+def test_squad_violation_prioritises_injured_player_from_reports():
+    team_data, projection_set = _violation_fixture()
+    framework = EnhancedDecisionFramework()
+    violations = framework._validate_squad_composition(team_data)
+    injury_reports = {8: InjuryReport(player_id=8, status=InjuryStatus.OUT)}
+
+    decision = framework._create_squad_violation_decision(violations, team_data, projection_set, injury_reports)
+
+    out_rec = decision.transfer_recommendations[0]
+    assert out_rec["player_name"] == "Player 8"
+    assert out_rec["injury_status"] == "OUT"
+    assert out_rec["expected_points"] == 0.0
+
+
+def test_squad_violation_tolerates_missing_injury_reports():
+    team_data, projection_set = _violation_fixture()
+    framework = EnhancedDecisionFramework()
+    violations = framework._validate_squad_composition(team_data)
+
+    decision = framework._create_squad_violation_decision(violations, team_data, projection_set, None)
+
+    assert decision.transfer_recommendations[0]["player_name"] == "Player 7"
+
+
+def test_replacement_search_is_memoized_per_projection_set():
+    team_data, projection_set = _violation_fixture()
+    framework = EnhancedDecisionFramework()
+    player_to_replace = {"position": "DEF", "price": 4.0}
+
+    first = framework._find_replacement_players(projection_set, player_to_replace, team_data)
+    projection_set.projections.append(_proj(105, "DEF", 7.0, "LEE", price=4.0))
+    cached = framework._find_replacement_players(projection_set, player_to_replace, team_data)
+    assert [c["name"] for c in cached] == [c["name"] for c in first]
+
+    _, fresh_set = _violation_fixture()
+    fresh_set.projections.append(_proj(105, "DEF", 7.0, "LEE", price=4.0))
+    refreshed = framework._find_replacement_players(fresh_set, player_to_replace, team_data)
+    assert refreshed[0]["name"] == "Player 105"
+
+
+def test_transfer_out_scoring_weights_injury_bench_and_price():
+    framework = EnhancedDecisionFramework()
+    players = [
+        {"player_id": 1, "name": "Starter", "current_price": 6.0, "playing_position": 3},
+        {"player_id": 2, "name": "Bench", "current_price": 4.5, "playing_position": 13},
+        {"player_id": 3, "name": "Injured Bench", "current_price": 5.0, "playing_position": 14},
+    ]
+
+    scored = framework._score_transfer_out_candidates(players, injury_out_ids={3})
+
+    assert [c["priority_score"] for c in scored] == [14.0, 65.5, 165.0]
+    assert [c["reasons"] for c in scored] == [[], ["benched"], ["INJURED (OUT)", "benched"]]
+
+
+def test_replacement_budget_compares_in_price_tenths():
+    team_data, projection_set = _violation_fixture()
+    team_data["team_info"]["bank"] = 0.1
+    projection_set.projections.append(_proj(106, "FWD", 6.0, "SOU", price=4.7))
+    framework = EnhancedDecisionFramework()
+
+    candidates = framework._find_replacement_players(projection_set, {"position": "FWD", "price": 4.6}, team_data)
+
+    assert [c["name"] for c in candidates] == ["Player 106"]
+
+
+def test_spare_free_transfers_exclude_squad_fix_players(monkeypatch):
+    team_data, projection_set = _violation_fixture()
+    team_data["team_info"]["free_transfers"] = 3
+    framework = EnhancedDecisionFramework()
+    violations = framework._validate_squad_composition(team_data)
+    monkeypatch.setattr(
+        framework,
+        "_recommend_transfers",
+        lambda *_args, **_kwargs: [
+            {"player_name": "Player 7"},
+            {"player_name": "Player 15"},
+            {"player_name": "Player 101"},
+            {"player_name": "Player 12"},
+            {"player_name": "Player 14"},
+        ],
+    )
+
+    decision = framework._create_squad_violation_decision(violations, team_data, projection_set, {})
+
+    assert [t["player_name"] for t in decision.additional_transfer_recommendations] == ["Player 15", "Player 12"]
+
+
+def test_top_by_points_matches_full_sort_including_ties():
+    _, projection_set = _violation_fixture()
+
+    top = projection_set.top_by_points(8)
+
+    expected = sorted(projection_set.projections, key=lambda p: p.nextGW_pts, reverse=True)[:8]
+    assert [p.player_id for p in top] == [p.player_id for p in expected]
+    assert [p.player_id for p in top][-2:] == [1, 10]  # 6-point tie keeps projection order
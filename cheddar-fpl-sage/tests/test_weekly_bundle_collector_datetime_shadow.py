@@ -109,3 +109,45 @@ def test_collect_weekly_bundle_handles_deadline_time_formatted_without_datetime_
     collection_meta = json.loads(paths.collection_meta.read_text())
     assert isinstance(collection_meta.get("collected_at"), str)
     assert collection_meta["collected_at"]
+
+
+def test_collect_weekly_bundle_reuses_caller_session(monkeypatch, tmp_path):
+    payloads = {
+        "bootstrap": {"teams": [], "elements": []},
+        "fixtures": [],
+        "events": [{"id": 30, "is_current": True, "deadline_time": "2025-03-14T11:00:00Z"}],
+    }
+    real_manager = weekly_bundle_collector.OutputBundleManager
+    monkeypatch.setattr(
+        weekly_bundle_collector,
+        "OutputBundleManager",
+        lambda: real_manager(base_dir=tmp_path / "outputs"),
+    )
+
+    def _no_new_session(*_args, **_kwargs):
+        raise AssertionError("collector should reuse the caller's session")
+
+    monkeypatch.setattr(weekly_bundle_collector.aiohttp, "ClientSession", _no_new_session)
+    monkeypatch.setattr(
+        weekly_bundle_collector,
+        "load_secondary_injury_payload",
+        lambda fallback_path=None: {"reports": []},
+    )
+    monkeypatch.setattr(weekly_bundle_collector, "build_fpl_injury_reports", lambda elements: [])
+    monkeypatch.setattr(
+        weekly_bundle_collector,
+        "build_injury_artifact_payload",
+        lambda reports, run_id, label: {"run_id": run_id, "label": label, "reports": reports},
+    )
+
+    paths = asyncio.run(
+        weekly_bundle_collector.collect_weekly_bundle(
+            team_id=None,
+            target_gw=30,
+            force_refresh=True,
+            run_id="shared-session-test",
+            session=_FakeClientSession(payloads),
+        )
+    )
+
+    assert json.loads(paths.events.read_text())
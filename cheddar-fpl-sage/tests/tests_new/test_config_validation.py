@@ -259,3 +259,50 @@ class TestConfigManagerIntegration:
         manager = Sprint35ConfigManager(config_file=str(config_file))
         config = manager.get_config()
         assert config["manager_id"] == 888
+
+    def test_parsed_config_shared_across_managers(self, temp_config_dir, monkeypatch):
+        """Unchanged config file is parsed once; each manager gets its own copy."""
+        config_file = temp_config_dir / "team_config.json"
+        config_file.write_text(json.dumps({
+            "manager_id": 321,
+            "manual_chip_status": {"Wildcard": {"available": True, "played_gw": None}},
+        }))
+
+        first = Sprint35ConfigManager(config_file=config_file).get_config()
+        first["manual_chip_status"]["Wildcard"]["available"] = False
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("config should come from the shared cache")
+
+        monkeypatch.setattr(TeamConfig, "model_validate", _fail)
+        second = Sprint35ConfigManager(config_file=config_file).get_config()
+
+        assert second["manager_id"] == 321
+        assert second["manual_chip_status"]["Wildcard"]["available"] is True
+
+    def test_saved_config_is_reread(self, temp_config_dir):
+        """Writes through the manager are visible to fresh managers."""
+        config_file = temp_config_dir / "team_config.json"
+        config_file.write_text(json.dumps({"manager_id": 1}))
+        manager = Sprint35ConfigManager(config_file=config_file)
+        assert manager.get_config()["manager_id"] == 1
+
+        manager.update_manual_free_transfers(3)
+
+        assert Sprint35ConfigManager(config_file=config_file).get_config()["manual_free_transfers"] == 3
+
+    def test_identical_rewrite_skips_validation(self, temp_config_dir, monkeypatch):
+        """Rewriting a config with unchanged content reuses the validated dict."""
+        config_file = temp_config_dir / "team_config.json"
+        content = json.dumps({"manager_id": 654, "manager_name": "Same Content"})
+        config_file.write_text(content)
+        assert Sprint35ConfigManager(config_file=config_file).get_config()["manager_id"] == 654
+
+        config_file.unlink()
+        config_file.write_text(content)
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("unchanged content should not be re-validated")
+
+        monkeypatch.setattr(TeamConfig, "model_validate", _fail)
+        assert Sprint35ConfigManager(config_file=config_file).get_config()["manager_name"] == "Same Content"
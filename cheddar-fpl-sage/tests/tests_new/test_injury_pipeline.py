@@ -1,7 +1,13 @@
 from datetime import datetime, timedelta, timezone
 
 from cheddar_fpl_sage.injury.processing import build_manual_injury_reports, resolve_injury_payloads
-from cheddar_fpl_sage.models.injury_report import MANUAL_EXPIRY_HOURS
+from cheddar_fpl_sage.models.injury_report import (
+    MANUAL_EXPIRY_HOURS,
+    InjuryConfidence,
+    InjuryReport,
+    InjurySource,
+    InjuryStatus,
+)
 
 
 def _build_primary_payload(player_id: int, status: str, chance: int) -> dict:
@@ -78,3 +84,19 @@ def test_manual_reports_resolve_with_multiple_players():
 
     assert resolved[0]["status"] == "OUT"
     assert resolved[1]["status"] == "DOUBTFUL"
+
+
+def test_injury_report_from_dict_parses_enum_names_case_insensitively():
+    report = InjuryReport.from_dict(
+        {"player_id": "7", "status_flag": " out ", "source": "secondary_feed", "confidence": "med", "chance": 25}
+    )
+
+    assert report.player_id == 7
+    assert report.status is InjuryStatus.OUT
+    assert report.source is InjurySource.SECONDARY_FEED
+    assert report.confidence is InjuryConfidence.MED
+
+    fallback = InjuryReport.from_dict({"status": "MAYBE", "source": 3, "confidence": "unsure"})
+    assert fallback.status is InjuryStatus.UNKNOWN
+    assert fallback.source is InjurySource.UNKNOWN
+    assert fallback.confidence is InjuryConfidence.HIGH
@@ -2,6 +2,8 @@ import asyncio
 from pathlib import Path
 from datetime import datetime, timezone
 
+import pytest
+
 from cheddar_fpl_sage.collectors.weekly_bundle_collector import BundlePaths
 from cheddar_fpl_sage.analysis.fpl_sage_integration import FPLSageIntegration
 from cheddar_fpl_sage.validation.data_gate import GateResult
@@ -29,13 +31,8 @@ def _make_bundle(tmp_path: Path, target_gw: int = 1) -> BundlePaths:
     )
 
 
-def test_orchestrator_smoke_pass(monkeypatch, tmp_path):
-    target_gw = 1
-    bundle = _make_bundle(tmp_path, target_gw)
+def _write_bundle(bundle: BundlePaths, target_gw: int) -> None:
     now = datetime.now(timezone.utc).isoformat()
-    monkeypatch.chdir(tmp_path)
-
-    # Write bundle artifacts
     teams = [{"id": 1, "short_name": "AAA"}, {"id": 2, "short_name": "BBB"}]
     elements = []
     # 15 players
@@ -72,8 +69,15 @@ def test_orchestrator_smoke_pass(monkeypatch, tmp_path):
         picks.append({"element": pid, "position": pos, "is_captain": pid == 1, "is_vice_captain": pid == 2})
     write_json_atomic(bundle.team_picks, {"picks": picks, "entry_history": {"bank": 0, "value": 1000}, "entry": 123})
 
+
+def test_orchestrator_smoke_pass(monkeypatch, tmp_path):
+    target_gw = 1
+    bundle = _make_bundle(tmp_path, target_gw)
+    monkeypatch.chdir(tmp_path)
+    _write_bundle(bundle, target_gw)
+
     # Monkeypatch bundle collector to avoid network
-    async def fake_collect(team_id, target_gw, force_refresh=False, run_id=None):
+    async def fake_collect(team_id, target_gw, force_refresh=False, run_id=None, session=None):
         return bundle
     run_globals = FPLSageIntegration.run_full_analysis.__globals__
     monkeypatch.setitem(run_globals, "collect_weekly_bundle", fake_collect)
@@ -99,3 +103,33 @@ def test_orchestrator_smoke_pass(monkeypatch, tmp_path):
     assert results["analysis"]["decision"].decision_status in {"PASS", "HOLD", "URGENT"}  # should not crash
     # Ensure outputs landed in temp outputs dir
     assert (tmp_path / "outputs" / "LATEST.json").exists()
+
+
+def test_stale_refresh_rejects_unknown_season(monkeypatch, tmp_path):
+    target_gw = 1
+    bundle = _make_bundle(tmp_path, target_gw)
+    monkeypatch.chdir(tmp_path)
+    _write_bundle(bundle, target_gw)
+    collections = []
+
+    async def fake_collect(team_id, target_gw, force_refresh=False, run_id=None, session=None):
+        if collections:
+            # The refreshed bundle lost its season
+            meta = {"collected_at": datetime.now(timezone.utc).isoformat(), "target_gw": target_gw, "season": "unknown"}
+            write_json_atomic(bundle.collection_meta, meta)
+        collections.append(run_id)
+        return bundle
+    run_globals = FPLSageIntegration.run_full_analysis.__globals__
+    monkeypatch.setitem(run_globals, "collect_weekly_bundle", fake_collect)
+    gate_results = iter([GateResult(status="HOLD", block_reason="STALE_COLLECTION"), GateResult(status="PASS")])
+    monkeypatch.setitem(
+        run_globals,
+        "validate_bundle",
+        lambda bp, tid, gw, freshness_max_minutes: next(gate_results),
+    )
+    monkeypatch.setattr(FPLSageIntegration, "_load_config", lambda self: {"team_id": 123, "chip_policy": {}})
+
+    integration = FPLSageIntegration(team_id=123)
+    with pytest.raises(ValueError, match="Season resolution failed"):
+        asyncio.run(integration.run_full_analysis(save_data=False))
+    assert len(collections) == 2